@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Restaurant_kitchen_service.settings')
+# Tells the settings they are loaded by an ASGI server (see settings/prod.py).
+os.environ['DJANGO_ASGI'] = 'true'
 
 application = get_asgi_application()
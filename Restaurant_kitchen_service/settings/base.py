@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 import environ
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -50,17 +51,29 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "kitchen_core.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "kitchen_core.middleware.ReplicaMiddleware",
 ]
 
+# Per-view query count and latency metrics (Server-Timing header, /metrics)
+QUERY_METRICS = env.bool("QUERY_METRICS", default=False)
+if QUERY_METRICS:
+    MIDDLEWARE.insert(0, "kitchen_core.middleware.QueryMetricsMiddleware")
+# Bearer token for scraping /metrics; without it only staff users may read it
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
 ROOT_URLCONF = "Restaurant_kitchen_service.urls"
 
+# Serve the read-only pages from async views; only useful under ASGI
+# (uvicorn workers), under WSGI every request would pay for an event loop.
+ASYNC_VIEWS = env.bool("ASYNC_VIEWS", default=False)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -72,7 +85,6 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
-                "kitchen_core.context_processors.cfg_assets_root",
             ],
         },
     },
@@ -117,7 +129,6 @@ USE_TZ = True
 
 STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
-ASSETS_ROOT = "/static/assets"
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -133,7 +144,116 @@ AUTH_USER_MODEL = "kitchen_core.Cook"
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
+# Sessions
+
+# One of db, cached_db (reads served from the cache; needs CACHE_SHARED) or
+# signed_cookies (no server-side storage; session data is readable by the
+# client).
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_ENGINE = SESSION_ENGINES[env("SESSION_BACKEND", default="db")]
+
+# Home page visit counts are buffered per process and written in batches
+VISIT_FLUSH_SIZE = env.int("VISIT_FLUSH_SIZE", default=100)
+VISIT_FLUSH_INTERVAL = env.int("VISIT_FLUSH_INTERVAL", default=30)
+
 # Auth redirect
 
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/"
+
+# Cache
+
+# CACHE_BACKEND is one of locmem (per process), file or redis (needs the
+# redis package); CACHE_LOCATION is the directory or redis:// URL.
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+CACHE_BACKEND = env("CACHE_BACKEND", default="locmem")
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": env(
+            "CACHE_LOCATION",
+            default=str(BASE_DIR / ".cache") if CACHE_BACKEND == "file" else "",
+        ),
+    }
+}
+# Whether every worker reads and writes the same cache. The version numbers
+# behind cached fragments live in the cache, so a change is only seen by
+# workers that share it; without one, fragments aren't cached.
+CACHE_SHARED = env.bool("CACHE_SHARED", default=CACHE_BACKEND == "redis")
+if SESSION_ENGINE == SESSION_ENGINES["cached_db"] and not CACHE_SHARED:
+    # A logout would only clear the session from one worker's cache.
+    raise ImproperlyConfigured("SESSION_BACKEND=cached_db needs a shared cache (CACHE_BACKEND=redis).")
+
+# Live updates (server-sent events at /live/, ASGI only)
+
+# LIVE_BROKER is local (events reach this process's clients only) or redis
+# (every worker; needs the redis package), or a kitchen_core.live.Broker
+# subclass's dotted path.
+LIVE_BROKERS = {
+    "local": "kitchen_core.live.LocalBroker",
+    "redis": "kitchen_core.live.RedisBroker",
+}
+LIVE_BROKER = env("LIVE_BROKER", default="local")
+LIVE_BROKER_URL = env(
+    "LIVE_BROKER_URL",
+    default=CACHES["default"]["LOCATION"] if CACHE_BACKEND == "redis" else "redis://localhost:6379/0",
+)
+# Seconds between keep-alive comments on an idle stream
+LIVE_HEARTBEAT = env.int("LIVE_HEARTBEAT", default=15)
+
+# Read replicas
+
+# Database aliases the read-only pages (index, lists, details) read from;
+# empty reads everything from "default". Writes always go to "default".
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ["kitchen_core.replicas.ReplicaRouter"]
+# After a write, the browser reads from the primary for this many seconds
+# so it sees its own change despite replication lag.
+REPLICA_STICKY_SECONDS = env.int("REPLICA_STICKY_SECONDS", default=10)
+
+# Change feed (/changes)
+
+# Entries younger than this many seconds aren't served yet, so a write that
+# got its id just before a later one committed can't be skipped.
+CHANGE_FEED_SETTLE = env.float("CHANGE_FEED_SETTLE", default=2.0)
+# Most changes per response
+CHANGE_FEED_BATCH = env.int("CHANGE_FEED_BATCH", default=500)
+# compact_changes drops entries older than this many days; a client that
+# last synced before then must download the catalogue again.
+CHANGE_LOG_RETENTION_DAYS = env.int("CHANGE_LOG_RETENTION_DAYS", default=30)
+
+# Rendered list rows and detail fragments (only with CACHE_SHARED)
+FRAGMENT_CACHE_ALIAS = "default"
+FRAGMENT_CACHE_TIMEOUT = env.int("FRAGMENT_CACHE_TIMEOUT", default=3600)
+
+# Pagination
+
+# Use keyset (cursor) pagination instead of page numbers on the list views
+CURSOR_PAGINATION = env.bool("CURSOR_PAGINATION", default=False)
+
+# Streaming exports
+
+# Rows fetched per query by the NDJSON API and the CSV/XLSX exports
+STREAM_CHUNK_SIZE = env.int("STREAM_CHUNK_SIZE", default=2000)
+
+# Rows per bulk_create when importing dishes and cooks
+IMPORT_BATCH_SIZE = env.int("IMPORT_BATCH_SIZE", default=1000)
+
+# Choices per page of the dish form's autocomplete lookups
+LOOKUP_PAGE_SIZE = env.int("LOOKUP_PAGE_SIZE", default=20)
+
+# Row counts
+
+# Cache holding the per-model row counters
+COUNT_CACHE_ALIAS = "default"
+COUNT_CACHE_TIMEOUT = env.int("COUNT_CACHE_TIMEOUT", default=300)
+# Above this many rows PostgreSQL planner estimates replace exact COUNT(*)
+COUNT_ESTIMATE_THRESHOLD = env.int("COUNT_ESTIMATE_THRESHOLD", default=100_000)
@@ -17,6 +17,14 @@ DATABASES = {
         "NAME": BASE_DIR / "db.sqlite3",
     }
 }
+# Try the read replica routing locally: the read-only pages read from a
+# copy of db.sqlite3, refreshed by hand (cp db.sqlite3 db.replica.sqlite3).
+if env.bool("DEV_REPLICA", default=False):
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.replica.sqlite3",
+    }
+    DATABASE_REPLICAS = ["replica"]
 
 SECURE_SSL_REDIRECT = False
 SESSION_COOKIE_SECURE = False
@@ -1,3 +1,5 @@
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -22,7 +24,71 @@ DATABASES = {
         "PORT": int(os.environ.get("POSTGRES_DB_PORT")),
     }
 }
+# How connections are reused (POSTGRES_POOL):
+# - none (default under ASGI): a new connection, with its TLS and auth
+#   handshake, per request
+# - persistent (default under WSGI): each worker thread keeps its
+#   connection for POSTGRES_CONN_MAX_AGE seconds and checks it before reuse
+#   after an error. Not under ASGI, where requests run in ever new threads
+#   whose connections would never be closed.
+# - pool: psycopg 3's connection pool, shared by the threads of a worker
+#   (needs psycopg[pool] installed instead of psycopg2)
+ASGI = env.bool("DJANGO_ASGI", default=False)  # set by asgi.py
+POSTGRES_POOL = env("POSTGRES_POOL", default="none" if ASGI else "persistent")
+if POSTGRES_POOL == "persistent" and ASGI:
+    raise ImproperlyConfigured("POSTGRES_POOL=persistent doesn't work under ASGI; use none or pool.")
+if POSTGRES_POOL == "persistent":
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("POSTGRES_CONN_MAX_AGE", default=60)
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+elif POSTGRES_POOL == "pool":
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": env.int("POSTGRES_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("POSTGRES_POOL_MAX_SIZE", default=10),
+            # Seconds a request waits for a free connection before failing
+            "timeout": env.float("POSTGRES_POOL_TIMEOUT", default=10.0),
+            # Seconds before an idle connection above min_size is closed
+            "max_idle": env.float("POSTGRES_POOL_MAX_IDLE", default=600.0),
+            # Seconds before a connection is replaced
+            "max_lifetime": env.float("POSTGRES_POOL_MAX_LIFETIME", default=3600.0),
+        },
+    }
+elif POSTGRES_POOL != "none":
+    raise ImproperlyConfigured("POSTGRES_POOL must be one of none, persistent or pool.")
+# Streaming replicas of "default", comma-separated; the read-only pages
+# are served from them (see kitchen_core.replicas).
+for number, host in enumerate(env.list("POSTGRES_REPLICA_HOSTS", default=[]), start=1):
+    DATABASES[f"replica{number}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{number}")
 STATIC_ROOT = "staticfiles/"
+# collectstatic writes every file under a content-hashed name plus gzip and
+# brotli copies; WhiteNoise serves the smallest one the client accepts and
+# marks hashed files "Cache-Control: max-age=315360000, public, immutable".
+# Templates must link assets with {% static %} to get the hashed names.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+# Only the hashed names are linked, so don't ship the originals as well.
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
+
+# Compile each template once per process; gunicorn.conf.py compiles them
+# all in the master before the workers fork. Listing the loaders replaces
+# APP_DIRS.
+TEMPLATES[0]["APP_DIRS"] = False
+TEMPLATES[0]["OPTIONS"]["loaders"] = [
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    ),
+]
 
 # SECURE_HSTS_SECONDS = 31536000
 # SECURE_HSTS_INCLUDE_SUBDOMAINS = True
@@ -7,15 +7,33 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    },
+    # A separate database, not a mirror: tests that use it check which one
+    # a query went to.
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
 }
 
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+}
+
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 SECURE_SSL_REDIRECT = False
 SESSION_COOKIE_SECURE = False
-CSRF_COOKIE_SECURE = False
\ No newline at end of file
+CSRF_COOKIE_SECURE = False
+
+# Write every home page visit straight through
+VISIT_FLUSH_SIZE = 1
+
+# Serve change log entries as soon as they are written
+CHANGE_FEED_SETTLE = 0
@@ -0,0 +1,47 @@
+# gunicorn reads this file from the working directory. Command-line
+# options override it; the worker count comes from WEB_CONCURRENCY.
+import gc
+import os
+
+# Load Django, the URL resolvers, compiled templates and the WhiteNoise
+# file index once in the master, so forked workers share those pages
+# instead of each building their own. Set GUNICORN_PRELOAD=false to let
+# every worker load the app itself (e.g. for code reloads on HUP).
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes", "on")
+
+
+def when_ready(server):
+    # Runs in the master, after the app is loaded and before any fork.
+    if not server.cfg.preload_app:
+        return
+    from kitchen_core.warmup import warm_up
+
+    server.log.info("Warmed up in the master: %s", _format(warm_up()))
+    # Keep everything loaded so far out of the garbage collector's reach:
+    # collections would otherwise touch (and un-share) those pages in
+    # every worker.
+    gc.freeze()
+
+
+def pre_fork(server, worker):
+    # A connection opened in the master must not be shared by the workers,
+    # nor a connection pool and its threads.
+    from django.core.cache import caches
+    from django.db import connections
+    from kitchen_core.pooling import close_pools
+
+    connections.close_all()
+    close_pools()
+    caches.close_all()
+
+
+def post_worker_init(worker):
+    if worker.cfg.preload_app:
+        return
+    from kitchen_core.warmup import warm_up
+
+    worker.log.info("Warmed up worker %s: %s", worker.pid, _format(warm_up()))
+
+
+def _format(timings):
+    return ", ".join(f"{step} {seconds * 1000:.0f} ms" for step, seconds in timings.items())
@@ -1,25 +1,63 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Prefetch, Q
 
+from kitchen_core.counters import CountingPaginator
 from kitchen_core.models import DishType, Dish, Cook
+from kitchen_core.search import search
+
+
+class IndexedSearchMixin:
+    """
+    Changelist search through kitchen_core.search (pg_trgm indexes or SQLite
+    FTS) and row counts from the cached counters instead of COUNT(*).
+    """
+    paginator = CountingPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return search(queryset, search_term, rank=False), False
 
 
 @admin.register(Cook)
-class CookAdmin(UserAdmin):
-    list_display = UserAdmin.list_display + ("years_of_experience", )
+class CookAdmin(IndexedSearchMixin, UserAdmin):
+    list_display = UserAdmin.list_display + ("years_of_experience", "dish_count")
     fieldsets = UserAdmin.fieldsets +   (("Additional info", {"fields": ("years_of_experience",)}),)
     add_fieldsets = UserAdmin.add_fieldsets + (("Additional info", {"fields": ("years_of_experience",)}),)
 
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        # Names through the search indexes; usernames and emails by
+        # substring, as UserAdmin searches them (pg_trgm indexes from
+        # migration 0012 on PostgreSQL). Filtering the incoming queryset
+        # keeps the changelist's filters.
+        names = search(self.model.objects.all(), term, rank=False)
+        return queryset.filter(
+            Q(pk__in=names) | Q(username__icontains=term) | Q(email__icontains=term)
+        ), False
+
+
 @admin.register(Dish)
-class DishAdmin(admin.ModelAdmin):
+class DishAdmin(IndexedSearchMixin, admin.ModelAdmin):
     search_fields = ("name", )
-    list_display = ("name", "dish_type", "price", "get_cooks")
+    list_display = ("name", "dish_type", "price", "get_cooks", "cook_count")
+    list_select_related = ("dish_type", )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(
+            Prefetch("cooks", queryset=Cook.objects.only("username", "first_name", "last_name"))
+        )
 
     @admin.display(description="Cooks")
     def get_cooks(self, obj):
         return ", ".join([str(cook) for cook in obj.cooks.all()])
 
 
-admin.site.register(DishType)
-
+@admin.register(DishType)
+class DishTypeAdmin(IndexedSearchMixin, admin.ModelAdmin):
+    search_fields = ("name", )
+    list_display = ("name", "dish_count", "cook_count", "price_min", "price_avg", "price_max")
@@ -0,0 +1,186 @@
+import json
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+from django.http import Http404, JsonResponse
+from django.views import View
+
+from .models import Dish, DishType, Cook
+from .pagination import CursorPaginator, InvalidCursor
+from .streaming import streaming_response
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class Resource:
+    """
+    Read-only JSON representation of a model. ``fields`` lists what clients
+    may ask for with ``?fields=``; ``relations`` maps relation fields to the
+    resource used when they are expanded with ``?include=``. A relation
+    that isn't included is rendered as the related id (or list of ids).
+    """
+
+    def __init__(self, model, fields, relations=None):
+        self.model = model
+        self.fields = fields
+        self.relations = relations or {}
+
+    def parse_fields(self, value):
+        if not value:
+            return list(self.fields)
+        fields = [field.strip() for field in value.split(",") if field.strip()]
+        unknown = [field for field in fields if field not in self.fields]
+        if unknown:
+            raise BadRequest(f"Unknown field(s) for {self.model._meta.model_name}: {', '.join(unknown)}")
+        if "id" not in fields:
+            fields.insert(0, "id")
+        return fields
+
+    def parse(self, params):
+        """Return the selected fields and ``{relation: fields}`` to include."""
+        fields = self.parse_fields(params.get("fields"))
+        include = {}
+        for name in filter(None, (name.strip() for name in params.get("include", "").split(","))):
+            if name not in self.relations:
+                raise BadRequest(f"Cannot include {name!r}")
+            include[name] = self.relations[name].parse_fields(params.get(f"fields[{name}]"))
+            if name not in fields:
+                fields.append(name)
+        return fields, include
+
+    def queryset(self, fields, include):
+        queryset = self.model._default_manager.all()
+        columns = []
+        for name in fields:
+            field = self.model._meta.get_field(name)
+            if field.many_to_many:
+                related = include.get(name, ["id"])
+                queryset = queryset.prefetch_related(
+                    Prefetch(name, queryset=field.related_model._default_manager.only(*related))
+                )
+            elif field.is_relation and name in include:
+                queryset = queryset.select_related(name)
+                columns += [f"{name}__{related}" for related in include[name]]
+                columns.append(name)
+            else:
+                columns.append(name)
+        # The cursor paginator reads the ordering columns off each row.
+        columns += [field for field in self.model._meta.ordering if field not in columns]
+        return queryset.only(*columns)
+
+    def serialize(self, obj, fields, include):
+        data = {}
+        for name in fields:
+            field = self.model._meta.get_field(name)
+            if field.many_to_many:
+                related = getattr(obj, name).all()
+                if name in include:
+                    resource = self.relations[name]
+                    data[name] = [resource.serialize(item, include[name], {}) for item in related]
+                else:
+                    data[name] = [item.pk for item in related]
+            elif field.is_relation:
+                if name in include:
+                    data[name] = self.relations[name].serialize(getattr(obj, name), include[name], {})
+                else:
+                    data[name] = getattr(obj, field.attname)
+            else:
+                data[name] = getattr(obj, name)
+        return data
+
+
+DISH_TYPE = Resource(
+    DishType,
+    ("id", "name", "dish_count", "cook_count", "price_min", "price_avg", "price_max", "updated_at"),
+)
+COOK = Resource(
+    Cook,
+    ("id", "username", "first_name", "last_name", "years_of_experience", "dish_count", "updated_at"),
+)
+DISH = Resource(
+    Dish,
+    ("id", "name", "description", "price", "dish_type", "cooks", "cook_count", "updated_at"),
+    relations={"dish_type": DISH_TYPE, "cooks": COOK},
+)
+
+
+class ResourceView(LoginRequiredMixin, View):
+    """
+    ``GET`` a cursor-paginated page of ``resource``, one object with ``pk``,
+    or with ``?format=ndjson`` every object, streamed one JSON document per
+    line.
+    """
+    resource = None
+    raise_exception = True
+    page_size = 50
+    max_page_size = 500
+
+    def get(self, request, pk=None):
+        try:
+            fields, include = self.resource.parse(request.GET)
+            if pk is not None:
+                return self.detail(fields, include, pk)
+            if request.GET.get("format") == "ndjson":
+                return self.stream(fields, include)
+            return self.page(fields, include)
+        except BadRequest as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+    def detail(self, fields, include, pk):
+        try:
+            obj = self.resource.queryset(fields, include).get(pk=pk)
+        except self.resource.model.DoesNotExist:
+            raise Http404
+        return JsonResponse({"data": self.resource.serialize(obj, fields, include)})
+
+    def page(self, fields, include):
+        try:
+            limit = int(self.request.GET.get("limit", self.page_size))
+        except ValueError:
+            raise BadRequest("limit must be an integer")
+        limit = max(1, min(limit, self.max_page_size))
+        paginator = CursorPaginator(self.resource.queryset(fields, include), limit)
+        try:
+            page = paginator.page(self.request.GET.get("cursor"))
+        except InvalidCursor as e:
+            raise BadRequest(str(e))
+        return JsonResponse({
+            "data": [self.resource.serialize(obj, fields, include) for obj in page],
+            "next": self.link(page.next_cursor),
+            "previous": self.link(page.previous_cursor),
+        })
+
+    def link(self, cursor):
+        if cursor is None:
+            return None
+        params = self.request.GET.copy()
+        params["cursor"] = cursor
+        return self.request.build_absolute_uri(f"{self.request.path}?{params.urlencode()}")
+
+    def stream(self, fields, include):
+        # Rows are fetched chunk by chunk (prefetches included) so a full
+        # export never holds the whole table in memory.
+        objects = self.resource.queryset(fields, include).order_by("pk").iterator(
+            chunk_size=settings.STREAM_CHUNK_SIZE
+        )
+        lines = (
+            json.dumps(self.resource.serialize(obj, fields, include), cls=DjangoJSONEncoder) + "\n"
+            for obj in objects
+        )
+        return streaming_response(self.request, lines, content_type="application/x-ndjson")
+
+
+class DishTypeApiView(ResourceView):
+    resource = DISH_TYPE
+
+
+class DishApiView(ResourceView):
+    resource = DISH
+
+
+class CookApiView(ResourceView):
+    resource = COOK
@@ -1,6 +1,22 @@
 from django.apps import AppConfig
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
 
 
 class KitchenCoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'kitchen_core'
+
+    def ready(self):
+        from kitchen_core import pooling, signals  # noqa: F401
+
+        post_migrate.connect(repair_search_indexes, sender=self)
+        connection_created.connect(pooling.connected)
+
+
+def repair_search_indexes(using, **kwargs):
+    # SQLite drops the FTS triggers whenever a migration rebuilds a table.
+    from kitchen_core.search import install_sqlite_fts
+
+    install_sqlite_fts(connections[using])
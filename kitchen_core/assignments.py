@@ -0,0 +1,172 @@
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models.signals import m2m_changed
+
+from kitchen_core.models import Cook, Dish
+from kitchen_core.signals import assignments_changed
+
+Assignment = Dish.cooks.through
+
+
+def _send_changed(cook, action, dish_ids, using):
+    m2m_changed.send(
+        sender=Assignment,
+        instance=cook,
+        action=action,
+        reverse=True,
+        model=Dish,
+        pk_set=set(dish_ids),
+        using=using,
+    )
+
+
+def set_assignment(cook, dish_id, assign=None):
+    """
+    Assign ``cook`` to the dish, unassign them, or toggle the current state
+    when ``assign`` is None. Works directly on the through table: a
+    conditional DELETE, then an INSERT only if nothing was deleted, so it
+    never loads the dish's cook list and repeating a request with an
+    explicit ``assign`` is a no-op.
+
+    Returns the resulting state, or None if the dish does not exist.
+    m2m_changed is sent (from the cook's side) only when a row changed.
+    """
+    using = router.db_for_write(Assignment)
+    rows = Assignment.objects.using(using).filter(dish_id=dish_id, cook_id=cook.pk)
+    with transaction.atomic(using=using):
+        if assign is not True:
+            deleted, _ = rows.delete()
+            if deleted:
+                _send_changed(cook, "post_remove", [dish_id], using)
+                return False
+            if assign is False:
+                return False
+        elif rows.exists():
+            return True
+        if not Dish.objects.using(using).filter(pk=dish_id).exists():
+            return None
+        try:
+            with transaction.atomic(using=using):
+                Assignment.objects.using(using).create(dish_id=dish_id, cook_id=cook.pk)
+        except IntegrityError:
+            # A concurrent request inserted the same row meanwhile.
+            return True
+        _send_changed(cook, "post_add", [dish_id], using)
+    return True
+
+
+ADD, REMOVE = "add", "remove"
+
+
+def _returning_pairs(using, sql, params):
+    """
+    Run an INSERT or DELETE on the through table and return the
+    ``(cook_id, dish_id)`` pairs it actually wrote, so rows a concurrent
+    request added or removed in the meantime aren't counted twice
+    (``bulk_create(ignore_conflicts=True)`` can't tell them apart).
+    """
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    opts = Assignment._meta
+    columns = qn(opts.get_field("cook").column), qn(opts.get_field("dish").column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql.format(table=qn(opts.db_table), pk=qn(opts.pk.column), columns=", ".join(columns)),
+            params,
+        )
+        return {tuple(row) for row in cursor.fetchall()}
+
+
+def apply_assignments(items):
+    """
+    Apply a batch of ``(cook_id, dish_id, action)`` tuples, ``action`` being
+    "add" or "remove", in one transaction: one INSERT ... ON CONFLICT DO
+    NOTHING for the new rows and one DELETE for the removed ones, each
+    returning the rows it actually changed. When the same pair appears more than once
+    the last entry wins.
+
+    Returns one result per item, in order: "added", "removed",
+    "already_assigned", "not_assigned", "superseded", "invalid_action",
+    "unknown_cook" or "unknown_dish". A single ``assignments_changed``
+    signal is sent for the whole batch.
+    """
+    items = [(_to_int(cook_id), _to_int(dish_id), action) for cook_id, dish_id, action in items]
+    using = router.db_for_write(Assignment)
+    cook_ids = {cook_id for cook_id, _, _ in items if cook_id is not None}
+    dish_ids = {dish_id for _, dish_id, _ in items if dish_id is not None}
+    known_cooks = set(Cook.objects.using(using).filter(pk__in=cook_ids).values_list("pk", flat=True))
+    known_dishes = set(Dish.objects.using(using).filter(pk__in=dish_ids).values_list("pk", flat=True))
+
+    results = [None] * len(items)
+    wanted = {}
+    for index, (cook_id, dish_id, action) in enumerate(items):
+        if action not in (ADD, REMOVE):
+            results[index] = "invalid_action"
+        elif cook_id not in known_cooks:
+            results[index] = "unknown_cook"
+        elif dish_id not in known_dishes:
+            results[index] = "unknown_dish"
+        else:
+            previous = wanted.get((cook_id, dish_id))
+            if previous is not None:
+                results[previous[0]] = "superseded"
+            wanted[(cook_id, dish_id)] = (index, action)
+
+    with transaction.atomic(using=using):
+        existing = {
+            (cook_id, dish_id): row_id
+            for row_id, cook_id, dish_id in Assignment.objects.using(using).filter(
+                cook_id__in={cook_id for cook_id, _ in wanted},
+                dish_id__in={dish_id for _, dish_id in wanted},
+            ).values_list("pk", "cook_id", "dish_id")
+        }
+        added, removed = [], []
+        for pair, (index, action) in wanted.items():
+            if action == ADD:
+                if pair in existing:
+                    results[index] = "already_assigned"
+                else:
+                    results[index] = "added"
+                    added.append(pair)
+            elif pair in existing:
+                results[index] = "removed"
+                removed.append(pair)
+            else:
+                results[index] = "not_assigned"
+
+        if removed:
+            deleted = _returning_pairs(
+                using,
+                "DELETE FROM {table} WHERE {pk} IN (%s) RETURNING {columns}"
+                % ", ".join(["%s"] * len(removed)),
+                [existing[pair] for pair in removed],
+            )
+            for pair in removed:
+                if pair not in deleted:
+                    results[wanted[pair][0]] = "not_assigned"
+            removed = [pair for pair in removed if pair in deleted]
+        if added:
+            inserted = _returning_pairs(
+                using,
+                "INSERT INTO {table} ({columns}) VALUES %s ON CONFLICT DO NOTHING RETURNING {columns}"
+                % ", ".join(["(%s, %s)"] * len(added)),
+                [value for pair in added for value in pair],
+            )
+            for pair in added:
+                if pair not in inserted:
+                    results[wanted[pair][0]] = "already_assigned"
+            added = [pair for pair in added if pair in inserted]
+        if added or removed:
+            assignments_changed.send(
+                sender=Assignment,
+                added=added,
+                removed=removed,
+                using=using,
+            )
+    return results
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
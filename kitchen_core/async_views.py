@@ -0,0 +1,166 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.shortcuts import render
+
+from . import views
+from .counters import aget_count
+from .live import RESYNC, format_event, get_broker
+from .models import Dish, DishType, Cook
+from .pagination import CursorPaginator, InvalidCursor
+from .visits import visits
+
+# Async variants of the read views, served instead of the ones in views.py
+# when ASYNC_VIEWS is set (see the ASGI section of the README). Templates
+# are still rendered synchronously: Django runs TemplateResponse.render()
+# in a worker thread, where lazy querysets inside {% cache %} blocks may
+# still query on a cache miss.
+
+
+@login_required
+async def index(request: HttpRequest) -> HttpResponse:
+    # login_required resolved the user with auser(); request.user would
+    # load it again, synchronously, from the template.
+    request.user = await request.auser()
+    num_dishes = await aget_count(Dish)
+    num_cooks = await aget_count(Cook)
+    num_assignments = await aget_count(Dish.cooks.through)
+    context = {
+        "num_dish_types": await aget_count(DishType),
+        "num_dishes": num_dishes,
+        "num_cooks": num_cooks,
+        "dishes_per_cook": num_assignments / num_cooks if num_cooks else 0,
+        "cooks_per_dish": num_assignments / num_dishes if num_dishes else 0,
+        "num_visits": await sync_to_async(visits.record)(request.user),
+    }
+    return render(request, "kitchen_core/index.html", context=context)
+
+
+class AsyncViewMixin:
+    """
+    Run a login-required ConditionalGetMixin view on the event loop. The
+    user is loaded asynchronously first; LoginRequiredMixin and
+    ConditionalGetMixin then do their usual checks, the latter awaiting
+    the async get().
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        # LoginRequiredMixin would otherwise load request.user synchronously.
+        request.user = await request.auser()
+        response = super().dispatch(request, *args, **kwargs)
+        if asyncio.iscoroutine(response):
+            response = await response
+        return response
+
+
+class AsyncListMixin(AsyncViewMixin):
+    # Load the page's rows before rendering. Views whose rows are rendered
+    # inside a {% cache %} block leave them lazy so a cache hit skips them.
+    materialize_page = True
+
+    async def get(self, request, *args, **kwargs):
+        # The search backend probes for the SQLite FTS tables on first use.
+        self.object_list = await sync_to_async(self.get_queryset)()
+        self.pagination = await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+        # Fragment cache keys read the shared cache; keep that off the loop.
+        return self.render_to_response(await sync_to_async(self.get_context_data)())
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if not page_size:
+            return None
+        if self.use_cursor_pagination():
+            paginator = CursorPaginator(queryset, page_size)
+            try:
+                page = await paginator.apage(self.request.GET.get(self.cursor_kwarg))
+            except InvalidCursor as e:
+                raise Http404(str(e))
+            return paginator, page, page.object_list, page.has_other_pages()
+        # Page-number pagination counts through the (cached) row counters.
+        paginator, page, object_list, is_paginated = await sync_to_async(
+            super().paginate_queryset
+        )(queryset, page_size)
+        if self.materialize_page:
+            page.object_list = object_list = [obj async for obj in object_list]
+        return paginator, page, object_list, is_paginated
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.pagination
+
+
+class AsyncDetailMixin(AsyncViewMixin):
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        context = await sync_to_async(self.get_context_data)(object=self.object)
+        return self.render_to_response(context)
+
+    async def aget_object(self):
+        queryset = self.get_queryset()
+        try:
+            return await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist:
+            raise Http404(f"No {queryset.model._meta.verbose_name} found matching the query")
+
+
+class DishTypeListView(AsyncListMixin, views.DishTypeListView):
+    pass
+
+
+class DishTypeDetailView(AsyncDetailMixin, views.DishTypeDetailView):
+    pass
+
+
+class DishListView(AsyncListMixin, views.DishListView):
+    materialize_page = False
+
+
+class DishDetailView(AsyncDetailMixin, views.DishDetailView):
+    pass
+
+
+class CookListView(AsyncListMixin, views.CookListView):
+    pass
+
+
+class CookDetailView(AsyncDetailMixin, views.CookDetailView):
+    pass
+
+
+async def live(request: HttpRequest) -> HttpResponse:
+    """
+    Stream the kitchen_core.live events as server-sent events. Served under
+    ASGI only: under WSGI an open page would hold a worker for good, so the
+    response is a 204, which tells EventSource not to reconnect; live.js
+    then marks the page as not updating.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return HttpResponse(status=403)
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    response = StreamingHttpResponse(_live_events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Don't let nginx buffer the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def _live_events():
+    async with get_broker().subscribe() as subscription:
+        yield ": subscribed\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), settings.LIVE_HEARTBEAT)
+            except TimeoutError:
+                # Keeps proxies from closing an idle connection.
+                yield ": heartbeat\n\n"
+                continue
+            yield format_event(event)
+            if event is RESYNC:
+                # The page reloads; its new stream starts from there.
+                return
@@ -0,0 +1,153 @@
+from collections import defaultdict
+from datetime import timedelta
+from itertools import takewhile
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .api import COOK, DISH, DISH_TYPE
+from .models import ChangeLogEntry, Cook, Dish, DishType
+
+CREATE = ChangeLogEntry.CREATE
+UPDATE = ChangeLogEntry.UPDATE
+DELETE = ChangeLogEntry.DELETE
+TRUNCATED = ChangeLogEntry.TRUNCATED
+ASSIGNMENT = "assignment"
+
+# What a change carries, by model. Assignments are logged as changes of
+# their own, and the stored aggregates and updated_at are rewritten
+# without signals, so those are left out.
+RESOURCES = {
+    "dish_type": (DISH_TYPE, ["id", "name"]),
+    "dish": (DISH, ["id", "name", "description", "price", "dish_type"]),
+    "cook": (COOK, ["id", "username", "first_name", "last_name", "years_of_experience"]),
+}
+NAMES = {DishType: "dish_type", Dish: "dish", Cook: "cook"}
+
+
+class Expired(Exception):
+    """Changes after the token were compacted away or never logged."""
+
+
+def tracks(model, update_fields):
+    """Whether saving ``update_fields`` of ``model`` changes what the log carries."""
+    fields = RESOURCES[NAMES[model]][1]
+    return any(model._meta.get_field(name).name in fields for name in update_fields)
+
+
+def record(model, action, pks, using=DEFAULT_DB_ALIAS):
+    """Log ``action`` for the ``model`` rows ``pks`` once the transaction commits."""
+    _write([ChangeLogEntry(model=NAMES[model], object_id=pk, action=action) for pk in pks], using)
+
+
+def record_assignments(action, pairs, using=DEFAULT_DB_ALIAS):
+    """Log ``action`` for the (cook_id, dish_id) ``pairs`` once the transaction commits."""
+    _write(
+        [ChangeLogEntry(model=ASSIGNMENT, object_id=dish, related_id=cook, action=action) for cook, dish in pairs],
+        using,
+    )
+
+
+def truncate(using=DEFAULT_DB_ALIAS):
+    """
+    Mark the log incomplete from here, after changes that weren't logged
+    (e.g. bulk inserts): clients following it must start over.
+    """
+    _write([ChangeLogEntry(model="", object_id=0, action=TRUNCATED)], using)
+
+
+def _write(entries, using):
+    # Written right after the commit, in a transaction of its own: an id is
+    # then handed out moments before it becomes visible, and the feed holds
+    # entries back for CHANGE_FEED_SETTLE seconds to cover that gap.
+    if entries:
+        transaction.on_commit(
+            lambda: ChangeLogEntry.objects.using(using).bulk_create(entries),
+            using=using,
+        )
+
+
+def _settled():
+    return timezone.now() - timedelta(seconds=settings.CHANGE_FEED_SETTLE)
+
+
+def head(using=DEFAULT_DB_ALIAS):
+    """The token to follow the log from, taken before reading the catalogue."""
+    entries = ChangeLogEntry.objects.using(using).filter(created_at__lte=_settled())
+    return entries.order_by("-pk").values_list("pk", flat=True).first() or 0
+
+
+def changes_since(since, limit, using=DEFAULT_DB_ALIAS):
+    """
+    Return ``(changes, token, more)``: at most ``limit`` log entries after
+    the ``since`` token, merged per object, the token to ask for next, and
+    whether more entries are waiting already. Creates and updates carry
+    the object as it is now; one deleted since is left to its delete.
+    """
+    entries = ChangeLogEntry.objects.using(using)
+    # Markers are the only entries without a model (see truncate()).
+    if entries.filter(model="", pk__gt=since).exists():
+        raise Expired
+    settled = _settled()
+    fetched = list(entries.filter(pk__gt=since).order_by("pk")[:limit + 1])
+    batch = list(takewhile(lambda entry: entry.created_at <= settled, fetched[:limit]))
+    more = len(fetched) > limit and len(batch) == limit
+
+    # The last change per object, in the order of those last changes.
+    merged = {}
+    for entry in batch:
+        key = (entry.model, entry.object_id, entry.related_id)
+        action = entry.action
+        if merged.pop(key, None) == CREATE:
+            if action == DELETE:
+                # Created and deleted since the token: nothing to tell.
+                continue
+            action = CREATE
+        merged[key] = action
+
+    upserted = defaultdict(set)
+    for (model, pk, related), action in merged.items():
+        if model in RESOURCES and action != DELETE:
+            upserted[model].add(pk)
+    current = {}
+    for model, pks in upserted.items():
+        resource, fields = RESOURCES[model]
+        objects = resource.queryset(fields, {}).using(using).filter(pk__in=pks)
+        current[model] = {obj.pk: resource.serialize(obj, fields, {}) for obj in objects}
+
+    changes = []
+    for (model, pk, related), action in merged.items():
+        if model == ASSIGNMENT:
+            changes.append({"model": model, "action": action, "dish": pk, "cook": related})
+        elif action == DELETE:
+            changes.append({"model": model, "action": action, "id": pk})
+        elif pk in current[model]:
+            changes.append({"model": model, "action": action, "id": pk, "data": current[model][pk]})
+    return changes, batch[-1].pk if batch else since, more
+
+
+def compact(before, using=DEFAULT_DB_ALIAS):
+    """
+    Delete the entries a later one for the same object supersedes, and the
+    entries written before ``before``. The newest expired entry becomes a
+    truncate() marker: tokens below it raise Expired. Returns the number of
+    superseded and expired entries removed.
+    """
+    entries = ChangeLogEntry.objects.using(using)
+    later = entries.filter(
+        model=OuterRef("model"),
+        object_id=OuterRef("object_id"),
+        related_id=OuterRef("related_id"),
+        pk__gt=OuterRef("pk"),
+    )
+    superseded, _ = entries.filter(Exists(later)).delete()
+
+    with transaction.atomic(using=using):
+        horizon = entries.filter(created_at__lt=before).order_by("-pk").first()
+        if horizon is None or horizon.action == TRUNCATED:
+            return superseded, 0
+        expired, _ = entries.filter(pk__lt=horizon.pk).delete()
+        entries.filter(pk=horizon.pk).update(model="", object_id=0, related_id=0, action=TRUNCATED)
+    return superseded, expired + 1
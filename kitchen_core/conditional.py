@@ -0,0 +1,80 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from kitchen_core.fragments import get_version
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET/HEAD with ``304 Not Modified`` when the page can't have
+    changed, before the view runs any query of its own.
+
+    The ETag is derived from the versions of ``cache_models`` (bumped by
+    model signals, so deletes count too), the URL and query string, the
+    user and their CSRF token, which is rendered into the page. The
+    versions live in the cache, so they are only used with CACHE_SHARED: a
+    worker that doesn't see another's bump would answer 304 for a changed
+    page. Views whose freshness is exactly described by ``updated_at``
+    columns may return that date from ``get_last_modified()``; without a
+    shared cache it stands in for the versions. No Last-Modified header is
+    sent, since a date alone would validate another user's copy.
+    """
+    cache_models = ()
+
+    def get_etag(self):
+        if settings.CACHE_SHARED:
+            version = get_version(*self.cache_models)
+        else:
+            last_modified = self.get_last_modified()
+            if last_modified is None:
+                return None
+            version = last_modified.isoformat()
+        request = self.request
+        parts = [
+            version,
+            request.get_full_path(),
+            str(request.user.pk),
+            self.get_csrf_secret(),
+        ]
+        return 'W/"{}"'.format(hashlib.sha256("|".join(parts).encode()).hexdigest()[:32])
+
+    def get_csrf_secret(self):
+        # The page embeds a token derived from this secret, which rotates on
+        # login, so a 304 must never outlive it. get_token() itself is
+        # salted per call and can't be hashed.
+        get_token(self.request)
+        return self.request.META["CSRF_COOKIE"]
+
+    def get_last_modified(self):
+        return None
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            return self._adispatch(super().dispatch, request, *args, **kwargs)
+        view = condition(etag_func=lambda request, *args, **kwargs: self.get_etag())(super().dispatch)
+        return self._private(view(request, *args, **kwargs))
+
+    async def _adispatch(self, dispatch, request, *args, **kwargs):
+        # The ETag reads the cache or the database: compute it in a worker
+        # thread rather than on the event loop.
+        etag = await sync_to_async(self.get_etag)()
+
+        async def view(request, *args, **kwargs):
+            return await dispatch(request, *args, **kwargs)
+
+        view = condition(etag_func=lambda request, *args, **kwargs: etag)(view)
+        return self._private(await view(request, *args, **kwargs))
+
+    def _private(self, response):
+        # Pages are per user: browsers may keep them but must revalidate,
+        # shared caches must not store them.
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Cookie"])
+        return response
@@ -0,0 +1,112 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.db import connections, router
+from django.utils.functional import cached_property
+
+
+def _cache():
+    return caches[settings.COUNT_CACHE_ALIAS]
+
+
+def _key(model):
+    return f"kitchen_core:count:{model._meta.label_lower}"
+
+
+def table_estimate(model, using=None):
+    """Planner row estimate for the whole table (PostgreSQL only)."""
+    using = using or router.db_for_read(model)
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 for tables that were never vacuumed/analyzed.
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def queryset_estimate(queryset):
+    """Planner row estimate for an arbitrary queryset (PostgreSQL only)."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_count(model):
+    """
+    Row count of ``model`` served from the counter cache. A cold counter is
+    seeded from ``reltuples`` on large PostgreSQL tables, or an exact
+    ``COUNT(*)`` otherwise; signals keep it current afterwards.
+    """
+    cache = _cache()
+    key = _key(model)
+    count = cache.get(key)
+    if count is None:
+        count = table_estimate(model)
+        if count is None or count < settings.COUNT_ESTIMATE_THRESHOLD:
+            count = model._default_manager.count()
+        cache.set(key, count, settings.COUNT_CACHE_TIMEOUT)
+    return count
+
+
+async def aget_count(model):
+    cache = _cache()
+    key = _key(model)
+    count = await cache.aget(key)
+    if count is None:
+        count = await sync_to_async(table_estimate)(model)
+        if count is None or count < settings.COUNT_ESTIMATE_THRESHOLD:
+            count = await model._default_manager.acount()
+        await cache.aset(key, count, settings.COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def queryset_count(queryset):
+    """
+    Count for paginating ``queryset``: unfiltered querysets use the counter
+    cache, filtered ones are counted exactly unless the planner expects more
+    than ``COUNT_ESTIMATE_THRESHOLD`` rows.
+    """
+    if not queryset.query.where and not queryset.query.distinct:
+        return get_count(queryset.model)
+    estimate = queryset_estimate(queryset)
+    if estimate is not None and estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+        return estimate
+    return queryset.count()
+
+
+def adjust(model, delta):
+    cache = _cache()
+    try:
+        cache.incr(_key(model), delta)
+    except ValueError:
+        # Not cached yet; the next read will seed it.
+        pass
+
+
+def invalidate(*models):
+    _cache().delete_many([_key(model) for model in models])
+
+
+class CountingPaginator(Paginator):
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, "query"):
+            return queryset_count(self.object_list)
+        return len(self.object_list)
@@ -0,0 +1,182 @@
+import csv
+import re
+import zipfile
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Prefetch
+
+from .models import Dish, Cook
+
+# Bytes buffered before a chunk is handed to the response or file.
+FLUSH_SIZE = 64 * 1024
+
+
+def dish_rows():
+    dishes = Dish.objects.select_related("dish_type").only(
+        "name", "price", "dish_type__name",
+    ).prefetch_related(
+        Prefetch("cooks", queryset=Cook.objects.only("username").order_by("username"))
+    ).order_by("pk")
+    yield ["id", "name", "dish_type", "price", "cooks"]
+    for dish in dishes.iterator(chunk_size=settings.STREAM_CHUNK_SIZE):
+        yield [
+            dish.pk,
+            dish.name,
+            dish.dish_type.name,
+            dish.price,
+            ", ".join(cook.username for cook in dish.cooks.all()),
+        ]
+
+
+def cook_rows():
+    cooks = Cook.objects.only(
+        "username", "first_name", "last_name", "years_of_experience", "dish_count",
+    ).order_by("pk")
+    yield ["id", "username", "first_name", "last_name", "years_of_experience", "dish_count"]
+    for cook in cooks.iterator(chunk_size=settings.STREAM_CHUNK_SIZE):
+        yield [
+            cook.pk,
+            cook.username,
+            cook.first_name,
+            cook.last_name,
+            cook.years_of_experience,
+            cook.dish_count,
+        ]
+
+
+EXPORTS = {
+    "dishes": dish_rows,
+    "cooks": cook_rows,
+}
+
+
+class _Buffer:
+    """Write-only byte sink, drained by the exporter after each chunk."""
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        self.chunks.append(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks, self.size = [], 0
+        return data
+
+
+class CsvWriter:
+    content_type = "text/csv"
+
+    def __init__(self, stream):
+        self.writer = csv.writer(stream)
+
+    def writerow(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        pass
+
+
+# Characters that may not appear in an XML 1.0 document.
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'
+    ),
+}
+
+
+class XlsxWriter:
+    """
+    Minimal single-sheet XLSX writer. The sheet is written row by row into
+    a deflated zip member with inline strings (no shared string table), so
+    memory use doesn't grow with the row count.
+    """
+    content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def __init__(self, stream):
+        self.zip = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED)
+        for name, content in _XLSX_PARTS.items():
+            self.zip.writestr(name, content)
+        self.sheet = self.zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self.sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b"<sheetData>"
+        )
+
+    @staticmethod
+    def cell(value):
+        if value is None:
+            return "<c/>"
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return f"<c><v>{value}</v></c>"
+        text = escape(_XML_ILLEGAL.sub("", str(value)))
+        return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+    def writerow(self, row):
+        self.sheet.write(("<row>" + "".join(map(self.cell, row)) + "</row>").encode())
+
+    def close(self):
+        self.sheet.write(b"</sheetData></worksheet>")
+        self.sheet.close()
+        self.zip.close()
+
+
+WRITERS = {
+    "csv": CsvWriter,
+    "xlsx": XlsxWriter,
+}
+
+
+def export(name, format):
+    """Yield the ``name`` export encoded as ``format``, in chunks of bytes."""
+    buffer = _Buffer()
+    writer = WRITERS[format](buffer)
+    for row in EXPORTS[name]():
+        writer.writerow(row)
+        if buffer.size >= FLUSH_SIZE:
+            yield buffer.drain()
+    writer.close()
+    yield buffer.drain()
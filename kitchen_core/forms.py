@@ -1,6 +1,10 @@
 from django.contrib.auth.forms import UserCreationForm
 
-from kitchen_core.models import Cook, DishType
+from django.urls import reverse_lazy
+
+from kitchen_core.models import Cook, Dish, DishType
+from kitchen_core.search import search
+from kitchen_core.widgets import AutocompleteSelect, AutocompleteSelectMultiple
 from django import forms
 
 
@@ -16,7 +20,25 @@ class CookCreationForm(UserCreationForm):
 
 
 
-class DishSearchForm(forms.Form):
+class DishForm(forms.ModelForm):
+    # Cleaning fetches only the submitted dish type and cooks.
+    class Meta:
+        model = Dish
+        fields = "__all__"
+        widgets = {
+            "dish_type": AutocompleteSelect(reverse_lazy("kitchen_core:lookup", args=["dish-types"])),
+            "cooks": AutocompleteSelectMultiple(reverse_lazy("kitchen_core:lookup", args=["cooks"])),
+        }
+
+
+class SearchFormMixin:
+    search_field = "name"
+
+    def search(self, queryset, rank=True):
+        return search(queryset, self.cleaned_data[self.search_field], rank=rank)
+
+
+class DishSearchForm(SearchFormMixin, forms.Form):
     name = forms.CharField(
         max_length=255,
         required=False,
@@ -27,7 +49,7 @@ class DishSearchForm(forms.Form):
     )
 
 
-class DishTypeSearchForm(forms.Form):
+class DishTypeSearchForm(SearchFormMixin, forms.Form):
     name = forms.CharField(
         max_length=255,
         required=False,
@@ -39,7 +61,9 @@ class DishTypeSearchForm(forms.Form):
         )
     )
 
-class CookSearchForm(forms.Form):
+class CookSearchForm(SearchFormMixin, forms.Form):
+    search_field = "cook"
+
     cook = forms.CharField(
         max_length=255,
         required=False,
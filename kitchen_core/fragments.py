@@ -0,0 +1,73 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from . import replicas
+
+
+def _cache():
+    return caches[settings.FRAGMENT_CACHE_ALIAS]
+
+
+def _key(model):
+    return f"kitchen_core:version:{model._meta.label_lower}"
+
+
+def _fresh():
+    # Never reuse a number: an evicted version must not resurrect fragments
+    # cached under an older one.
+    return time.time_ns()
+
+
+def get_version(*models):
+    """Combined version of ``models``; changes whenever any of them does."""
+    cache = _cache()
+    keys = [_key(model) for model in models]
+    versions = cache.get_many(keys)
+    missing = {key: _fresh() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return "-".join(str(versions[key]) for key in keys)
+
+
+def enabled():
+    """
+    Whether fragments are cached: only in a cache every worker shares, or a
+    worker would keep serving fragments another one has invalidated.
+    """
+    return settings.CACHE_SHARED and settings.FRAGMENT_CACHE_TIMEOUT > 0
+
+
+def bump(*models):
+    cache = _cache()
+    replicas.versions_bumped()
+    for model in models:
+        try:
+            cache.incr(_key(model))
+        except ValueError:
+            cache.set(_key(model), _fresh(), None)
+
+
+class FragmentCacheMixin:
+    """
+    Provide ``fragment_key`` and ``fragment_timeout`` for ``{% cache %}``
+    blocks in the template. The key changes whenever one of
+    ``cache_models`` changes, or with the query string (search, page).
+    A timeout of 0 renders the blocks every time (see enabled()).
+    """
+    cache_models = ()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if enabled():
+            context["fragment_key"] = "{}:{}".format(
+                get_version(*self.cache_models),
+                self.request.GET.urlencode(),
+            )
+            context["fragment_timeout"] = settings.FRAGMENT_CACHE_TIMEOUT
+        else:
+            context["fragment_key"] = ""
+            context["fragment_timeout"] = 0
+        return context
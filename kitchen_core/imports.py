@@ -0,0 +1,276 @@
+import csv
+import json
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from . import changes, counters, fragments, stats
+from .models import DishType, Dish, Cook
+
+Assignment = Dish.cooks.through
+
+
+def read_csv(lines):
+    """Yield ``(line number, row)`` for a CSV file with a header row."""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_ndjson(lines):
+    """Yield ``(line number, row)`` for one JSON object per line."""
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_num, row if isinstance(row, dict) else None
+
+
+READERS = {
+    "csv": read_csv,
+    "ndjson": read_ndjson,
+}
+
+
+class RowError(ValueError):
+    pass
+
+
+class ImportReport:
+    def __init__(self, dry_run):
+        self.dry_run = dry_run
+        self.rows = 0
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+        self.seconds = 0.0
+
+    def as_dict(self, max_errors=100):
+        return {
+            "dry_run": self.dry_run,
+            "rows": self.rows,
+            "created": self.created,
+            "updated": self.updated,
+            "failed": len(self.errors),
+            "errors": [{"line": line, "error": error} for line, error in self.errors[:max_errors]],
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows / self.seconds, 1) if self.seconds else None,
+        }
+
+
+class Importer:
+    """
+    Upsert rows in batches with one bulk_create(update_conflicts=True) per
+    batch. Rows are parsed but not full_clean()ed, and no model signals are
+    sent: the stored stats, row counters and fragment versions are rebuilt
+    or reset once at the end, and the change log is written per batch.
+    """
+    model = None
+    unique_field = None
+    update_fields = ()
+
+    def __init__(self, batch_size=1000, dry_run=False):
+        self.batch_size = batch_size
+        self.report = ImportReport(dry_run)
+
+    def run(self, rows):
+        start = time.perf_counter()
+        with transaction.atomic():
+            batch = []
+            for line_num, row in rows:
+                self.report.rows += 1
+                try:
+                    if row is None:
+                        raise RowError("Not a JSON object")
+                    batch.append((line_num, self.parse(row)))
+                except RowError as e:
+                    self.report.errors.append((line_num, str(e)))
+                if len(batch) >= self.batch_size:
+                    self.flush(batch)
+                    batch = []
+            if batch:
+                self.flush(batch)
+            self.reset_sequences()
+            if self.report.dry_run:
+                transaction.set_rollback(True)
+            else:
+                stats.rebuild()
+        if not self.report.dry_run:
+            counters.invalidate(DishType, Dish, Cook, Assignment)
+            fragments.bump(DishType, Dish, Cook, Assignment)
+        self.report.seconds = time.perf_counter() - start
+        return self.report
+
+    def parse(self, row):
+        raise NotImplementedError
+
+    def flush(self, batch):
+        raise NotImplementedError
+
+    def reset_sequences(self):
+        # Rows inserted with explicit ids don't advance PostgreSQL sequences.
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [self.model]):
+                cursor.execute(sql)
+
+    def upsert(self, objects):
+        """Upsert ``objects``, the last one winning for a repeated key."""
+        # A batch may not touch the same row twice (ON CONFLICT DO UPDATE).
+        # Rows without a key are all new; their keys can't equal a real one.
+        unique = {}
+        for index, obj in enumerate(objects):
+            key = getattr(obj, self.unique_field)
+            unique[("new", index) if key is None else key] = obj
+        objects = list(unique.values())
+        keys = [getattr(obj, self.unique_field) for obj in objects if getattr(obj, self.unique_field) is not None]
+        existing = set(
+            self.model.objects.filter(**{f"{self.unique_field}__in": keys})
+            .values_list(self.unique_field, flat=True)
+        )
+        self.model.objects.bulk_create(
+            objects,
+            update_conflicts=True,
+            unique_fields=[self.unique_field],
+            update_fields=self.update_fields,
+        )
+        updated = [obj.pk for obj in objects if getattr(obj, self.unique_field) in existing]
+        created = [obj.pk for obj in objects if getattr(obj, self.unique_field) not in existing]
+        changes.record(self.model, changes.UPDATE, updated)
+        changes.record(self.model, changes.CREATE, created)
+        self.report.updated += len(updated)
+        self.report.created += len(created)
+        return objects
+
+
+def _text(row, column, field, required=True):
+    value = row.get(column)
+    value = "" if value is None else str(value).strip()
+    if required and not value:
+        raise RowError(f"{column} is required")
+    max_length = field.max_length
+    if max_length and len(value) > max_length:
+        raise RowError(f"{column} is longer than {max_length} characters")
+    return value
+
+
+def _optional_int(row, column):
+    value = row.get(column)
+    if value in ("", None):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise RowError(f"{column} must be an integer")
+
+
+def _usernames(value):
+    if isinstance(value, list):
+        return [str(name).strip() for name in value if str(name).strip()]
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+class DishImporter(Importer):
+    """
+    Columns: ``id`` (optional; existing dishes are updated), ``name``,
+    ``dish_type`` (a name; missing types are created), ``price``,
+    ``description`` and ``cooks`` (comma-separated usernames). When the
+    ``cooks`` column is present it replaces the dish's assignments.
+    """
+    model = Dish
+    unique_field = "id"
+    update_fields = ("name", "description", "price", "dish_type", "updated_at")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Dish types are few: map every name to its id once.
+        self.dish_types = dict(DishType.objects.values_list("name", "id"))
+        self.cooks = {}
+
+    def parse(self, row):
+        try:
+            price = Decimal(str(row.get("price") or "").strip())
+        except InvalidOperation:
+            raise RowError("price must be a number")
+        if not price.is_finite() or abs(price) >= 10 ** 5:
+            raise RowError("price must be a number below 100000")
+        dish = Dish(
+            id=_optional_int(row, "id"),
+            name=_text(row, "name", Dish._meta.get_field("name")),
+            description=_text(row, "description", Dish._meta.get_field("description"), required=False),
+            price=price.quantize(Decimal("0.01")),
+        )
+        dish.dish_type_name = _text(row, "dish_type", DishType._meta.get_field("name"))
+        dish.cook_names = _usernames(row["cooks"]) if "cooks" in row else None
+        return dish
+
+    def flush(self, batch):
+        new_types = {dish.dish_type_name for _, dish in batch} - self.dish_types.keys()
+        if new_types:
+            created = DishType.objects.bulk_create([DishType(name=name) for name in new_types])
+            for dish_type in created:
+                self.dish_types[dish_type.name] = dish_type.pk
+            changes.record(DishType, changes.CREATE, [dish_type.pk for dish_type in created])
+
+        usernames = {name for _, dish in batch for name in dish.cook_names or ()} - self.cooks.keys()
+        if usernames:
+            self.cooks.update(Cook.objects.filter(username__in=usernames).values_list("username", "id"))
+
+        dishes = []
+        for line_num, dish in batch:
+            unknown = [name for name in dish.cook_names or () if name not in self.cooks]
+            if unknown:
+                self.report.errors.append((line_num, f"Unknown cook(s): {', '.join(unknown)}"))
+                continue
+            dish.dish_type_id = self.dish_types[dish.dish_type_name]
+            dishes.append(dish)
+        if not dishes:
+            return
+        dishes = self.upsert(dishes)
+
+        linked = [dish for dish in dishes if dish.cook_names is not None]
+        if linked:
+            assigned = Assignment.objects.filter(dish_id__in=[dish.pk for dish in linked])
+            previous = set(assigned.values_list("cook_id", "dish_id"))
+            assigned.delete()
+            pairs = {(self.cooks[name], dish.pk) for dish in linked for name in dish.cook_names}
+            Assignment.objects.bulk_create(
+                [Assignment(dish_id=dish_id, cook_id=cook_id) for cook_id, dish_id in pairs],
+                ignore_conflicts=True,
+            )
+            changes.record_assignments(changes.DELETE, previous - pairs)
+            changes.record_assignments(changes.CREATE, pairs - previous)
+
+
+class CookImporter(Importer):
+    """
+    Columns: ``username``, ``first_name``, ``last_name`` and
+    ``years_of_experience``. Cooks are matched by username; new ones get
+    an unusable password.
+    """
+    model = Cook
+    unique_field = "username"
+    update_fields = ("first_name", "last_name", "years_of_experience", "updated_at")
+
+    def parse(self, row):
+        return Cook(
+            username=_text(row, "username", Cook._meta.get_field("username")),
+            first_name=_text(row, "first_name", Cook._meta.get_field("first_name"), required=False),
+            last_name=_text(row, "last_name", Cook._meta.get_field("last_name"), required=False),
+            years_of_experience=_optional_int(row, "years_of_experience"),
+            password=make_password(None),
+        )
+
+    def flush(self, batch):
+        self.upsert([cook for _, cook in batch])
+
+
+IMPORTERS = {
+    "dishes": DishImporter,
+    "cooks": CookImporter,
+}
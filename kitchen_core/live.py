@@ -0,0 +1,171 @@
+import asyncio
+import json
+import logging
+import threading
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Live updates for the kitchen screens. kitchen_core.signals publishes small
+# JSON deltas (assignments, dish and dish type edits) once their transaction
+# commits; the /live/ view streams them to the browsers as server-sent
+# events. Each process fans the events out to its own subscribers; the
+# broker decides where they come from.
+
+# Put on a subscriber's queue when it fell too far behind, or the broker lost
+# its source of events: the page must reload to catch up.
+RESYNC = {"type": "resync"}
+
+
+class Subscription:
+    """A queue of events for one client, filled from any thread."""
+
+    def __init__(self, size):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(size)
+        self.lagging = False
+
+    def put(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The client's event loop has already shut down.
+            pass
+
+    def _put(self, event):
+        if self.lagging:
+            return
+        if self.queue.qsize() >= self.queue.maxsize - 1:
+            # Skipping events would leave the page wrong without saying so;
+            # the last slot is kept for telling it.
+            self.lagging = True
+            event = RESYNC
+        self.queue.put_nowait(event)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class Broker:
+    """
+    Delivers published events to the subscribers in this process.
+    Subclasses implement publish(), which may be called from any thread.
+    """
+
+    queue_size = 100
+
+    def __init__(self):
+        self.subscribers = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event):
+        raise NotImplementedError
+
+    def deliver(self, event):
+        with self._lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    @asynccontextmanager
+    async def subscribe(self):
+        subscription = Subscription(self.queue_size)
+        with self._lock:
+            self.subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                self.subscribers.discard(subscription)
+
+
+class LocalBroker(Broker):
+    """For a single process: events published by other workers are not seen."""
+
+    def publish(self, event):
+        self.deliver(event)
+
+
+class RedisBroker(Broker):
+    """
+    Publishes to a redis channel, which every process subscribes to once
+    for as long as it has subscribers of its own. Needs the redis package.
+    """
+
+    channel = "kitchen_core:live"
+
+    def __init__(self, url=None):
+        super().__init__()
+        import redis
+
+        self.url = url or settings.LIVE_BROKER_URL
+        self.client = redis.Redis.from_url(self.url)
+        self.listener = None
+
+    def publish(self, event):
+        self.client.publish(self.channel, json.dumps(event))
+
+    @asynccontextmanager
+    async def subscribe(self):
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.create_task(self.listen())
+        try:
+            async with super().subscribe() as subscription:
+                yield subscription
+        finally:
+            if not self.subscribers and self.listener is not None:
+                self.listener.cancel()
+                self.listener = None
+
+    async def listen(self):
+        import redis.asyncio
+
+        client = redis.asyncio.Redis.from_url(self.url)
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.deliver(json.loads(message["data"]))
+        except (OSError, redis.RedisError):
+            logger.exception("Lost the live updates channel")
+            self.deliver(RESYNC)
+        finally:
+            await client.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """The broker named by LIVE_BROKER: a LIVE_BROKERS key or a dotted path."""
+    return import_string(settings.LIVE_BROKERS.get(settings.LIVE_BROKER, settings.LIVE_BROKER))()
+
+
+@receiver(setting_changed)
+def reset_broker(setting, **kwargs):
+    if setting in ("LIVE_BROKER", "LIVE_BROKERS", "LIVE_BROKER_URL"):
+        get_broker.cache_clear()
+
+
+def publish(event, using=DEFAULT_DB_ALIAS):
+    """
+    Publish ``event`` once the current transaction commits. ``event`` is a
+    dict with a "type", or a callable returning one, so that rolled back
+    changes cost no queries. A broker failure is logged, not raised: the
+    change itself is committed already.
+    """
+    def send():
+        get_broker().publish(event() if callable(event) else event)
+
+    transaction.on_commit(send, using=using, robust=True)
+
+
+def format_event(event):
+    """``event`` in the text/event-stream format."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
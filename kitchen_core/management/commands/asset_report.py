@@ -0,0 +1,101 @@
+import json
+import re
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+
+from kitchen_core.models import Cook
+
+# Pages rendered from each base layout: base.html, base-presentation.html
+# and base-fullscreen.html.
+PAGES = ["kitchen_core:dish-list", "kitchen_core:index", "login"]
+REFERENCE = re.compile(r'(?:href|src)="([^"]+)"')
+# File names ManifestStaticFilesStorage gave a content hash; WhiteNoise
+# serves those with a far-future immutable Cache-Control.
+HASHED = re.compile(r"\.[0-9a-f]{12}\.[^/]+$")
+
+
+def locate(path):
+    """The file served for ``path`` (relative to STATIC_URL), or None."""
+    if settings.STATIC_ROOT:
+        collected = Path(settings.STATIC_ROOT) / path
+        if collected.is_file():
+            return collected
+    found = finders.find(path)
+    return Path(found) if found else None
+
+
+def asset_sizes(path):
+    file = locate(path)
+    if file is None:
+        return {"missing": True}
+    sizes = {"raw": file.stat().st_size}
+    # WhiteNoise serves a precompressed sibling when the client accepts it.
+    for suffix, encoding in ((".br", "br"), (".gz", "gzip")):
+        compressed = file.with_name(file.name + suffix)
+        if compressed.is_file():
+            sizes[encoding] = compressed.stat().st_size
+    sizes["served"] = min(sizes.values())
+    sizes["immutable"] = bool(HASHED.search(file.name))
+    return sizes
+
+
+def page_assets(html):
+    """Paths (relative to STATIC_URL) of the local static files ``html`` links to."""
+    paths = []
+    for url in REFERENCE.findall(html):
+        path = urlsplit(url).path
+        if path.startswith(settings.STATIC_URL):
+            path = path[len(settings.STATIC_URL):]
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+class Command(BaseCommand):
+    help = (
+        "Render pages built on each base layout and report the static files "
+        "they link to: bytes on disk, bytes served (brotli or gzip when "
+        "collectstatic precompressed them) and whether the URL is "
+        "content-hashed. Prints the results as JSON; run after collectstatic "
+        "to see what production serves."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", nargs="+", default=PAGES, help="URL names to render.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        user = Cook.objects.filter(is_superuser=True).first()
+        if user is None:
+            raise CommandError("Create a superuser first; the pages are rendered as one.")
+        host = next((h for h in settings.ALLOWED_HOSTS if h and "*" not in h), "localhost").lstrip(".")
+        client = Client(SERVER_NAME=host)
+        client.force_login(user)
+
+        pages = {}
+        for name in options["pages"]:
+            response = client.get(reverse(name))
+            if response.status_code != 200:
+                raise CommandError(f"{name} returned {response.status_code}.")
+            assets = {path: asset_sizes(path) for path in page_assets(response.content.decode())}
+            found = [sizes for sizes in assets.values() if not sizes.get("missing")]
+            pages[name] = {
+                "raw_bytes": sum(sizes["raw"] for sizes in found),
+                "served_bytes": sum(sizes["served"] for sizes in found),
+                "immutable": sum(sizes["immutable"] for sizes in found),
+                "missing": len(assets) - len(found),
+                "assets": assets,
+            }
+
+        output = json.dumps({"static_root": str(settings.STATIC_ROOT or ""), "pages": pages}, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+        else:
+            self.stdout.write(output)
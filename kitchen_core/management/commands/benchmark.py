@@ -0,0 +1,159 @@
+import json
+import math
+import subprocess
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core import urls as kitchen_urls
+from kitchen_core.models import DishType, Dish, Cook
+
+# URL names that need a POST, with their form data or JSON body. Toggles
+# are called an even number of times so the database ends up unchanged.
+POST_REQUESTS = {
+    "toggle-assign-dish": {"data": {}, "toggles": True},
+    "bulk-assign": {"json": {"assignments": []}},
+}
+# URL names never requested: live/ streams for as long as it is open, and
+# export and import read or write a whole table.
+SKIPPED = {"live", "export", "import"}
+# Model whose first row fills the <pk> of URL names mentioning it, most specific first.
+SAMPLE_MODELS = [("dish-type", DishType), ("dish", Dish), ("cook", Cook)]
+ADMIN_CHANGELISTS = [
+    "admin:kitchen_core_dish_changelist",
+    "admin:kitchen_core_dishtype_changelist",
+    "admin:kitchen_core_cook_changelist",
+]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every kitchen_core URL, the admin changelists and the search "
+        "forms against the current database. Prints p50/p95 latency and query "
+        "counts as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--search", default="Chicken", help="Term used for the search forms.")
+        parser.add_argument("--exclude", nargs="*", default=[], help="Benchmark names to skip.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be positive.")
+        user = Cook.objects.filter(is_superuser=True).first()
+        if user is None:
+            raise CommandError("Create a superuser first; the benchmark logs in as one.")
+        host = next((h for h in settings.ALLOWED_HOSTS if h and "*" not in h), "localhost").lstrip(".")
+        client = Client(SERVER_NAME=host)
+        client.force_login(user)
+
+        results = {}
+        for name, url, method, payload in self.requests(options["search"]):
+            if name in options["exclude"]:
+                continue
+            results[name] = self.measure(client, url, method, payload, options)
+            if options["verbosity"] > 1:
+                self.stderr.write(f"{name}: {results[name]}")
+
+        report = {
+            "commit": self.commit(),
+            "database": connection.vendor,
+            "rows": {
+                "dish_types": DishType.objects.count(),
+                "dishes": Dish.objects.count(),
+                "cooks": Cook.objects.count(),
+            },
+            "iterations": options["iterations"],
+            "results": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+    def requests(self, term):
+        samples = {
+            prefix: model.objects.values_list("pk", flat=True).first()
+            for prefix, model in SAMPLE_MODELS
+        }
+        for pattern in kitchen_urls.urlpatterns:
+            name = pattern.name
+            if name in SKIPPED:
+                continue
+            converters = pattern.pattern.converters
+            kwargs = {}
+            if converters:
+                if set(converters) != {"pk"}:
+                    continue
+                prefix = next((p for p, _ in SAMPLE_MODELS if p in name), None)
+                sample = samples.get(prefix)
+                if sample is None:
+                    continue
+                kwargs["pk"] = sample
+            url = reverse(f"{kitchen_urls.app_name}:{name}", kwargs=kwargs)
+            if name in POST_REQUESTS:
+                yield name, url, "post", POST_REQUESTS[name]
+            else:
+                yield name, url, "get", None
+
+        for name in ADMIN_CHANGELISTS:
+            yield name, reverse(name), "get", None
+            yield f"{name} search", f"{reverse(name)}?q={term}", "get", None
+
+        for name, field in [("dish-list", "name"), ("dish-type-list", "name"), ("cook-list", "cook")]:
+            yield f"{name} search", f"{reverse(f'kitchen_core:{name}')}?{field}={term}", "get", None
+
+    def measure(self, client, url, method, payload, options):
+        def call():
+            if method == "get":
+                return client.get(url)
+            if "json" in payload:
+                return client.post(url, json.dumps(payload["json"]), content_type="application/json")
+            return client.post(url, payload["data"])
+
+        for _ in range(options["warmup"]):
+            call()
+        timings, queries = [], []
+        for _ in range(options["iterations"]):
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = call()
+                if response.streaming:
+                    for _chunk in response.streaming_content:
+                        pass
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(captured))
+        if payload and payload.get("toggles") and (options["warmup"] + options["iterations"]) % 2:
+            call()
+        return {
+            "url": url,
+            "method": method.upper(),
+            "status": response.status_code,
+            "p50_ms": round(percentile(timings, 0.5), 2),
+            "p95_ms": round(percentile(timings, 0.95), 2),
+            "queries": max(queries),
+        }
+
+    def commit(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True, text=True, check=True, cwd=settings.BASE_DIR,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
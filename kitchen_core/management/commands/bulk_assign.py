@@ -0,0 +1,48 @@
+import csv
+import sys
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kitchen_core.assignments import apply_assignments
+
+
+class Command(BaseCommand):
+    help = (
+        "Assign or unassign cooks to dishes in bulk. Reads CSV rows of "
+        "cook,dish,action (ids; action is add or remove) from a file or stdin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default="-", help="CSV file, or - for stdin.")
+        parser.add_argument(
+            "--no-header",
+            action="store_true",
+            help="The first row is data, not a cook,dish,action header.",
+        )
+
+    def handle(self, *args, **options):
+        if options["path"] == "-":
+            rows = list(csv.reader(sys.stdin))
+        else:
+            try:
+                with open(options["path"], newline="") as f:
+                    rows = list(csv.reader(f))
+            except OSError as e:
+                raise CommandError(e)
+        if rows and not options["no_header"]:
+            rows = rows[1:]
+        rows = [row for row in rows if row]
+        if any(len(row) != 3 for row in rows):
+            raise CommandError("Every row must have exactly three columns: cook,dish,action.")
+
+        items = [(cook, dish, action.strip().lower()) for cook, dish, action in rows]
+        results = apply_assignments(items)
+
+        if options["verbosity"] > 1:
+            for (cook, dish, action), result in zip(items, results):
+                self.stdout.write(f"{cook},{dish},{action},{result}")
+        summary = Counter(results)
+        self.stdout.write(self.style.SUCCESS(
+            ", ".join(f"{result}: {count}" for result, count in sorted(summary.items())) or "Nothing to do."
+        ))
@@ -0,0 +1,40 @@
+import codecs
+import json
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from kitchen_core.imports import IMPORTERS, READERS
+
+
+class Command(BaseCommand):
+    help = (
+        "Upsert dishes or cooks from a CSV or NDJSON file (or stdin) in "
+        "batches, and print a JSON report with the throughput in rows/sec."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", choices=IMPORTERS)
+        parser.add_argument("path", help='File to read, or "-" for stdin.')
+        parser.add_argument("--format", choices=READERS, help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="Validate and roll everything back.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or path.rsplit(".", 1)[-1].lower()
+        if format not in READERS:
+            raise CommandError("Pass --format csv or --format ndjson.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        importer = IMPORTERS[options["name"]](
+            batch_size=options["batch_size"], dry_run=options["dry_run"]
+        )
+        if path == "-":
+            lines = codecs.iterdecode(sys.stdin.buffer, "utf-8-sig")
+            report = importer.run(READERS[format](lines))
+        else:
+            with open(path, encoding="utf-8-sig", newline="") as f:
+                report = importer.run(READERS[format](f))
+        self.stdout.write(json.dumps(report.as_dict(), indent=2))
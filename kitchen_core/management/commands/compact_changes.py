@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from kitchen_core import changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Shrink the change log behind /changes: drop entries a later one for "
+        "the same object supersedes, and entries older than the retention "
+        "period. Clients that last synced before then must download the "
+        "catalogue again. Run it daily, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=settings.CHANGE_LOG_RETENTION_DAYS,
+            help="Keep this many days of entries (default: CHANGE_LOG_RETENTION_DAYS).",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative.")
+        before = timezone.now() - timedelta(days=options["days"])
+        superseded, expired = changes.compact(before, using=options["database"])
+        self.stdout.write(f"Removed {superseded} superseded and {expired} expired entries.")
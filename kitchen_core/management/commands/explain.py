@@ -0,0 +1,108 @@
+import re
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from kitchen_core.management.commands.benchmark import Command as BenchmarkCommand
+from kitchen_core.models import Cook
+
+# Plan lines reading a whole table, by database vendor. SQLite reports an
+# index-ordered walk as "SCAN t USING INDEX i" and only a bare "SCAN t"
+# goes through the table itself.
+SEQ_SCANS = {
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    "sqlite": re.compile(r"^\s*SCAN (\w+)$"),
+}
+
+
+def seq_scans(vendor, plan):
+    """Return the tables ``plan`` (a list of lines) scans sequentially."""
+    pattern = SEQ_SCANS[vendor]
+    tables = [match[1] for line in plan if (match := pattern.search(line))]
+    # Catalog reads come from introspection (the search backend probing
+    # for its FTS tables), not from the views.
+    return [table for table in tables if not table.startswith(("sqlite_", "pg_"))]
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+        # PostgreSQL returns one line per row, SQLite the detail last.
+        return [row[-1] for row in cursor.fetchall()]
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every kitchen_core page, the admin changelists and the search "
+        "forms, run EXPLAIN on each SELECT they issue and flag sequential "
+        "scans. Run it against production-sized data: planners prefer a "
+        "sequential scan on small tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--search", default="Chicken", help="Term used for the search forms.")
+        parser.add_argument("--exclude", nargs="*", default=[], help="Page names to skip.")
+        parser.add_argument(
+            "--fail", action="store_true",
+            help="Exit with an error if any sequential scan is found.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in SEQ_SCANS:
+            raise CommandError(f"EXPLAIN output of {connection.vendor} is not supported.")
+        user = Cook.objects.filter(is_superuser=True).first()
+        if user is None:
+            raise CommandError("Create a superuser first; the pages are requested as one.")
+        host = next((h for h in settings.ALLOWED_HOSTS if h and "*" not in h), "localhost").lstrip(".")
+        client = Client(SERVER_NAME=host)
+        client.force_login(user)
+
+        flagged = total = 0
+        # Cached fragments and counts would hide the queries behind them.
+        with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}):
+            for name, url, method, _ in BenchmarkCommand().requests(options["search"]):
+                if method != "get" or name in options["exclude"]:
+                    continue
+                queries = self.capture(client, url)
+                if queries is None:
+                    self.stdout.write(f"{name}: skipped, the response streams")
+                    continue
+                scans = []
+                for sql in queries:
+                    plan = explain(sql)
+                    tables = seq_scans(connection.vendor, plan)
+                    if tables:
+                        scans.append((sql, tables, plan))
+                    elif options["verbosity"] > 2:
+                        self.stdout.write(f"  {sql}\n    " + "\n    ".join(plan))
+                total += len(queries)
+                flagged += len(scans)
+                self.stdout.write(f"{name}: {len(queries)} queries, {len(scans)} with sequential scans")
+                for sql, tables, plan in scans:
+                    self.stdout.write(f"  Seq scan on {', '.join(tables)}: {sql}")
+                    if options["verbosity"] > 1:
+                        self.stdout.write("    " + "\n    ".join(plan))
+
+        summary = f"{flagged} of {total} queries scan a table sequentially."
+        if flagged and options["fail"]:
+            raise CommandError(summary)
+        self.stdout.write(summary)
+
+    def capture(self, client, url):
+        """The distinct SELECTs a GET of ``url`` runs, or None if it streams."""
+        with CaptureQueriesContext(connection) as captured:
+            response = client.get(url)
+        if response.streaming:
+            # Reading it would run its queries over a whole table, or wait
+            # on a live stream.
+            response.close()
+            return None
+        queries = []
+        for query in captured:
+            sql = query["sql"]
+            if sql.lstrip().upper().startswith(("SELECT", "WITH")) and sql not in queries:
+                queries.append(sql)
+        return queries
@@ -0,0 +1,33 @@
+import codecs
+
+from django.core.management.base import BaseCommand
+
+from kitchen_core.exports import EXPORTS, WRITERS, export
+
+
+class Command(BaseCommand):
+    help = (
+        "Export dishes (with dish type and cooks) or cooks (with dish counts) "
+        "as CSV or XLSX, streaming rows from the database in chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", choices=EXPORTS)
+        parser.add_argument("--format", choices=WRITERS, default="csv")
+        parser.add_argument("--output", help="File to write; CSV goes to stdout by default.")
+
+    def handle(self, *args, **options):
+        name, format = options["name"], options["format"]
+        output = options["output"]
+        if output is None and format != "csv":
+            output = f"{name}.{format}"
+        if output is None:
+            # Chunks may end in the middle of a multi-byte character.
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for chunk in export(name, format):
+                self.stdout.write(decoder.decode(chunk), ending="")
+            return
+        with open(output, "wb") as f:
+            for chunk in export(name, format):
+                f.write(chunk)
+        self.stderr.write(f"Wrote {output}")
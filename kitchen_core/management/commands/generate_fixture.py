@@ -0,0 +1,156 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from kitchen_core import changes, counters, fragments, stats
+from kitchen_core.models import DishType, Dish, Cook
+
+DISH_TYPES = [
+    "Soup", "Salad", "Starter", "Main Course", "Side", "Dessert", "Pastry",
+    "Grill", "Pasta", "Pizza", "Seafood", "Breakfast", "Sauce", "Drink",
+]
+ADJECTIVES = [
+    "Smoked", "Roasted", "Spicy", "Creamy", "Grilled", "Braised", "Crispy",
+    "Glazed", "Stuffed", "Pickled", "Fried", "Baked", "Steamed", "Honey",
+]
+INGREDIENTS = [
+    "Chicken", "Beef", "Salmon", "Mushroom", "Potato", "Pumpkin", "Beetroot",
+    "Duck", "Lamb", "Cabbage", "Shrimp", "Cheese", "Apple", "Cherry",
+]
+DISHES = [
+    "Varenyky", "Borscht", "Pie", "Stew", "Risotto", "Dumplings", "Pancakes",
+    "Burger", "Tart", "Ragout", "Salad", "Soup", "Cutlets", "Casserole",
+]
+FIRST_NAMES = [
+    "Anna", "Oleh", "Maria", "Taras", "Iryna", "Andrii", "Olena", "Dmytro",
+    "Sofia", "Mark", "Vanessa", "John", "Yulia", "Bohdan", "Kateryna",
+]
+LAST_NAMES = [
+    "Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko",
+    "Melnyk", "Boyko", "Moroz", "Lysenko", "Doe", "Smith", "Teikoku",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic catalogue (dish types, dishes, cooks and "
+        "assignments) with batched bulk_create, for benchmarking."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dish-types", type=int, default=50)
+        parser.add_argument("--dishes", type=int, default=10_000)
+        parser.add_argument("--cooks", type=int, default=500)
+        parser.add_argument(
+            "--assignments",
+            type=int,
+            default=20_000,
+            help="Number of distinct cook-dish pairs to create.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument(
+            "--password",
+            default="benchmark",
+            help="Password set on every generated cook.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+        if options["assignments"] and not (options["dishes"] and options["cooks"]):
+            raise CommandError("Assignments need at least one dish and one cook.")
+        if options["dishes"] and not options["dish_types"]:
+            raise CommandError("Dishes need at least one dish type.")
+        if options["assignments"] > options["dishes"] * options["cooks"]:
+            raise CommandError("More assignments requested than cook-dish pairs exist.")
+        rng = random.Random(options["seed"])
+        self.verbosity = options["verbosity"]
+        started = time.perf_counter()
+
+        dish_type_ids = self.create(
+            DishType,
+            (DishType(name=f"{rng.choice(DISH_TYPES)} {i}") for i in range(options["dish_types"])),
+            options["dish_types"],
+            batch_size,
+        )
+        dish_ids = self.create(
+            Dish,
+            (
+                Dish(
+                    name=f"{rng.choice(ADJECTIVES)} {rng.choice(INGREDIENTS)} {rng.choice(DISHES)}",
+                    description=f"Synthetic dish #{i}",
+                    price=Decimal(rng.randint(100, 99_999)) / 100,
+                    dish_type_id=rng.choice(dish_type_ids),
+                )
+                for i in range(options["dishes"])
+            ),
+            options["dishes"],
+            batch_size,
+        )
+        # Hashing once keeps cook creation cheap; every cook gets the same password.
+        password = make_password(options["password"])
+        offset = Cook.objects.count()
+        cook_ids = self.create(
+            Cook,
+            (
+                Cook(
+                    username=f"cook_{offset + i}",
+                    password=password,
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=rng.choice(LAST_NAMES),
+                    years_of_experience=rng.randint(0, 30),
+                )
+                for i in range(options["cooks"])
+            ),
+            options["cooks"],
+            batch_size,
+        )
+
+        pairs = set()
+        while len(pairs) < options["assignments"]:
+            pairs.add((rng.choice(cook_ids), rng.choice(dish_ids)))
+        through = Dish.cooks.through
+        self.create(
+            through,
+            (through(cook_id=cook_id, dish_id=dish_id) for cook_id, dish_id in pairs),
+            len(pairs),
+            batch_size,
+            ignore_conflicts=True,
+        )
+
+        # bulk_create bypasses the signals that keep these current.
+        stats.rebuild()
+        changes.truncate()
+        counters.invalidate(DishType, Dish, Cook, through)
+        fragments.bump(DishType, Dish, Cook, through)
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(dish_type_ids)} dish types, {len(dish_ids)} dishes, "
+            f"{len(cook_ids)} cooks and {len(pairs)} assignments "
+            f"in {time.perf_counter() - started:.1f}s."
+        ))
+
+    def create(self, model, objects, total, batch_size, ignore_conflicts=False):
+        ids, batch, done = [], [], 0
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) == batch_size:
+                done += self.flush(model, batch, ids, ignore_conflicts)
+                batch = []
+                if self.verbosity > 1:
+                    self.stdout.write(f"{model._meta.verbose_name_plural}: {done}/{total}")
+        if batch:
+            done += self.flush(model, batch, ids, ignore_conflicts)
+        return ids
+
+    def flush(self, model, batch, ids, ignore_conflicts):
+        with transaction.atomic():
+            created = model.objects.bulk_create(batch, ignore_conflicts=ignore_conflicts)
+        if not ignore_conflicts:
+            ids.extend(obj.pk for obj in created)
+        return len(batch)
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from kitchen_core import fragments, stats
+from kitchen_core.models import DishType, Dish, Cook
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored per-cook, per-dish and per-dish-type aggregates "
+        "from scratch, e.g. after raw SQL, QuerySet.update() or loaddata."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        with transaction.atomic(using=options["database"]):
+            updated = stats.rebuild(using=options["database"])
+        fragments.bump(DishType, Dish, Cook)
+        for name, rows in updated.items():
+            self.stdout.write(f"Rebuilt {rows} {name.replace('_', ' ')}.")
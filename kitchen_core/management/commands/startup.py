@@ -0,0 +1,137 @@
+import json
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from kitchen_core.management.commands.benchmark import Command as BenchmarkCommand, percentile
+from kitchen_core.management.commands.throughput import Server, fetch
+
+# GUNICORN_PRELOAD value per mode (read by gunicorn.conf.py).
+MODES = {"preload": "true", "lazy": "false"}
+
+# Loads the WSGI app the way a gunicorn worker does and reports timings.
+IMPORT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+loaded = time.perf_counter() - start
+from kitchen_core.warmup import warm_up
+print(json.dumps({"import_seconds": loaded, "warm_up": warm_up()}))
+"""
+
+
+def memory(pid):
+    """RSS and PSS (resident memory with shared pages split between their users) in MiB."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[f"{key.lower()}_mb"] = round(int(rest.split()[0]) / 1024, 1)
+    return values
+
+
+def children(pid):
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how long loading the app takes and how much memory gunicorn "
+        "workers use, with and without preloading the app in the master "
+        "(see gunicorn.conf.py). Prints the results as JSON. Needs Linux."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--repeat", type=int, default=3, help="App loads timed in a fresh process.")
+        parser.add_argument("--path", default="/accounts/login/", help="Page requested once ready.")
+        parser.add_argument("--requests", type=int, default=50, help="Requests sent before sampling memory.")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1 or options["repeat"] < 1:
+            raise CommandError("--workers and --repeat must be positive.")
+        try:
+            memory("self")
+        except OSError:
+            raise CommandError("Reading worker memory needs /proc/<pid>/smaps_rollup (Linux 4.14+).")
+
+        report = {
+            "commit": BenchmarkCommand().commit(),
+            "database": connection.vendor,
+            "workers": options["workers"],
+            "app_load": self.measure_import(options["repeat"]),
+            "results": {},
+        }
+        for mode in options["modes"]:
+            report["results"][mode] = self.measure(mode, options)
+            if options["verbosity"] > 1:
+                self.stderr.write(f"{mode}: {report['results'][mode]}")
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+    def measure_import(self, repeat):
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT],
+                capture_output=True, text=True, cwd=settings.BASE_DIR,
+            )
+            if result.returncode:
+                raise CommandError(f"Loading the app failed:\n{result.stderr}")
+            run = json.loads(result.stdout.splitlines()[-1])
+            run["process_seconds"] = time.perf_counter() - start
+            runs.append(run)
+        median = lambda values: round(percentile(values, 0.5) * 1000, 1)  # noqa: E731
+        return {
+            "process_ms": median([run["process_seconds"] for run in runs]),
+            "import_ms": median([run["import_seconds"] for run in runs]),
+            "warm_up_ms": {
+                step: median([run["warm_up"][step] for run in runs]) for step in runs[0]["warm_up"]
+            },
+        }
+
+    def measure(self, mode, options):
+        host, port = "127.0.0.1", options["port"]
+        start = time.perf_counter()
+        with Server("wsgi", port, options["workers"], env={"GUNICORN_PRELOAD": MODES[mode]}) as server:
+            status = None
+            while status != 200:
+                try:
+                    status, _ = fetch(host, port, options["path"], "")
+                except OSError:
+                    time.sleep(0.05)
+                    continue
+                if time.perf_counter() - start > 60:
+                    raise CommandError(f"{options['path']} did not return 200 within a minute.")
+            first_response = time.perf_counter() - start
+            for _ in range(options["requests"]):
+                fetch(host, port, options["path"], "")
+            # The first response may come before every worker is forked.
+            while len(children(server.process.pid)) < options["workers"]:
+                if time.perf_counter() - start > 60:
+                    raise CommandError("Not every worker started within a minute.")
+                time.sleep(0.05)
+
+            master = memory(server.process.pid)
+            workers = [memory(pid) for pid in children(server.process.pid)]
+        return {
+            "first_response_ms": round(first_response * 1000, 1),
+            "master": master,
+            "workers": workers,
+            "worker_pss_mb": round(sum(worker["pss_mb"] for worker in workers), 1),
+        }
@@ -0,0 +1,181 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+
+from kitchen_core import pooling
+from kitchen_core.management.commands.benchmark import Command as BenchmarkCommand, percentile
+from kitchen_core.models import Cook
+
+# How each mode is served: gunicorn arguments and extra environment.
+MODES = {
+    "wsgi": (["Restaurant_kitchen_service.wsgi"], {}),
+    "asgi": (
+        ["Restaurant_kitchen_service.asgi", "-k", "uvicorn_worker.UvicornWorker"],
+        {"ASYNC_VIEWS": "true"},
+    ),
+}
+
+
+def fetch(host, port, path, cookie, delay=0.0):
+    """
+    GET ``path`` over a fresh connection, pausing ``delay`` seconds halfway
+    through the request headers like a client on a slow network. Returns
+    the status code and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    with socket.create_connection((host, port), timeout=60) as sock:
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n".encode())
+        if delay:
+            time.sleep(delay)
+        sock.sendall(f"Cookie: {cookie}\r\nConnection: close\r\n\r\n".encode())
+        chunks = []
+        while data := sock.recv(65536):
+            chunks.append(data)
+    status_line = b"".join(chunks).split(b"\r\n", 1)[0]
+    return int(status_line.split()[1]), time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the project with gunicorn in WSGI mode (sync workers) and ASGI "
+        "mode (uvicorn workers, ASYNC_VIEWS on) and compare how many requests "
+        "per second each sustains for many concurrent, slow clients. With "
+        "--pooling, each mode is also run per PostgreSQL connection reuse "
+        "mode (POSTGRES_POOL). Prints the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+        parser.add_argument(
+            "--pooling", nargs="+", choices=pooling.MODES, default=[],
+            help="POSTGRES_POOL values to compare (PostgreSQL, prod settings).",
+        )
+        parser.add_argument("--path", default="/dish/", help="Page every client requests.")
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--workers", type=int, default=1, help="gunicorn workers per mode.")
+        parser.add_argument(
+            "--client-delay", type=float, default=0.05,
+            help="Seconds each client stalls while sending its request.",
+        )
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be positive.")
+        if options["pooling"] and connection.vendor != "postgresql":
+            raise CommandError("--pooling needs PostgreSQL.")
+        user = Cook.objects.filter(is_superuser=True).first()
+        if user is None:
+            raise CommandError("Create a superuser first; the benchmark logs in as one.")
+        client = Client()
+        client.force_login(user)
+        session = client.cookies[settings.SESSION_COOKIE_NAME]
+        cookie = f"{session.key}={session.value}"
+
+        results = {}
+        for mode in options["modes"]:
+            for pool_mode in options["pooling"] or [None]:
+                name = f"{mode} {pool_mode}" if pool_mode else mode
+                env = {"POSTGRES_POOL": pool_mode} if pool_mode else {}
+                with Server(mode, options["port"], options["workers"], env=env):
+                    results[name] = self.measure(cookie, options)
+                if options["verbosity"] > 1:
+                    self.stderr.write(f"{name}: {results[name]}")
+
+        report = {
+            "commit": BenchmarkCommand().commit(),
+            "database": connection.vendor,
+            "path": options["path"],
+            "requests": options["requests"],
+            "concurrency": options["concurrency"],
+            "workers": options["workers"],
+            "client_delay": options["client_delay"],
+            "results": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+    def measure(self, cookie, options):
+        host, port = "127.0.0.1", options["port"]
+
+        def call(_):
+            try:
+                return fetch(host, port, options["path"], cookie, options["client_delay"])
+            except OSError:
+                return None, None
+
+        call(None)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(options["concurrency"]) as pool:
+            responses = list(pool.map(call, range(options["requests"])))
+        elapsed = time.perf_counter() - start
+        timings = [seconds * 1000 for status, seconds in responses if status == 200]
+        return {
+            "requests_per_second": round(len(timings) / elapsed, 1),
+            "errors": len(responses) - len(timings),
+            "p50_ms": round(percentile(timings, 0.5), 2) if timings else None,
+            "p95_ms": round(percentile(timings, 0.95), 2) if timings else None,
+        }
+
+
+class Server:
+    """Run gunicorn for ``mode`` until the block exits."""
+
+    def __init__(self, mode, port, workers, env=None):
+        self.mode = mode
+        self.port = port
+        self.workers = workers
+        self.env = env or {}
+
+    def __enter__(self):
+        app, env = MODES[self.mode]
+        # A file rather than a pipe: nobody reads the log while serving.
+        self.log = tempfile.TemporaryFile("w+")
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "gunicorn", *app,
+                "--workers", str(self.workers),
+                "--bind", f"127.0.0.1:{self.port}",
+                "--log-level", "warning",
+            ],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, **env, **self.env},
+            stderr=self.log,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self.log.seek(0)
+                raise CommandError(f"{self.mode} server exited:\n{self.log.read()}")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+                return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise CommandError(f"{self.mode} server did not start listening on port {self.port}.")
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.log.close()
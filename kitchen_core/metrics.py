@@ -0,0 +1,86 @@
+import threading
+from bisect import bisect_left
+
+# Upper bounds (seconds) of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class ViewStats:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.render_seconds = 0.0
+        self.latency_seconds = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+class MetricsRegistry:
+    """
+    Per-view request metrics, aggregated in process memory. Every gunicorn
+    worker keeps its own registry, so a scrape reports the worker that
+    served it; scrape each worker (or run one) for complete numbers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view, queries, sql_seconds, render_seconds, latency_seconds):
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = ViewStats()
+            stats.requests += 1
+            stats.queries += queries
+            stats.sql_seconds += sql_seconds
+            stats.render_seconds += render_seconds
+            stats.latency_seconds += latency_seconds
+            stats.latency_buckets[bisect_left(LATENCY_BUCKETS, latency_seconds)] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {view: vars(stats).copy() for view, stats in self._views.items()}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+    def render_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        views = sorted(self.snapshot().items())
+        lines = []
+
+        def family(name, kind, help_text, key):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for view, stats in views:
+                lines.append(f'{name}{{view="{_escape(view)}"}} {stats[key]}')
+
+        family("kitchen_requests_total", "counter", "Requests served.", "requests")
+        family("kitchen_db_queries_total", "counter", "SQL queries executed.", "queries")
+        family("kitchen_db_seconds_total", "counter", "Time spent in SQL queries.", "sql_seconds")
+        family(
+            "kitchen_template_render_seconds_total", "counter",
+            "Time spent rendering TemplateResponses.", "render_seconds",
+        )
+
+        name = "kitchen_request_duration_seconds"
+        lines.append(f"# HELP {name} Request latency.")
+        lines.append(f"# TYPE {name} histogram")
+        for view, stats in views:
+            label = _escape(view)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), stats["latency_buckets"]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{view="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{view="{label}"}} {stats["latency_seconds"]}')
+            lines.append(f'{name}_count{{view="{label}"}} {stats["requests"]}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
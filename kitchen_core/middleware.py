@@ -0,0 +1,136 @@
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware as BaseWhiteNoiseMiddleware
+
+from kitchen_core import replicas
+from kitchen_core.metrics import registry
+
+
+class QueryMetricsMiddleware:
+    """
+    Record SQL query count, SQL time, template render time and total latency
+    per URL name. The numbers are added to the response as a
+    ``Server-Timing`` header and aggregated for the ``/metrics`` endpoint.
+
+    Requests that don't resolve to a view (static files, 404s) are skipped.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timing = _RequestTiming()
+        request._kitchen_timing = timing
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timing.execute))
+            response = self.get_response(request)
+        latency = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return response
+        registry.record(
+            match.view_name,
+            timing.queries,
+            timing.sql_seconds,
+            timing.render_seconds,
+            latency,
+        )
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={timing.sql_seconds * 1000:.1f};desc="{timing.queries} queries"',
+            f"render;dur={timing.render_seconds * 1000:.1f}",
+            f"total;dur={latency * 1000:.1f}",
+        ])
+        return response
+
+    def process_template_response(self, request, response):
+        # TemplateResponses are rendered right after the template response
+        # middleware has run; time it up to the post-render callback.
+        timing = request._kitchen_timing
+        timing.render_started = time.perf_counter()
+        response.add_post_render_callback(timing.rendered)
+        return response
+
+
+class _RequestTiming:
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.render_seconds = 0.0
+        self.render_started = None
+
+    def execute(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - start
+            self.queries += 1
+
+    def rendered(self, response):
+        self.render_seconds += time.perf_counter() - self.render_started
+
+
+class ReplicaMiddleware:
+    """
+    Serve GET and HEAD requests to views marked with
+    ``kitchen_core.replicas.read_only`` from one of ``DATABASE_REPLICAS``.
+    A request with any other method writes, so the browser reads from the
+    primary for ``REPLICA_STICKY_SECONDS`` afterwards and sees its change.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with replicas.routing() as request._replica_routing:
+            response = self.get_response(request)
+        return replicas.stick_to_primary(request, response)
+
+    async def __acall__(self, request):
+        with replicas.routing() as request._replica_routing:
+            response = await self.get_response(request)
+        return replicas.stick_to_primary(request, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._replica_routing.replica = replicas.choose_replica(request, view_func)
+
+
+class WhiteNoiseMiddleware(BaseWhiteNoiseMiddleware):
+    """
+    WhiteNoise that doesn't force the rest of the middleware chain into
+    sync mode under ASGI: only the static file itself is served from a
+    thread, other requests reach the (async) views directly.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
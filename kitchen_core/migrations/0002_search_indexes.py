@@ -0,0 +1,45 @@
+from django.db import migrations
+
+from kitchen_core.search import install_sqlite_fts, uninstall_sqlite_fts
+
+TRIGRAM_INDEXES = [
+    ("kitchen_core_dishtype_name_trgm", "kitchen_core_dishtype", "name"),
+    ("kitchen_core_dish_name_trgm", "kitchen_core_dish", "name"),
+    ("kitchen_core_cook_first_name_trgm", "kitchen_core_cook", "first_name"),
+    ("kitchen_core_cook_last_name_trgm", "kitchen_core_cook", "last_name"),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in TRIGRAM_INDEXES:
+            schema_editor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+    elif connection.vendor == "sqlite":
+        install_sqlite_fts(connection)
+
+
+def drop_search_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        for name, table, column in TRIGRAM_INDEXES:
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    elif connection.vendor == "sqlite":
+        uninstall_sqlite_fts(connection)
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('kitchen_core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0002_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cook',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='dish',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='dishtype',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
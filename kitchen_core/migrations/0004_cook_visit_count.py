@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0003_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cook',
+            name='visit_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('kitchen_core', '0004_cook_visit_count'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='cook',
+            options={'ordering': ('years_of_experience', 'id')},
+        ),
+        migrations.AlterModelOptions(
+            name='dish',
+            options={'ordering': ('name', 'id')},
+        ),
+        migrations.AlterModelOptions(
+            name='dishtype',
+            options={'ordering': ('name', 'id')},
+        ),
+        migrations.AlterField(
+            model_name='dish',
+            name='dish_type',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='dishes', to='kitchen_core.dishtype'),
+        ),
+        migrations.AddIndex(
+            model_name='cook',
+            index=models.Index(fields=['years_of_experience', 'id'], name='cook_experience_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['name', 'id'], name='dish_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dish',
+            index=models.Index(fields=['dish_type', 'name', 'id'], name='dish_type_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dishtype',
+            index=models.Index(fields=['name', 'id'], name='dishtype_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:30
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, IntegerField, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def rebuild_stats(apps, schema_editor):
+    # A copy of kitchen_core.stats.rebuild() as of this migration, on the
+    # historical models.
+    using = schema_editor.connection.alias
+    DishType = apps.get_model("kitchen_core", "DishType")
+    Dish = apps.get_model("kitchen_core", "Dish")
+    Cook = apps.get_model("kitchen_core", "Cook")
+    Assignment = Dish._meta.get_field("cooks").remote_field.through
+
+    def aggregate(queryset, group_by, expression):
+        return Subquery(queryset.values(group_by).annotate(value=expression).values("value"))
+
+    def count(queryset, group_by, expression="*", distinct=False):
+        return Coalesce(
+            aggregate(queryset, group_by, Count(expression, distinct=distinct)),
+            0,
+            output_field=IntegerField(),
+        )
+
+    Cook._default_manager.using(using).update(
+        dish_count=count(Assignment.objects.filter(cook_id=OuterRef("pk")), "cook_id"),
+    )
+    Dish._default_manager.using(using).update(
+        cook_count=count(Assignment.objects.filter(dish_id=OuterRef("pk")), "dish_id"),
+    )
+    dishes = Dish._default_manager.filter(dish_type_id=OuterRef("pk"))
+    assignments = Assignment.objects.filter(dish__dish_type_id=OuterRef("pk"))
+    DishType._default_manager.using(using).update(
+        dish_count=count(dishes, "dish_type_id"),
+        cook_count=count(assignments, "dish__dish_type_id", "cook_id", distinct=True),
+        price_min=aggregate(dishes, "dish_type_id", Min("price")),
+        price_avg=aggregate(dishes, "dish_type_id", Avg("price")),
+        price_max=aggregate(dishes, "dish_type_id", Max("price")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0005_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cook',
+            name='dish_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dish',
+            name='cook_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dishtype',
+            name='cook_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dishtype',
+            name='dish_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='dishtype',
+            name='price_avg',
+            field=models.DecimalField(decimal_places=2, editable=False, max_digits=7, null=True),
+        ),
+        migrations.AddField(
+            model_name='dishtype',
+            name='price_max',
+            field=models.DecimalField(decimal_places=2, editable=False, max_digits=7, null=True),
+        ),
+        migrations.AddField(
+            model_name='dishtype',
+            name='price_min',
+            field=models.DecimalField(decimal_places=2, editable=False, max_digits=7, null=True),
+        ),
+        migrations.RunPython(rebuild_stats, migrations.RunPython.noop),
+    ]
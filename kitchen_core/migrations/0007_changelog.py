@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:46
+
+from django.db import migrations, models
+
+
+def start_log(apps, schema_editor):
+    # Rows that exist already were never logged: clients start from a
+    # token taken before reading the catalogue, never from nothing.
+    ChangeLogEntry = apps.get_model("kitchen_core", "ChangeLogEntry")
+    ChangeLogEntry.objects.using(schema_editor.connection.alias).create(
+        model="", object_id=0, action="truncated"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0006_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('related_id', models.BigIntegerField(default=0)),
+                ('action', models.CharField(max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['model', 'object_id', 'related_id', 'id'], name='changelog_object_idx')],
+            },
+        ),
+        migrations.RunPython(start_log, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0007_changelog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CookSearchIndex',
+            fields=[
+                ('rank', models.FloatField()),
+                ('cook', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('match', models.TextField(db_column='kitchen_core_cook_fts')),
+            ],
+            options={
+                'db_table': 'kitchen_core_cook_fts',
+                'abstract': False,
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='DishSearchIndex',
+            fields=[
+                ('rank', models.FloatField()),
+                ('dish', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='kitchen_core.dish')),
+                ('match', models.TextField(db_column='kitchen_core_dish_fts')),
+            ],
+            options={
+                'db_table': 'kitchen_core_dish_fts',
+                'abstract': False,
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='DishTypeSearchIndex',
+            fields=[
+                ('rank', models.FloatField()),
+                ('dish_type', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='kitchen_core.dishtype')),
+                ('match', models.TextField(db_column='kitchen_core_dishtype_fts')),
+            ],
+            options={
+                'db_table': 'kitchen_core_dishtype_fts',
+                'abstract': False,
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0009_updated_at_db_default'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='dishsearchindex',
+            name='dish',
+        ),
+        migrations.RemoveField(
+            model_name='dishtypesearchindex',
+            name='dish_type',
+        ),
+        migrations.DeleteModel(
+            name='CookSearchIndex',
+        ),
+        migrations.DeleteModel(
+            name='DishSearchIndex',
+        ),
+        migrations.DeleteModel(
+            name='DishTypeSearchIndex',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:27
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_price_sum(apps, schema_editor):
+    DishType = apps.get_model("kitchen_core", "DishType")
+    Dish = apps.get_model("kitchen_core", "Dish")
+    dishes = Dish._default_manager.filter(dish_type_id=OuterRef("pk"))
+    DishType._default_manager.using(schema_editor.connection.alias).update(
+        price_sum=Coalesce(
+            Subquery(dishes.values("dish_type_id").annotate(value=Sum("price")).values("value")),
+            Value(0),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kitchen_core', '0010_remove_search_index_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dishtype',
+            name='price_sum',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=12),
+        ),
+        migrations.RunPython(fill_price_sum, migrations.RunPython.noop),
+    ]
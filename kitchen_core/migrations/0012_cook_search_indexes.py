@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# The admin's cook search matches usernames and emails with icontains,
+# which PostgreSQL runs as UPPER(column::text) LIKE UPPER('%term%'); the
+# indexes are on that expression so the planner can use them.
+TRIGRAM_INDEXES = [
+    ("kitchen_core_cook_username_trgm", "kitchen_core_cook", "username"),
+    ("kitchen_core_cook_email_trgm", "kitchen_core_cook", "email"),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('kitchen_core', '0011_dishtype_price_sum'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
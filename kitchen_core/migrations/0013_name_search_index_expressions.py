@@ -0,0 +1,43 @@
+from django.db import migrations
+
+# 0002 indexed the plain columns, but icontains compares
+# UPPER(column::text) on PostgreSQL, so the planner never used them.
+# Rebuild them on that expression, as 0012 does for the cook search.
+TRIGRAM_INDEXES = [
+    ("kitchen_core_dishtype_name_trgm", "kitchen_core_dishtype", "name"),
+    ("kitchen_core_dish_name_trgm", "kitchen_core_dish", "name"),
+    ("kitchen_core_cook_first_name_trgm", "kitchen_core_cook", "first_name"),
+    ("kitchen_core_cook_last_name_trgm", "kitchen_core_cook", "last_name"),
+]
+
+
+def rebuild_indexes(schema_editor, expression):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY {name} "
+            f"ON {table} USING gin (({expression.format(column)}) gin_trgm_ops)"
+        )
+
+
+def index_upper(apps, schema_editor):
+    rebuild_indexes(schema_editor, "UPPER({}::text)")
+
+
+def index_columns(apps, schema_editor):
+    rebuild_indexes(schema_editor, "{}")
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('kitchen_core', '0012_cook_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(index_upper, index_columns),
+    ]
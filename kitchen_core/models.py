@@ -1,29 +1,71 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Now
 from django.urls import reverse
 from django.conf import settings
 
 
-class DishType(models.Model):
+class StoredAggregatesMixin:
+    """
+    Leave ``aggregate_fields``, which are updated in place with F()
+    deltas, out of save() on existing rows so a stale instance can't
+    overwrite them.
+    """
+    aggregate_fields = ()
+
+    def save(self, *args, update_fields=None, **kwargs):
+        if update_fields is None and not self._state.adding and not kwargs.get("force_insert"):
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.aggregate_fields
+            ]
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+
+class DishType(StoredAggregatesMixin, models.Model):
+    aggregate_fields = ("dish_count", "cook_count", "price_min", "price_avg", "price_max", "price_sum")
+
     name = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+    # Aggregates over the type's dishes, maintained by kitchen_core.stats.
+    dish_count = models.PositiveIntegerField(default=0, editable=False)
+    cook_count = models.PositiveIntegerField(default=0, editable=False)
+    price_min = models.DecimalField(decimal_places=2, max_digits=7, null=True, editable=False)
+    price_avg = models.DecimalField(decimal_places=2, max_digits=7, null=True, editable=False)
+    price_max = models.DecimalField(decimal_places=2, max_digits=7, null=True, editable=False)
+    # Kept so price_avg can be updated incrementally.
+    price_sum = models.DecimalField(decimal_places=2, max_digits=12, default=0, editable=False)
 
     def __str__(self):
         return self.name
 
     class Meta:
-        ordering = ('name', )
+        ordering = ('name', 'id')
+        indexes = [
+            models.Index(fields=['name', 'id'], name='dishtype_name_id_idx'),
+        ]
+
+class Cook(StoredAggregatesMixin, AbstractUser):
+    aggregate_fields = ("visit_count", "dish_count")
 
-class Cook(AbstractUser):
     years_of_experience = models.IntegerField(null=True, blank=True)
+    visit_count = models.PositiveIntegerField(default=0, editable=False)
+    dish_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     class Meta:
-        ordering = ('years_of_experience', )
+        ordering = ('years_of_experience', 'id')
+        indexes = [
+            models.Index(fields=['years_of_experience', 'id'], name='cook_experience_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.username}: {self.first_name} {self.last_name}"
 
 
-class Dish(models.Model):
+class Dish(StoredAggregatesMixin, models.Model):
+    aggregate_fields = ("cook_count",)
+
     name = models.CharField(max_length=255)
     description = models.TextField()
     price = models.DecimalField(decimal_places=2, max_digits=7)
@@ -31,20 +73,52 @@ class Dish(models.Model):
         DishType,
         on_delete=models.CASCADE,
         related_name="dishes",
+        # Covered by the (dish_type, name, id) index below.
+        db_index=False,
     )
     cooks = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name="dishes")
+    cook_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     def __str__(self):
         return self.name
 
     class Meta:
-        ordering = ('name', )
+        ordering = ('name', 'id')
+        indexes = [
+            models.Index(fields=['name', 'id'], name='dish_name_id_idx'),
+            models.Index(fields=['dish_type', 'name', 'id'], name='dish_type_name_id_idx'),
+        ]
 
 
     def get_absolute_url(self):
         return reverse("kitchen_core:dish-detail", args=[str(self.id)])
 
 
+class ChangeLogEntry(models.Model):
+    """
+    One insert, update or delete of a dish type, dish, cook or assignment,
+    written by kitchen_core.changes. The id is the token clients follow the
+    log with (/changes?since=).
+    """
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+    # Left by compaction in place of the entries it expired.
+    TRUNCATED = "truncated"
+
+    model = models.CharField(max_length=20)
+    object_id = models.BigIntegerField()
+    # The cook of an assignment (whose object_id is the dish); 0 otherwise.
+    related_id = models.BigIntegerField(default=0)
+    action = models.CharField(max_length=10)
+    created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Finds the entries a later one for the same object supersedes.
+            models.Index(fields=['model', 'object_id', 'related_id', 'id'], name='changelog_object_idx'),
+        ]
 
-
+    def __str__(self):
+        return f"{self.pk}: {self.action} {self.model} {self.object_id}"
@@ -0,0 +1,182 @@
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db import connections
+from django.db.models import F, Q
+from django.http import Http404
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class CursorPage:
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<CursorPage of {len(self.object_list)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator: pages are addressed by the ordering values of their
+    boundary rows instead of an OFFSET, so page N costs the same as page 1
+    and no COUNT(*) is needed.
+
+    The ordering is the model's ``Meta.ordering`` with ``pk`` appended as the
+    tie-breaker. NULLs sort where the database puts them by default (first
+    on SQLite and MySQL, last on PostgreSQL and Oracle), so the ORDER BY is
+    served by a plain index on the ordering columns.
+    """
+
+    def __init__(self, queryset, per_page, ordering=None):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        if ordering is None:
+            ordering = queryset.model._meta.ordering
+        self.fields = [field for field in ordering if field not in ("pk", "id")] + ["pk"]
+        for field in self.fields:
+            if field.startswith("-"):
+                raise ValueError("CursorPaginator supports ascending orderings only.")
+
+    @staticmethod
+    def encode_cursor(values, direction):
+        payload = json.dumps([direction, values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            direction, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (TypeError, ValueError):
+            raise InvalidCursor("Invalid cursor.")
+        if direction not in ("n", "p") or not isinstance(values, list) or len(values) != len(self.fields):
+            raise InvalidCursor("Invalid cursor.")
+        return direction, values
+
+    def _position(self, obj):
+        return [getattr(obj, "pk" if field == "pk" else field) for field in self.fields]
+
+    def _order_by(self, reverse):
+        if reverse:
+            return [F(field).desc() for field in self.fields]
+        return [F(field).asc() for field in self.fields]
+
+    def _after(self, values, reverse=False):
+        """Filter matching rows strictly after ``values`` (or before, if reversed)."""
+        nulls_last = connections[self.queryset.db].vendor in ("postgresql", "oracle")
+        # Whether this walk heads towards the end where the NULLs are.
+        towards_nulls = reverse != nulls_last
+        condition = Q()
+        for index in range(len(self.fields) - 1, -1, -1):
+            field, value = self.fields[index], values[index]
+            if value is None:
+                # Past a NULL lies either nothing or every non-NULL value.
+                step = Q(pk__in=[]) if towards_nulls else Q(**{f"{field}__isnull": False})
+            else:
+                lookup = "lt" if reverse else "gt"
+                step = Q(**{f"{field}__{lookup}": value})
+                if towards_nulls and self.queryset.model._meta.get_field(
+                    "id" if field == "pk" else field
+                ).null:
+                    step |= Q(**{f"{field}__isnull": True})
+            if index < len(self.fields) - 1:
+                equal = Q(**{f"{field}__isnull": True}) if value is None else Q(**{field: value})
+                step |= equal & condition
+            condition = step
+        return condition
+
+    def _page_queryset(self, cursor):
+        direction, values = ("n", None) if not cursor else self.decode_cursor(cursor)
+        reverse = direction == "p"
+
+        queryset = self.queryset.order_by(*self._order_by(reverse))
+        if values is not None:
+            try:
+                queryset = queryset.filter(self._after(values, reverse))
+            except (TypeError, ValueError, ValidationError):
+                raise InvalidCursor("Invalid cursor.")
+        return queryset[:self.per_page + 1], values, reverse
+
+    def page(self, cursor=None):
+        queryset, values, reverse = self._page_queryset(cursor)
+        return self._page(list(queryset), values, reverse)
+
+    async def apage(self, cursor=None):
+        queryset, values, reverse = self._page_queryset(cursor)
+        return self._page([obj async for obj in queryset], values, reverse)
+
+    def _page(self, object_list, values, reverse):
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if reverse:
+            object_list.reverse()
+
+        # Walking forward there is more ahead only if the extra row was
+        # fetched, and always something behind the cursor; backwards it is
+        # the other way round.
+        more_ahead = has_more if not reverse else values is not None
+        more_behind = has_more if reverse else values is not None
+
+        next_cursor = previous_cursor = None
+        if object_list:
+            if more_ahead:
+                next_cursor = self.encode_cursor(self._position(object_list[-1]), "n")
+            if more_behind:
+                previous_cursor = self.encode_cursor(self._position(object_list[0]), "p")
+        return CursorPage(object_list, self, next_cursor, previous_cursor)
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset pagination for ``ListView``. Enabled per view with
+    ``cursor_pagination = True`` or globally with ``CURSOR_PAGINATION``;
+    otherwise the regular page-number pagination is used.
+    """
+    cursor_pagination = None
+    cursor_kwarg = "cursor"
+
+    def use_cursor_pagination(self):
+        if self.cursor_pagination is None:
+            return settings.CURSOR_PAGINATION
+        return self.cursor_pagination
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["cursor_pagination"] = self.use_cursor_pagination()
+        return context
@@ -0,0 +1,77 @@
+import threading
+from collections import Counter
+
+from django.db import connections
+
+# POSTGRES_POOL values (settings/prod.py)
+MODES = ("none", "persistent", "pool")
+# psycopg_pool statistics that go up and down; the rest only accumulate.
+POOL_GAUGES = {"pool_min", "pool_max", "pool_size", "pool_available", "requests_waiting"}
+
+# Connections Django opened per database alias in this process: new server
+# connections, or checkouts from the pool when pooling.
+_connects = Counter()
+_lock = threading.Lock()
+
+
+def connected(sender, connection, **kwargs):
+    """connection_created receiver."""
+    with _lock:
+        _connects[connection.alias] += 1
+
+
+def mode(connection):
+    """How ``connection`` is reused: "pool", "persistent" or "none"."""
+    if connection.settings_dict["OPTIONS"].get("pool"):
+        return "pool"
+    max_age = connection.settings_dict["CONN_MAX_AGE"]
+    return "persistent" if max_age is None or max_age > 0 else "none"
+
+
+def close_pools():
+    """Close this process's connection pools, e.g. before gunicorn forks."""
+    for connection in connections.all():
+        if _pool(connection) is not None:
+            connection.close_pool()
+
+
+def _pool(connection):
+    # The pool if one was created; reading .pool would create one.
+    return getattr(connection, "_connection_pools", {}).get(connection.alias)
+
+
+def stats():
+    """
+    Per database alias: the reuse mode, connects so far and, once a pool is
+    open, psycopg_pool's counters (pool_size, pool_available,
+    requests_waiting, requests_wait_ms, ...). Every gunicorn worker has its
+    own connections, so these describe the worker that reports them.
+    """
+    result = {}
+    for connection in connections.all():
+        entry = {"mode": mode(connection), "connects": _connects[connection.alias]}
+        pool = _pool(connection)
+        if pool is not None:
+            entry.update(pool.get_stats())
+        result[connection.alias] = entry
+    return result
+
+
+def render_prometheus():
+    """Render stats() in the Prometheus text exposition format."""
+    databases = sorted(stats().items())
+    lines = [
+        "# HELP kitchen_db_connects_total Connections opened, or checked out of the pool when pooling.",
+        "# TYPE kitchen_db_connects_total counter",
+    ]
+    lines += [f'kitchen_db_connects_total{{database="{alias}"}} {entry["connects"]}' for alias, entry in databases]
+    names = sorted({name for _, entry in databases for name in entry} - {"mode", "connects"})
+    for name in names:
+        kind = "gauge" if name in POOL_GAUGES else "counter"
+        lines.append(f"# HELP kitchen_db_{name} psycopg_pool statistic {name}.")
+        lines.append(f"# TYPE kitchen_db_{name} {kind}")
+        lines += [
+            f'kitchen_db_{name}{{database="{alias}"}} {entry[name]}'
+            for alias, entry in databases if name in entry
+        ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,155 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+# Set on the response to a write: while the browser sends it back, its
+# reads stay on the primary.
+STICKY_COOKIE = "kitchen_primary"
+SAFE_METHODS = ("GET", "HEAD")
+# The primary's WAL position (in bytes) after the latest write that bumped
+# a fragment version. A replica that has replayed up to it has every row
+# the current versions describe.
+POSITION_KEY = "kitchen_core:primary_position"
+
+
+class Routing:
+    """Where the current request reads from: a replica alias, or None for the primary."""
+
+    def __init__(self):
+        self.replica = None
+
+
+_routing = ContextVar("kitchen_core_routing", default=None)
+
+
+@contextmanager
+def routing():
+    # A mutable holder, so a replica picked in process_view() is seen by the
+    # view even where sync_to_async runs it in a copy of the context.
+    state = Routing()
+    token = _routing.set(state)
+    try:
+        yield state
+    finally:
+        _routing.reset(token)
+
+
+def read_only(view):
+    """Mark ``view`` as safe to serve from a replica on GET and HEAD."""
+    view.replica_reads = True
+    return view
+
+
+def caches_pages(view_func):
+    """
+    Whether ``view_func`` caches fragments or sends ETags. Both are keyed on
+    model versions bumped as soon as the primary commits, so rendered from
+    a replica that hasn't replayed the change yet, old rows would be cached
+    or validated under the new version (see caught_up()).
+    """
+    view_class = getattr(view_func, "view_class", None)
+    return settings.CACHE_SHARED and bool(getattr(view_class, "cache_models", ()))
+
+
+def _tracks_position():
+    return bool(settings.DATABASE_REPLICAS) and connections[DEFAULT_DB_ALIAS].vendor == "postgresql"
+
+
+def note_primary_position():
+    """Record the primary's current WAL position as POSITION_KEY."""
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), '0/0')::bigint")
+        position = cursor.fetchone()[0]
+    cache = caches[settings.FRAGMENT_CACHE_ALIAS]
+    # Don't move it back if a later commit got here first.
+    if position > (cache.get(POSITION_KEY) or 0):
+        cache.set(POSITION_KEY, position, None)
+
+
+def versions_bumped():
+    """
+    Called by fragments.bump(): once the write commits, record where the
+    primary is, so replicas are only used for cached pages after catching
+    up with it. Recorded once per transaction.
+    """
+    if not _tracks_position():
+        return
+    connection = connections[DEFAULT_DB_ALIAS]
+    if any(func is note_primary_position for _, func, _ in connection.run_on_commit):
+        return
+    transaction.on_commit(note_primary_position, using=DEFAULT_DB_ALIAS)
+
+
+def caught_up(alias):
+    """
+    Whether replica ``alias`` has replayed the primary's WAL up to the last
+    version bump, so pages it renders match their fragment keys and ETags.
+    Only PostgreSQL replicas report their position.
+    """
+    if not _tracks_position() or connections[alias].vendor != "postgresql":
+        return False
+    needed = caches[settings.FRAGMENT_CACHE_ALIAS].get(POSITION_KEY)
+    if needed is None:
+        # Evicted, or nothing written since the cache was cleared.
+        note_primary_position()
+        needed = caches[settings.FRAGMENT_CACHE_ALIAS].get(POSITION_KEY, 0)
+    with connections[alias].cursor() as cursor:
+        # NULL when the "replica" isn't in recovery, i.e. it is a primary.
+        cursor.execute("SELECT pg_wal_lsn_diff(pg_last_wal_replay_lsn(), '0/0')::bigint")
+        position = cursor.fetchone()[0]
+    return position is None or position >= needed
+
+
+def choose_replica(request, view_func):
+    """The replica alias ``request`` may read from, or None for the primary."""
+    if not settings.DATABASE_REPLICAS or request.method not in SAFE_METHODS:
+        return None
+    if not getattr(view_func, "replica_reads", False) or STICKY_COOKIE in request.COOKIES:
+        return None
+    replica = random.choice(settings.DATABASE_REPLICAS)
+    if caches_pages(view_func) and not caught_up(replica):
+        return None
+    return replica
+
+
+def stick_to_primary(request, response):
+    """After a write, keep the browser's reads on the primary for a while."""
+    if settings.DATABASE_REPLICAS and request.method not in SAFE_METHODS:
+        response.set_cookie(
+            STICKY_COOKIE, "1",
+            max_age=settings.REPLICA_STICKY_SECONDS,
+            httponly=True,
+            samesite="Lax",
+        )
+    return response
+
+
+class ReplicaRouter:
+    """
+    Send kitchen_core reads to the replica the request was given by
+    ReplicaMiddleware, and all writes to the primary. Sessions, auth groups
+    and permissions, and anything outside a request read from the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if state is None or state.replica is None or model._meta.app_label != "kitchen_core":
+            return None
+        # Related objects come from wherever their instance was loaded.
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,156 @@
+from django.db import connections, OperationalError
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+from kitchen_core.models import Dish, DishType, Cook
+
+# Columns covered by the search indexes of each model.
+SEARCH_FIELDS = {
+    DishType: ("name",),
+    Dish: ("name",),
+    Cook: ("first_name", "last_name"),
+}
+
+# The FTS5 trigram tokenizer cannot match anything shorter than a trigram.
+FTS_MIN_LENGTH = 3
+
+
+def fts_table(model):
+    return f"{model._meta.db_table}_fts"
+
+
+def install_sqlite_fts(connection):
+    """
+    Create the FTS5 tables mirroring the searchable columns, together with
+    the triggers that keep them in sync. Safe to run repeatedly: missing
+    triggers (SQLite drops them whenever Django rebuilds a table) are
+    recreated and the index is rebuilt from the content table.
+    """
+    if connection.vendor != "sqlite":
+        return
+    existing = set(connection.introspection.table_names())
+    with connection.cursor() as cursor:
+        for model, fields in SEARCH_FIELDS.items():
+            table, fts = model._meta.db_table, fts_table(model)
+            if table not in existing:
+                continue
+            columns = ", ".join(fields)
+            new_values = ", ".join(f"new.{field}" for field in fields)
+            old_values = ", ".join(f"old.{field}" for field in fields)
+            # Only changes to the searched columns reach the index: saves of
+            # last_login, visit counts, stats and updated_at leave it alone.
+            update_trigger = (
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {columns} ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+                f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+            )
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+                [f"{fts}_ai", f"{fts}_ad", f"{fts}_au"],
+            )
+            triggers = dict(cursor.fetchall())
+            if len(triggers) == 3 and triggers[f"{fts}_au"] == update_trigger:
+                continue
+            # Older databases have an update trigger firing on every column.
+            cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_au")
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                    f"{columns}, content='{table}', content_rowid='id', tokenize='trigram')"
+                )
+            except OperationalError:
+                # SQLite built without FTS5 (or older than 3.34): search
+                # falls back to icontains.
+                return
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+            )
+            cursor.execute(update_trigger)
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    _fts_tables.clear()
+
+
+def uninstall_sqlite_fts(connection):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for model in SEARCH_FIELDS:
+            fts = fts_table(model)
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+    _fts_tables.clear()
+
+
+_fts_tables = {}
+
+
+def _has_fts(connection, model):
+    key = (connection.alias, str(connection.settings_dict["NAME"]))
+    if key not in _fts_tables:
+        _fts_tables[key] = set(connection.introspection.table_names())
+    return fts_table(model) in _fts_tables[key]
+
+
+def _icontains(fields, query):
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__icontains": query})
+    return condition
+
+
+def search(queryset, query, rank=True):
+    """
+    Filter ``queryset`` down to rows whose searchable columns contain
+    ``query`` (case-insensitive). With ``rank`` the best matches come first,
+    followed by the model's default ordering.
+
+    PostgreSQL answers the icontains lookup from the pg_trgm GIN indexes and
+    ranks by trigram similarity; SQLite goes through the FTS5 trigram tables
+    and ranks by bm25.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+    model = queryset.model
+    fields = SEARCH_FIELDS[model]
+    connection = connections[queryset.db]
+    ordering = model._meta.ordering
+
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        queryset = queryset.filter(_icontains(fields, query))
+        if rank:
+            similarities = [TrigramSimilarity(field, query) for field in fields]
+            score = similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+            queryset = queryset.annotate(search_rank=score).order_by("-search_rank", *ordering)
+        return queryset
+
+    if connection.vendor == "sqlite" and len(query) >= FTS_MIN_LENGTH and _has_fts(connection, model):
+        fts = fts_table(model)
+        phrase = '"{}"'.format(query.replace('"', '""'))
+        if not rank:
+            return queryset.filter(
+                pk__in=RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [phrase])
+            )
+        # bm25() of each match, lower for better ones. The rowid constraint
+        # lets FTS5 score just that row's entry in the match's doclist.
+        pk = "{}.{}".format(
+            connection.ops.quote_name(model._meta.db_table),
+            connection.ops.quote_name(model._meta.pk.column),
+        )
+        queryset = queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [phrase])
+        ).annotate(
+            search_rank=RawSQL(f"SELECT rank FROM {fts} WHERE {fts} MATCH %s AND rowid = {pk}", [phrase])
+        )
+        return queryset.order_by("search_rank", *ordering)
+
+    return queryset.filter(_icontains(fields, query))
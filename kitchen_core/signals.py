@@ -0,0 +1,347 @@
+from django.db.models import QuerySet
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver, Signal
+from django.utils import timezone
+
+from kitchen_core import changes, counters, fragments, live, stats
+from kitchen_core.models import Dish, DishType, Cook
+
+# Sent once per kitchen_core.assignments.apply_assignments() batch with
+# ``added`` and ``removed`` lists of (cook_id, dish_id) pairs.
+assignments_changed = Signal()
+
+
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+@receiver(post_save, sender=Cook)
+def count_created(sender, instance, created, **kwargs):
+    if created:
+        counters.adjust(sender, 1)
+
+
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+@receiver(post_delete, sender=Cook)
+def count_deleted(sender, instance, **kwargs):
+    counters.adjust(sender, -1)
+    if sender is not DishType:
+        # Cascaded through-table rows are deleted without m2m_changed.
+        counters.invalidate(Dish.cooks.through)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def count_assignments(sender, action, pk_set, **kwargs):
+    if action == "post_add" and pk_set:
+        # Django only reports the rows it actually inserted.
+        counters.adjust(sender, len(pk_set))
+    elif action in ("post_remove", "post_clear"):
+        # pk_set holds the requested ids, not the removed ones.
+        counters.invalidate(sender)
+
+
+@receiver(assignments_changed)
+def count_bulk_assignments(sender, added, removed, **kwargs):
+    counters.adjust(sender, len(added) - len(removed))
+
+
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+@receiver(post_save, sender=Cook)
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+@receiver(post_delete, sender=Cook)
+def bump_fragment_version(sender, update_fields=None, **kwargs):
+    # Logging in only touches last_login, which no fragment shows.
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    fragments.bump(sender)
+    if kwargs.get("signal") is post_delete and sender is not DishType:
+        fragments.bump(Dish.cooks.through)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def bump_assignment_version(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        fragments.bump(sender)
+
+
+@receiver(assignments_changed)
+def bump_bulk_assignment_version(sender, **kwargs):
+    fragments.bump(sender)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def touch_assigned(sender, instance, action, reverse, model, pk_set, using, **kwargs):
+    # Assignments change both sides' pages, but save() is never called.
+    if action == "pre_clear":
+        related = instance.dishes if reverse else instance.cooks
+        instance._cleared_pks = set(related.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    now = timezone.now()
+    instance._meta.model._default_manager.using(using).filter(pk=instance.pk).update(updated_at=now)
+    if pk_set:
+        model._default_manager.using(using).filter(pk__in=pk_set).update(updated_at=now)
+
+
+@receiver(assignments_changed)
+def touch_bulk_assigned(sender, added, removed, using, **kwargs):
+    pairs = list(added) + list(removed)
+    if not pairs:
+        return
+    now = timezone.now()
+    Cook.objects.using(using).filter(pk__in={cook for cook, dish in pairs}).update(updated_at=now)
+    Dish.objects.using(using).filter(pk__in={dish for cook, dish in pairs}).update(updated_at=now)
+
+
+# Stored aggregates (kitchen_core.stats). QuerySet.update(), bulk_create()
+# and loaddata bypass these; run ``manage.py rebuild_stats`` after them.
+
+STATS_FIELDS = {"price", "dish_type"}
+
+
+@receiver(pre_save, sender=Dish)
+def remember_priced(sender, instance, raw, using, update_fields=None, **kwargs):
+    # The stored type and price, to apply the change as a delta.
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not STATS_FIELDS & set(update_fields):
+        return
+    instance._previous_priced = Dish.objects.using(using).filter(
+        pk=instance.pk
+    ).values_list("dish_type_id", "price").first()
+
+
+@receiver(post_save, sender=Dish)
+def update_saved_dish_stats(sender, instance, created, raw, using, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not STATS_FIELDS & set(update_fields):
+        return
+    previous = None if created else getattr(instance, "_previous_priced", None)
+    if previous is None:
+        stats.update_priced(instance.dish_type_id, new=instance.price, using=using)
+    elif previous[0] != instance.dish_type_id:
+        # The dish takes its cooks along; recount both types.
+        stats.refresh_dish_types([previous[0], instance.dish_type_id], using)
+    elif previous[1] != stats.price(instance.price):
+        stats.update_priced(instance.dish_type_id, previous[1], instance.price, using)
+    else:
+        return
+    fragments.bump(DishType)
+
+
+def _deleted_with_dish_type(origin):
+    """Whether a delete started at ``origin`` is a dish type's cascade."""
+    # origin is the instance or queryset delete() was called on.
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model is DishType
+
+
+@receiver(pre_delete, sender=Dish)
+@receiver(pre_delete, sender=Cook)
+def remember_assigned(sender, instance, using, origin=None, **kwargs):
+    # The dish type remembers its dishes' assignments in one query.
+    if sender is Dish and _deleted_with_dish_type(origin):
+        return
+    # The through rows are cascade-deleted without m2m_changed.
+    related = instance.cooks if sender is Dish else instance.dishes
+    instance._assigned_pks = set(related.using(using).values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=DishType)
+def remember_dish_type_assignments(sender, instance, using, **kwargs):
+    instance._assigned_pairs = list(
+        Dish.cooks.through.objects.using(using).filter(
+            dish__dish_type_id=instance.pk
+        ).values_list("cook_id", "dish_id")
+    )
+
+
+@receiver(post_delete, sender=Dish)
+def update_deleted_dish_stats(sender, instance, using, origin=None, **kwargs):
+    # Refreshed once for the whole dish type below.
+    if _deleted_with_dish_type(origin):
+        return
+    stats.update_assigned(
+        removed=[(cook_id, instance.pk) for cook_id in getattr(instance, "_assigned_pks", ())],
+        using=using,
+        dish_types={instance.pk: instance.dish_type_id},
+    )
+    stats.update_priced(instance.dish_type_id, old=instance.price, using=using)
+    fragments.bump(Cook, DishType)
+
+
+@receiver(post_delete, sender=DishType)
+def refresh_deleted_dish_type_stats(sender, instance, using, **kwargs):
+    cooks = {cook for cook, dish in getattr(instance, "_assigned_pairs", ())}
+    if cooks:
+        stats.refresh_cooks(cooks, using)
+        fragments.bump(Cook)
+
+
+@receiver(post_delete, sender=Cook)
+def update_deleted_cook_stats(sender, instance, using, **kwargs):
+    assigned = getattr(instance, "_assigned_pks", set())
+    if assigned:
+        stats.update_assigned(removed=[(instance.pk, dish_id) for dish_id in assigned], using=using)
+        fragments.bump(DishType)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def update_assignment_stats(sender, instance, action, reverse, pk_set, using, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    if not pk_set:
+        return
+    if reverse:
+        pairs = [(instance.pk, dish_id) for dish_id in pk_set]
+    else:
+        pairs = [(cook_id, instance.pk) for cook_id in pk_set]
+    if action == "post_add":
+        stats.update_assigned(added=pairs, using=using)
+    else:
+        stats.update_assigned(removed=pairs, using=using)
+    fragments.bump(Cook, DishType)
+
+
+@receiver(assignments_changed)
+def update_bulk_assignment_stats(sender, added, removed, using, **kwargs):
+    if not added and not removed:
+        return
+    stats.update_assigned(added, removed, using)
+    fragments.bump(Cook, DishType)
+
+
+# Change log (kitchen_core.changes), written once the transaction commits.
+
+
+@receiver(post_save, sender=DishType)
+@receiver(post_save, sender=Dish)
+@receiver(post_save, sender=Cook)
+def log_saved(sender, instance, created, using, update_fields=None, **kwargs):
+    # e.g. logins, which only touch last_login.
+    if update_fields is not None and not changes.tracks(sender, update_fields):
+        return
+    changes.record(sender, changes.CREATE if created else changes.UPDATE, [instance.pk], using)
+
+
+@receiver(post_delete, sender=DishType)
+@receiver(post_delete, sender=Dish)
+@receiver(post_delete, sender=Cook)
+def log_deleted(sender, instance, using, **kwargs):
+    changes.record(sender, changes.DELETE, [instance.pk], using)
+    # The assignments were cascade-deleted without m2m_changed.
+    assigned = getattr(instance, "_assigned_pks", ())
+    if sender is Dish:
+        changes.record_assignments(changes.DELETE, [(cook, instance.pk) for cook in assigned], using)
+    elif sender is Cook:
+        changes.record_assignments(changes.DELETE, [(instance.pk, dish) for dish in assigned], using)
+    else:
+        changes.record_assignments(changes.DELETE, getattr(instance, "_assigned_pairs", ()), using)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def log_assignments(sender, instance, action, reverse, pk_set, using, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    pairs = [(instance.pk, pk) if reverse else (pk, instance.pk) for pk in pk_set or ()]
+    changes.record_assignments(changes.CREATE if action == "post_add" else changes.DELETE, pairs, using)
+
+
+@receiver(assignments_changed)
+def log_bulk_assignments(sender, added, removed, using, **kwargs):
+    changes.record_assignments(changes.CREATE, added, using)
+    changes.record_assignments(changes.DELETE, removed, using)
+
+
+# Live updates (kitchen_core.live): what the kitchen screens need to patch
+# their pages, built and published once the transaction commits.
+
+
+def _dish_event(dish):
+    return {
+        "type": "dish",
+        "id": dish.pk,
+        "name": dish.name,
+        "price": str(dish.price),
+        "dish_type": {"id": dish.dish_type_id, "name": dish.dish_type.name},
+    }
+
+
+def _assignments_event(added, removed, using):
+    """
+    ``added`` and ``removed`` are (cook_id, dish_id) pairs. The added cooks
+    and dishes come with the names the pages show for them.
+    """
+    event = {
+        "type": "assignments",
+        "added": [list(pair) for pair in added],
+        "removed": [list(pair) for pair in removed],
+        "cooks": {},
+        "dishes": {},
+    }
+    if added:
+        cooks = Cook.objects.using(using).filter(pk__in={cook for cook, dish in added})
+        for pk, first_name, last_name in cooks.values_list("pk", "first_name", "last_name"):
+            event["cooks"][pk] = f"{first_name} {last_name}"
+        dishes = Dish.objects.using(using).filter(pk__in={dish for cook, dish in added})
+        for pk, name, dish_type_id, dish_type in dishes.values_list(
+            "pk", "name", "dish_type_id", "dish_type__name"
+        ):
+            event["dishes"][pk] = {"name": name, "dish_type": {"id": dish_type_id, "name": dish_type}}
+    return event
+
+
+@receiver(post_save, sender=Dish)
+def publish_saved_dish(sender, instance, raw, using, **kwargs):
+    if not raw:
+        live.publish(lambda: _dish_event(instance), using)
+
+
+@receiver(post_save, sender=DishType)
+def publish_saved_dish_type(sender, instance, raw, using, **kwargs):
+    if not raw:
+        live.publish({"type": "dish_type", "id": instance.pk, "name": instance.name}, using)
+
+
+@receiver(post_delete, sender=Dish)
+@receiver(post_delete, sender=DishType)
+def publish_deleted(sender, instance, using, **kwargs):
+    # Deleting a dish type deletes its dishes, each with its own event.
+    event_type = "dish" if sender is Dish else "dish_type"
+    live.publish({"type": event_type, "id": instance.pk, "deleted": True}, using)
+
+
+@receiver(post_delete, sender=Cook)
+def publish_deleted_cook(sender, instance, using, **kwargs):
+    removed = [(instance.pk, dish) for dish in getattr(instance, "_assigned_pks", ())]
+    if removed:
+        live.publish(lambda: _assignments_event([], removed, using), using)
+
+
+@receiver(m2m_changed, sender=Dish.cooks.through)
+def publish_assignments(sender, instance, action, reverse, pk_set, using, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    if not pk_set:
+        return
+    pairs = [(instance.pk, pk) if reverse else (pk, instance.pk) for pk in pk_set]
+    added, removed = (pairs, []) if action == "post_add" else ([], pairs)
+    live.publish(lambda: _assignments_event(added, removed, using), using)
+
+
+@receiver(assignments_changed)
+def publish_bulk_assignments(sender, added, removed, using, **kwargs):
+    if added or removed:
+        added, removed = list(added), list(removed)
+        live.publish(lambda: _assignments_event(added, removed, using), using)
@@ -0,0 +1,170 @@
+from collections import Counter
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import (
+    Avg, Case, Count, F, FloatField, IntegerField, Max, Min, OuterRef, Q, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from .models import Dish, DishType, Cook
+
+Assignment = Dish.cooks.through
+price = Dish._meta.get_field("price").to_python
+
+# Stored aggregates kept current by the signals in kitchen_core.signals.
+# Changes are applied as F() deltas; min/max and distinct cook counts are
+# only recomputed when the change could move them. The refresh_*()
+# functions recompute the given rows from scratch (``pks=None``: the whole
+# table) with correlated subqueries.
+
+
+def _aggregate(queryset, group_by, aggregate):
+    return Subquery(queryset.values(group_by).annotate(value=aggregate).values("value"))
+
+
+def _count(queryset, group_by, expression="*", distinct=False):
+    return Coalesce(
+        _aggregate(queryset, group_by, Count(expression, distinct=distinct)),
+        0,
+        output_field=IntegerField(),
+    )
+
+
+def _rows(model, pks, using):
+    queryset = model._default_manager.using(using)
+    return queryset.all() if pks is None else queryset.filter(pk__in=pks)
+
+
+def refresh_cooks(pks=None, using=DEFAULT_DB_ALIAS):
+    assignments = Assignment.objects.filter(cook_id=OuterRef("pk"))
+    return _rows(Cook, pks, using).update(
+        dish_count=_count(assignments, "cook_id"),
+    )
+
+
+def refresh_dishes(pks=None, using=DEFAULT_DB_ALIAS):
+    assignments = Assignment.objects.filter(dish_id=OuterRef("pk"))
+    return _rows(Dish, pks, using).update(
+        cook_count=_count(assignments, "dish_id"),
+    )
+
+
+def refresh_dish_types(pks=None, using=DEFAULT_DB_ALIAS, fields=None):
+    dishes = Dish.objects.filter(dish_type_id=OuterRef("pk"))
+    assignments = Assignment.objects.filter(dish__dish_type_id=OuterRef("pk"))
+    values = {
+        "dish_count": _count(dishes, "dish_type_id"),
+        "cook_count": _count(assignments, "dish__dish_type_id", "cook_id", distinct=True),
+        "price_min": _aggregate(dishes, "dish_type_id", Min("price")),
+        "price_sum": Coalesce(_aggregate(dishes, "dish_type_id", Sum("price")), Value(0)),
+        "price_avg": _aggregate(dishes, "dish_type_id", Avg("price")),
+        "price_max": _aggregate(dishes, "dish_type_id", Max("price")),
+    }
+    if fields is not None:
+        values = {field: values[field] for field in fields}
+    return _rows(DishType, pks, using).update(**values)
+
+
+def _add(model, field, deltas, using):
+    """Add each row's delta in ``deltas`` (pk -> int) to ``field``."""
+    deltas = {pk: delta for pk, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    model._default_manager.using(using).filter(pk__in=deltas).update(**{
+        field: F(field) + Case(
+            *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+            default=Value(0),
+        ),
+    })
+
+
+def _cook_count_deltas(changes, using):
+    """
+    Change in each dish type's distinct cook count for ``changes``, a
+    Counter of assignment deltas per ``(cook_id, dish_type_id)`` that have
+    already been written. Only a cook's first dish of a type or their last
+    one changes the count.
+    """
+    changes = {key: delta for key, delta in changes.items() if delta}
+    if not changes:
+        return {}
+    cook_ids = {cook_id for cook_id, _ in changes}
+    dish_type_ids = {dish_type_id for _, dish_type_id in changes}
+    if connections[using].features.has_select_for_update:
+        # Concurrent changes to the same types wait here, then count each
+        # other's rows.
+        list(DishType.objects.using(using).select_for_update().filter(
+            pk__in=dish_type_ids,
+        ).order_by().values_list("pk"))
+    assigned = Counter({
+        (cook_id, dish_type_id): count
+        for cook_id, dish_type_id, count in Assignment.objects.using(using).filter(
+            cook_id__in=cook_ids, dish__dish_type_id__in=dish_type_ids,
+        ).values("cook_id", "dish__dish_type_id").annotate(
+            count=Count("pk"),
+        ).values_list("cook_id", "dish__dish_type_id", "count")
+    })
+    deltas = Counter()
+    for (cook_id, dish_type_id), delta in changes.items():
+        after = assigned[cook_id, dish_type_id]
+        deltas[dish_type_id] += (after > 0) - (after - delta > 0)
+    return deltas
+
+
+def update_assigned(added=(), removed=(), using=DEFAULT_DB_ALIAS, dish_types=None):
+    """
+    Apply assignments that were just added and removed, as
+    ``(cook_id, dish_id)`` pairs, to the stored counts. ``dish_types`` maps
+    dish ids to their dish type when the dishes are already gone.
+    """
+    changes = [(pair, 1) for pair in added] + [(pair, -1) for pair in removed]
+    if dish_types is None:
+        dish_types = dict(Dish.objects.using(using).filter(
+            pk__in={dish_id for (_, dish_id), _ in changes},
+        ).order_by().values_list("pk", "dish_type_id"))
+    cooks, dishes, dish_type_cooks = Counter(), Counter(), Counter()
+    for (cook_id, dish_id), delta in changes:
+        cooks[cook_id] += delta
+        dishes[dish_id] += delta
+        if dish_id in dish_types:
+            dish_type_cooks[cook_id, dish_types[dish_id]] += delta
+    with transaction.atomic(using=using, savepoint=False):
+        _add(Cook, "dish_count", cooks, using)
+        _add(Dish, "cook_count", dishes, using)
+        _add(DishType, "cook_count", _cook_count_deltas(dish_type_cooks, using), using)
+
+
+def update_priced(dish_type_id, old=None, new=None, using=DEFAULT_DB_ALIAS):
+    """
+    Apply a dish of ``dish_type_id`` that was added with price ``new``
+    (``old`` is None), removed (``new`` is None) or repriced to the type's
+    stats. The dish row must already be saved or deleted.
+    """
+    old, new = price(old), price(new)
+    count = (new is not None) - (old is not None)
+    total = (new or 0) - (old or 0)
+    dishes = Dish.objects.filter(dish_type_id=OuterRef("pk"))
+    values = {
+        "dish_count": F("dish_count") + count,
+        "price_sum": F("price_sum") + total,
+        # SQLite would divide a whole-number sum as an integer.
+        "price_avg": Cast(F("price_sum") + total, FloatField()) / NullIf(F("dish_count") + count, 0),
+    }
+    for field, aggregate, beyond in [("price_min", Min, "gt"), ("price_max", Max, "lt")]:
+        cases = []
+        if old is not None:
+            # The old price may have been the extreme; recount only then.
+            cases.append(When(**{field: old}, then=_aggregate(dishes, "dish_type_id", aggregate("price"))))
+        if new is not None:
+            cases.append(When(Q(**{f"{field}__isnull": True}) | Q(**{f"{field}__{beyond}": new}), then=Value(new)))
+        values[field] = Case(*cases, default=F(field))
+    return DishType.objects.using(using).filter(pk=dish_type_id).update(**values)
+
+
+def rebuild(using=DEFAULT_DB_ALIAS):
+    """Recompute every stored aggregate. Returns the rows updated per model."""
+    return {
+        "cooks": refresh_cooks(using=using),
+        "dishes": refresh_dishes(using=using),
+        "dish_types": refresh_dish_types(using=using),
+    }
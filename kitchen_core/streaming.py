@@ -0,0 +1,34 @@
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+# Chunks pulled per trip to the worker thread when streaming under ASGI.
+CHUNKS_PER_CALL = 100
+
+
+async def _aiter(content):
+    iterator = iter(content)
+    # thread_sensitive keeps every pull on the thread that opened the
+    # database cursor behind the iterator.
+    take = sync_to_async(lambda: list(islice(iterator, CHUNKS_PER_CALL)))
+    try:
+        while chunks := await take():
+            for chunk in chunks:
+                yield chunk
+    finally:
+        if hasattr(iterator, "close"):
+            await sync_to_async(iterator.close)()
+
+
+def streaming_response(request, content, **kwargs):
+    """
+    StreamingHttpResponse over the sync iterator ``content``. Under ASGI
+    Django drains a sync iterator with sync_to_async(list), buffering the
+    whole body, so it's wrapped in an async iterator that pulls a few
+    chunks at a time off the event loop instead.
+    """
+    if isinstance(request, ASGIRequest):
+        content = _aiter(content)
+    return StreamingHttpResponse(content, **kwargs)
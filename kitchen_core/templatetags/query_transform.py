@@ -11,5 +11,5 @@ def query_transform(context, **kwargs):
         if value is not None:
             update[key] = value
         else:
-            update.pop(key)
+            update.pop(key, None)
     return update.urlencode()
\ No newline at end of file
@@ -1,48 +1,74 @@
+from django.conf import settings
 from django.urls import path
 from django.contrib.auth import views as auth_views
 
+from .api import DishTypeApiView, DishApiView, CookApiView
 from .models import DishType, Cook
+from . import async_views, views
+from .replicas import read_only
 from .views import (
-    index,
-    DishTypeListView,
+    metrics,
     DishTypeCreateView,
     DishTypeUpdateView,
     DishTypeDeleteView,
-    DishTypeDetailView,
-    DishListView,
     DishCreateView,
     DishUpdateView,
     DishDeleteView,
-    DishDetailView,
-    CookListView,
+    ToggleAssignToDishView,
+    BulkAssignView,
+    ExportView,
+    ImportView,
+    ChangeFeedView,
+    LookupView,
     CookCreateView,
     CookUpdateView,
     CookDeleteView,
-    CookDetailView,
-    ToggleAssignToDishView,
 )
 
 app_name = "kitchen_core"
 
 
-urlpatterns = [
-    path("", index, name="index"),
-    path("dish_type/", DishTypeListView.as_view(), name="dish-type-list"),
-    path("dish_type/create", DishTypeCreateView.as_view(), name="dish-type-create"),
-    path("dish_type/<int:pk>/update/", DishTypeUpdateView.as_view(), name="dish-type-update"),
-    path("dish_type/<int:pk>/delete/", DishTypeDeleteView.as_view(), name="dish-type-delete"),
-    path("dish_type/<int:pk>/", DishTypeDetailView.as_view(), name="dish-type-detail"),
-
-    path("dish/", DishListView.as_view(), name="dish-list"),
-    path("dish/create/", DishCreateView.as_view(), name="dish-create"),
-    path("dish/<int:pk>/update/", DishUpdateView.as_view(), name="dish-update"),
-    path("dish/<int:pk>/delete/", DishDeleteView.as_view(), name="dish-delete"),
-    path("dish/<int:pk>/", DishDetailView.as_view(), name="dish-detail"),
-    path("dish/<int:pk>/toggle-assign/", ToggleAssignToDishView.as_view(), name="toggle-assign-dish"),
-
-    path("cook/", CookListView.as_view(), name="cook-list"),
-    path("cook/create/", CookCreateView.as_view(), name="cook-create"),
-    path("cook/<int:pk>/update/", CookUpdateView.as_view(), name="cook-update"),
-    path("cook/<int:pk>/delete/", CookDeleteView.as_view(), name="cook-delete"),
-    path("cook/<int:pk>/", CookDetailView.as_view(), name="cook-detail"),
-]
+def get_urlpatterns(read_views):
+    # read_only views may be served from a read replica (DATABASE_REPLICAS).
+    return [
+        path("", read_only(read_views.index), name="index"),
+        path("metrics", metrics, name="metrics"),
+        # Always async: it streams for as long as the page is open.
+        path("live/", async_views.live, name="live"),
+        path("dish_type/", read_only(read_views.DishTypeListView.as_view()), name="dish-type-list"),
+        path("dish_type/create", DishTypeCreateView.as_view(), name="dish-type-create"),
+        path("dish_type/<int:pk>/update/", DishTypeUpdateView.as_view(), name="dish-type-update"),
+        path("dish_type/<int:pk>/delete/", DishTypeDeleteView.as_view(), name="dish-type-delete"),
+        path("dish_type/<int:pk>/", read_only(read_views.DishTypeDetailView.as_view()), name="dish-type-detail"),
+
+        path("dish/", read_only(read_views.DishListView.as_view()), name="dish-list"),
+        path("dish/create/", DishCreateView.as_view(), name="dish-create"),
+        path("dish/<int:pk>/update/", DishUpdateView.as_view(), name="dish-update"),
+        path("dish/<int:pk>/delete/", DishDeleteView.as_view(), name="dish-delete"),
+        path("dish/<int:pk>/", read_only(read_views.DishDetailView.as_view()), name="dish-detail"),
+        path("dish/<int:pk>/toggle-assign/", ToggleAssignToDishView.as_view(), name="toggle-assign-dish"),
+        path("dish/assignments/", BulkAssignView.as_view(), name="bulk-assign"),
+
+        path("cook/", read_only(read_views.CookListView.as_view()), name="cook-list"),
+        path("cook/create/", CookCreateView.as_view(), name="cook-create"),
+        path("cook/<int:pk>/update/", CookUpdateView.as_view(), name="cook-update"),
+        path("cook/<int:pk>/delete/", CookDeleteView.as_view(), name="cook-delete"),
+        path("cook/<int:pk>/", read_only(read_views.CookDetailView.as_view()), name="cook-detail"),
+
+        path("api/dish-types/", DishTypeApiView.as_view(), name="api-dish-type-list"),
+        path("api/dish-types/<int:pk>/", DishTypeApiView.as_view(), name="api-dish-type-detail"),
+        path("api/dishes/", DishApiView.as_view(), name="api-dish-list"),
+        path("api/dishes/<int:pk>/", DishApiView.as_view(), name="api-dish-detail"),
+        path("api/cooks/", CookApiView.as_view(), name="api-cook-list"),
+        path("api/cooks/<int:pk>/", CookApiView.as_view(), name="api-cook-detail"),
+
+        path("export/<str:name>.<str:format>", ExportView.as_view(), name="export"),
+        path("import/<str:name>.<str:format>", ImportView.as_view(), name="import"),
+        path("changes", ChangeFeedView.as_view(), name="changes"),
+        path("lookup/<str:name>/", read_only(LookupView.as_view()), name="lookup"),
+    ]
+
+
+# ASYNC_VIEWS serves the read-only pages from kitchen_core.async_views, for
+# ASGI deployments.
+urlpatterns = get_urlpatterns(async_views if settings.ASYNC_VIEWS else views)
@@ -1,37 +1,77 @@
+import codecs
+import csv
+import json
+
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
-from django.shortcuts import render, get_object_or_404
-from django.http import HttpResponse, HttpRequest, HttpResponseRedirect
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Greatest
+from django.shortcuts import render
+from django.http import HttpResponse, HttpRequest, HttpResponseRedirect, JsonResponse, Http404
 from django.urls import reverse_lazy
+from django.utils.crypto import constant_time_compare
 from django.utils.decorators import method_decorator
 from django.views import generic, View
-from .forms import CookCreationForm, DishSearchForm, DishTypeSearchForm, CookSearchForm, CookUpdateForm
-
+from .forms import CookCreationForm, DishForm, DishSearchForm, DishTypeSearchForm, CookSearchForm, CookUpdateForm
+
+from . import changes, pooling
+from .assignments import apply_assignments, set_assignment
+from .conditional import ConditionalGetMixin
+from .counters import CountingPaginator, get_count
+from .exports import EXPORTS, WRITERS, export
+from .imports import IMPORTERS, READERS
+from .fragments import FragmentCacheMixin
+from .metrics import registry
 from .models import Dish, DishType, Cook
+from .pagination import CursorPaginationMixin, CursorPaginator, InvalidCursor
+from .search import search
+from .streaming import streaming_response
+from .visits import visits
 
 @login_required
 def index(request: HttpRequest) -> HttpResponse:
-    num_dish_types = DishType.objects.count()
-    num_dishes = Dish.objects.count()
-    num_cooks = Cook.objects.count()
+    num_dish_types = get_count(DishType)
+    num_dishes = get_count(Dish)
+    num_cooks = get_count(Cook)
+    num_assignments = get_count(Dish.cooks.through)
 
-    num_visits = request.session.get('num_visits', 0)
-    request.session['num_visits'] = num_visits + 1
+    num_visits = visits.record(request.user)
 
     context = {
         "num_dish_types": num_dish_types,
         "num_dishes": num_dishes,
         "num_cooks": num_cooks,
+        # Averages from the cached row counters: no aggregate query.
+        "dishes_per_cook": num_assignments / num_cooks if num_cooks else 0,
+        "cooks_per_dish": num_assignments / num_dishes if num_dishes else 0,
         "num_visits": num_visits,
     }
     return render(request, "kitchen_core/index.html", context=context)
 
 
-class DishTypeListView(LoginRequiredMixin, generic.ListView):
+def metrics(request: HttpRequest) -> HttpResponse:
+    if not settings.QUERY_METRICS:
+        raise Http404("Query metrics are disabled")
+    if settings.METRICS_TOKEN:
+        authorization = request.headers.get("Authorization", "")
+        allowed = constant_time_compare(authorization, f"Bearer {settings.METRICS_TOKEN}")
+    else:
+        allowed = request.user.is_staff
+    if not allowed:
+        return HttpResponse(status=403)
+    return HttpResponse(
+        registry.render_prometheus() + pooling.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+class DishTypeListView(LoginRequiredMixin, ConditionalGetMixin, CursorPaginationMixin, generic.ListView):
     model = DishType
+    cache_models = (DishType,)
     context_object_name = "dish_type_list"
     paginate_by = 5
+    paginator_class = CountingPaginator
     template_name = "kitchen_core/dish_type_list.html"
 
     def get_context_data(self, **kwargs):
@@ -46,7 +86,7 @@ class DishTypeListView(LoginRequiredMixin, generic.ListView):
         queryset = DishType.objects.all()
         form = DishTypeSearchForm(self.request.GET)
         if form.is_valid():
-            queryset = queryset.filter(name__icontains=form.cleaned_data['name'])
+            queryset = form.search(queryset, rank=not self.use_cursor_pagination())
         return queryset
 
 
@@ -70,8 +110,9 @@ class DishTypeDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("kitchen_core:dish-type-list")
 
 
-class DishTypeDetailView(LoginRequiredMixin, generic.DetailView):
+class DishTypeDetailView(LoginRequiredMixin, ConditionalGetMixin, FragmentCacheMixin, generic.DetailView):
     model = DishType
+    cache_models = (DishType, Dish)
     template_name = "kitchen_core/dish_type_detail.html"
     context_object_name = "dish_type"
 
@@ -83,10 +124,12 @@ class DishTypeDetailView(LoginRequiredMixin, generic.DetailView):
         return context
 
 
-class DishListView(LoginRequiredMixin, generic.ListView):
+class DishListView(LoginRequiredMixin, ConditionalGetMixin, CursorPaginationMixin, FragmentCacheMixin, generic.ListView):
     model = Dish
+    cache_models = (Dish, DishType, Cook, Dish.cooks.through)
     context_object_name = "dish_list"
     paginate_by = 5
+    paginator_class = CountingPaginator
 
     def get_context_data(self, **kwargs):
         context = super(DishListView, self).get_context_data(**kwargs)
@@ -100,19 +143,19 @@ class DishListView(LoginRequiredMixin, generic.ListView):
         queryset = Dish.objects.select_related("dish_type").prefetch_related("cooks")
         form = DishSearchForm(self.request.GET)
         if form.is_valid():
-            queryset = queryset.filter(name__icontains=form.cleaned_data["name"])
+            queryset = form.search(queryset, rank=not self.use_cursor_pagination())
         return queryset
 
 
 class DishCreateView(LoginRequiredMixin, generic.CreateView):
     model = Dish
-    fields = "__all__"
+    form_class = DishForm
     success_url = reverse_lazy("kitchen_core:dish-list")
 
 
 class DishUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Dish
-    fields = "__all__"
+    form_class = DishForm
     success_url = reverse_lazy("kitchen_core:dish-list")
 
 
@@ -121,29 +164,179 @@ class DishDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("kitchen_core:dish-list")
 
 
-class DishDetailView(LoginRequiredMixin, generic.DetailView):
+class DishDetailView(LoginRequiredMixin, ConditionalGetMixin, generic.DetailView):
     model = Dish
+    cache_models = (Dish, DishType, Dish.cooks.through)
+
+    def get_last_modified(self):
+        # Assignments touch Dish.updated_at, so this covers the button too.
+        return Dish.objects.filter(pk=self.kwargs["pk"]).values_list(
+            Greatest("updated_at", "dish_type__updated_at"), flat=True
+        ).first()
+
+    def get_queryset(self):
+        is_assigned = Dish.cooks.through.objects.filter(
+            dish_id=OuterRef("pk"),
+            cook_id=self.request.user.pk,
+        )
+        return Dish.objects.select_related("dish_type").annotate(
+            is_assigned=Exists(is_assigned)
+        )
 
 @method_decorator(login_required, name='dispatch')
 class ToggleAssignToDishView(View):
     def post(self, request, pk):
-        cook = get_object_or_404(Cook, id=request.user.id)
-        dish = get_object_or_404(Dish, id=pk)
+        assign = {"1": True, "0": False}.get(request.POST.get("assign"))
+        assigned = set_assignment(request.user, pk, assign=assign)
+        if assigned is None:
+            raise Http404("No dish found matching the query")
+
+        if request.headers.get("HX-Request"):
+            return render(
+                request,
+                "includes/assign_button.html",
+                {"dish_id": pk, "is_assigned": assigned},
+            )
+        if "application/json" in request.headers.get("Accept", ""):
+            return JsonResponse({"dish": pk, "assigned": assigned})
+        return HttpResponseRedirect(reverse_lazy("kitchen_core:dish-list"))
 
-        if cook in dish.cooks.all():
-            dish.cooks.remove(cook)
-        else:
-            dish.cooks.add(cook)
 
-        return HttpResponseRedirect(reverse_lazy("kitchen_core:dish-list"))
 
+class BulkAssignView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    permission_required = "kitchen_core.change_dish"
+    raise_exception = True
+
+    def post(self, request):
+        try:
+            items = [
+                (item["cook"], item["dish"], item["action"])
+                for item in json.loads(request.body)["assignments"]
+            ]
+        except (ValueError, KeyError, TypeError):
+            return JsonResponse(
+                {"error": 'Expected {"assignments": [{"cook": id, "dish": id, "action": "add"|"remove"}]}'},
+                status=400,
+            )
+        results = apply_assignments(items)
+        return JsonResponse({
+            "results": [
+                {"cook": cook, "dish": dish, "action": action, "result": result}
+                for (cook, dish, action), result in zip(items, results)
+            ],
+        })
+
+
+class ExportView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    raise_exception = True
+
+    def get_permission_required(self):
+        model = {"dishes": "dish", "cooks": "cook"}.get(self.kwargs["name"], "dish")
+        return [f"kitchen_core.view_{model}"]
+
+    def get(self, request, name, format):
+        if name not in EXPORTS or format not in WRITERS:
+            raise Http404("Unknown export")
+        response = streaming_response(request, export(name, format), content_type=WRITERS[format].content_type)
+        response["Content-Disposition"] = f'attachment; filename="{name}.{format}"'
+        return response
+
+
+class ImportView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Upsert the CSV or NDJSON request body. ``?dry_run=1`` validates and
+    reports without keeping the changes; ``?batch_size=`` sets the rows per
+    bulk_create.
+    """
+    raise_exception = True
+
+    def get_permission_required(self):
+        model = {"dishes": "dish", "cooks": "cook"}.get(self.kwargs["name"], "dish")
+        return [f"kitchen_core.add_{model}", f"kitchen_core.change_{model}"]
+
+    def post(self, request, name, format):
+        if name not in IMPORTERS or format not in READERS:
+            raise Http404("Unknown import")
+        try:
+            batch_size = int(request.GET.get("batch_size", settings.IMPORT_BATCH_SIZE))
+        except ValueError:
+            batch_size = 0
+        if batch_size < 1:
+            return JsonResponse({"error": "batch_size must be a positive integer"}, status=400)
+        importer = IMPORTERS[name](batch_size=batch_size, dry_run=request.GET.get("dry_run") == "1")
+        # The body is read line by line instead of being loaded as a whole.
+        lines = codecs.iterdecode(request, "utf-8-sig")
+        try:
+            report = importer.run(READERS[format](lines))
+        except (UnicodeDecodeError, csv.Error) as e:
+            return JsonResponse({"error": f"Unreadable {format}: {e}"}, status=400)
+        return JsonResponse(report.as_dict())
+
+
+class LookupView(LoginRequiredMixin, View):
+    """
+    Choices for the dish form's autocomplete widgets. ``?q=`` goes through
+    the search indexes, and pages (``?cursor=``) are keyset-paginated over
+    the model's ordering index: ``{"results": [{"id", "text"}], "next"}``.
+    """
+    raise_exception = True
+    models = {"dish-types": DishType, "cooks": Cook}
+
+    def get(self, request, name):
+        if name not in self.models:
+            raise Http404("Unknown lookup")
+        model = self.models[name]
+        queryset = search(model.objects.all(), request.GET.get("q", ""), rank=False)
+        paginator = CursorPaginator(queryset, settings.LOOKUP_PAGE_SIZE)
+        try:
+            page = paginator.page(request.GET.get("cursor"))
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        return JsonResponse({
+            "results": [{"id": obj.pk, "text": str(obj)} for obj in page],
+            "next": page.next_cursor,
+        })
+
+
+class ChangeFeedView(LoginRequiredMixin, View):
+    """
+    ``GET ?since=<token>``: the dish type, dish, cook and assignment changes
+    logged after ``token``, at most ``?limit=`` (CHANGE_FEED_BATCH) at a
+    time, with the token to ask for next. Without ``since`` only that token
+    is returned: take it before downloading the catalogue, then follow the
+    changes from it. When the log can't tell everything after a token
+    (compacted, or rows bulk-loaded) the response is a 410: download the
+    catalogue again.
+    """
+    raise_exception = True
+
+    def get(self, request):
+        try:
+            limit = int(request.GET.get("limit", settings.CHANGE_FEED_BATCH))
+            since = request.GET.get("since")
+            since = None if since is None else int(since)
+        except ValueError:
+            return JsonResponse({"error": "since and limit must be integers"}, status=400)
+        if since is None:
+            return JsonResponse({"changes": [], "next": str(changes.head()), "more": False})
+        limit = max(1, min(limit, settings.CHANGE_FEED_BATCH))
+        try:
+            found, token, more = changes.changes_since(since, limit)
+        except changes.Expired:
+            return JsonResponse(
+                {"error": "Changes after this token are gone; download the catalogue again"},
+                status=410,
+            )
+        return JsonResponse({"changes": found, "next": str(token), "more": more})
 
 
-class CookListView(LoginRequiredMixin, generic.ListView):
+class CookListView(LoginRequiredMixin, ConditionalGetMixin, CursorPaginationMixin, generic.ListView):
     model = Cook
+    cache_models = (Cook,)
     context_object_name = "cook_list"
     template_name = "kitchen_core/cook_list.html"
     paginate_by = 5
+    paginator_class = CountingPaginator
 
 
     def get_context_data(self, **kwargs):
@@ -158,11 +351,7 @@ class CookListView(LoginRequiredMixin, generic.ListView):
         queryset = Cook.objects.all()
         form = CookSearchForm(self.request.GET)
         if form.is_valid():
-            cook_query = form.cleaned_data.get("cook", "")
-            queryset = queryset.filter(
-                Q(first_name__icontains=cook_query) |
-                Q(last_name__icontains=cook_query)
-            )
+            queryset = form.search(queryset, rank=not self.use_cursor_pagination())
         return queryset
 
 class CookCreateView(LoginRequiredMixin, generic.CreateView):
@@ -182,6 +371,13 @@ class CookDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("kitchen_core:cook-list")
 
 
-class CookDetailView(LoginRequiredMixin, generic.DetailView):
+class CookDetailView(LoginRequiredMixin, ConditionalGetMixin, FragmentCacheMixin, generic.DetailView):
     model = Cook
+    cache_models = (Cook, Dish, DishType, Dish.cooks.through)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["dishes"] = self.object.dishes.select_related("dish_type")
+
+        return context
 
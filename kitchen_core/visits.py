@@ -0,0 +1,72 @@
+import atexit
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, F, Value, When
+
+from kitchen_core.models import Cook
+
+
+class VisitCounter:
+    """
+    Home page visit counts, buffered in process memory and written to
+    ``Cook.visit_count`` in one UPDATE per batch: once VISIT_FLUSH_SIZE
+    visits are pending or VISIT_FLUSH_INTERVAL seconds have passed since the
+    last flush, and when the process exits. Every worker buffers its own
+    visits, so counts shown by another worker lag by at most one batch.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._flushed_at = time.monotonic()
+
+    def record(self, user):
+        """Count a visit by ``user`` and return the visits before this one."""
+        with self._lock:
+            previous = user.visit_count + self._pending[user.pk]
+            self._pending[user.pk] += 1
+            due = (
+                self._pending.total() >= settings.VISIT_FLUSH_SIZE
+                or time.monotonic() - self._flushed_at >= settings.VISIT_FLUSH_INTERVAL
+            )
+        if due:
+            self.flush()
+        return previous
+
+    def pending(self, user_id):
+        with self._lock:
+            return self._pending[user_id]
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return 0
+        try:
+            Cook.objects.filter(pk__in=pending).update(
+                visit_count=F("visit_count") + Case(
+                    *(When(pk=pk, then=Value(count)) for pk, count in pending.items()),
+                    default=Value(0),
+                )
+            )
+        except Exception:
+            # Keep the visits for the next batch rather than losing them.
+            with self._lock:
+                self._pending.update(pending)
+            raise
+        return len(pending)
+
+
+visits = VisitCounter()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        visits.flush()
+    except Exception:
+        pass
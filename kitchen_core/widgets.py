@@ -0,0 +1,37 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+
+class AutocompleteMixin:
+    """
+    A model choice select that renders only the selected options instead of
+    the whole table. static/js/autocomplete.js adds a search box that
+    fetches the other choices from ``url`` (a LookupView) as the user types.
+    """
+
+    def __init__(self, url, attrs=None):
+        super().__init__({"data-autocomplete-url": url, **(attrs or {})})
+
+    def optgroups(self, name, value, attrs=None):
+        field = self.choices.field
+        selected = [pk for pk in value if pk not in ("", None)]
+        options = []
+        if not self.allow_multiple_selected and field.empty_label is not None:
+            options.append(self.create_option(name, "", field.empty_label, not selected, 0, attrs=attrs))
+        try:
+            objects = list(field.queryset.filter(pk__in=selected)) if selected else []
+        except (ValueError, ValidationError):
+            # Not ids at all; the field reports them when the form is cleaned.
+            objects = []
+        for obj in objects:
+            choice_value, label = self.choices.choice(obj)
+            options.append(self.create_option(name, choice_value, label, True, len(options), attrs=attrs))
+        return [(None, [option], option["index"]) for option in options]
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    pass
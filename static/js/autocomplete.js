@@ -0,0 +1,107 @@
+// Search box for the selects rendered by kitchen_core.widgets: the page
+// holds only the selected options, the other choices are fetched from the
+// select's data-autocomplete-url (kitchen_core.views.LookupView) as the
+// user types.
+(function () {
+  "use strict";
+
+  function setUp(select) {
+    const url = select.dataset.autocompleteUrl;
+    const input = document.createElement("input");
+    input.type = "search";
+    input.className = "form-control mb-1";
+    input.placeholder = "Search";
+    input.autocomplete = "off";
+    const results = document.createElement("div");
+    results.className = "list-group mb-2";
+    select.before(input, results);
+
+    let latest = 0;
+    let timer = null;
+
+    function option(id) {
+      return Array.from(select.options).find(function (option) {
+        return option.value === String(id);
+      });
+    }
+
+    function choose(item, button) {
+      let chosen = option(item.id);
+      if (!chosen) {
+        chosen = new Option(item.text, item.id);
+        select.add(chosen);
+      }
+      // A multiple select toggles; a single one replaces its choice.
+      chosen.selected = select.multiple ? !chosen.selected : true;
+      if (select.multiple) {
+        button.classList.toggle("active", chosen.selected);
+      } else {
+        results.replaceChildren();
+        input.value = "";
+      }
+    }
+
+    function show(data, append) {
+      if (!append) {
+        results.replaceChildren();
+      }
+      const more = results.querySelector("[data-more]");
+      if (more) {
+        more.remove();
+      }
+      data.results.forEach(function (item) {
+        const button = document.createElement("button");
+        button.type = "button";
+        button.className = "list-group-item list-group-item-action";
+        button.textContent = item.text;
+        const chosen = option(item.id);
+        button.classList.toggle("active", Boolean(chosen && chosen.selected));
+        button.addEventListener("click", function () {
+          choose(item, button);
+        });
+        results.append(button);
+      });
+      if (data.next) {
+        const button = document.createElement("button");
+        button.type = "button";
+        button.className = "list-group-item list-group-item-action text-muted";
+        button.dataset.more = "";
+        button.textContent = "More";
+        button.addEventListener("click", function () {
+          load(data.next);
+        });
+        results.append(button);
+      }
+    }
+
+    function load(cursor) {
+      const params = new URLSearchParams({q: input.value});
+      if (cursor) {
+        params.set("cursor", cursor);
+      }
+      const request = ++latest;
+      fetch(url + "?" + params, {headers: {Accept: "application/json"}})
+        .then(function (response) {
+          return response.json();
+        })
+        .then(function (data) {
+          // Answers to earlier keystrokes may arrive late; keep the newest.
+          if (request === latest && data.results) {
+            show(data, Boolean(cursor));
+          }
+        });
+    }
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(load, 250);
+    });
+    input.addEventListener("focus", function () {
+      if (!results.hasChildNodes()) {
+        load();
+      }
+    });
+  }
+
+  document.querySelectorAll("select[data-autocomplete-url]").forEach(setUp);
+})();
@@ -0,0 +1,164 @@
+// Applies the live updates streamed from /live/ (kitchen_core.live) to the
+// dish list and cook detail pages, so the kitchen screens stay current
+// without reloading. Elements are found by their data-* attributes.
+// Where the stream isn't served (WSGI answers 204), the page stays as it
+// was rendered and says so in its [data-live-status] element.
+(function () {
+  "use strict";
+
+  const url = document.currentScript.dataset.url;
+  if (!url) {
+    return;
+  }
+
+  function unavailable() {
+    document.querySelectorAll("[data-live-status]").forEach(function (status) {
+      status.hidden = false;
+    });
+  }
+
+  if (!window.EventSource) {
+    unavailable();
+    return;
+  }
+
+  function each(selector, callback) {
+    document.querySelectorAll(selector).forEach(callback);
+  }
+
+  function changeDishCount(delta) {
+    each("[data-cook-dish-count]", function (count) {
+      count.textContent = Number(count.textContent) + delta;
+    });
+  }
+
+  function toggleEmpty(list) {
+    list.querySelector("[data-empty]").hidden = list.querySelector("[data-dish]") !== null;
+  }
+
+  // Dish list: the "Cook" cell of each row.
+  function updateCooks(dishId, change) {
+    each('[data-dish="' + dishId + '"] [data-dish-cooks]', function (cell) {
+      const cooks = change(Array.from(cell.querySelectorAll("[data-cook]"), function (span) {
+        return [span.dataset.cook, span.textContent];
+      }));
+      cell.replaceChildren();
+      if (!cooks.length) {
+        const empty = document.createElement("em");
+        empty.textContent = "No cooks";
+        cell.append(empty);
+      }
+      cooks.forEach(function (cook, index) {
+        const span = document.createElement("span");
+        span.dataset.cook = cook[0];
+        span.textContent = cook[1];
+        cell.append(index ? ", " : "", span);
+      });
+    });
+  }
+
+  // Cook detail: one block per assigned dish.
+  function dishBlock(id, dish) {
+    const block = document.createElement("div");
+    block.dataset.dish = id;
+    block.innerHTML =
+      "<hr>" +
+      "<p><strong>Name:</strong> <span data-dish-name></span></p>" +
+      "<p><strong>Dish Type:</strong> <span data-dish-type></span></p>";
+    block.querySelector("[data-dish-name]").textContent = dish.name;
+    const dishType = block.querySelector("[data-dish-type]");
+    dishType.dataset.dishType = dish.dish_type.id;
+    dishType.textContent = dish.dish_type.name;
+    return block;
+  }
+
+  const source = new EventSource(url);
+  let connected = false;
+
+  source.addEventListener("error", function () {
+    // EventSource gives up on a 204 or an error status; it retries only
+    // dropped connections.
+    if (source.readyState === EventSource.CLOSED) {
+      unavailable();
+    }
+  });
+
+  source.addEventListener("open", function () {
+    // EventSource reconnects by itself; reload for what was missed meanwhile.
+    if (connected) {
+      location.reload();
+    }
+    connected = true;
+  });
+
+  source.addEventListener("resync", function () {
+    source.close();
+    location.reload();
+  });
+
+  source.addEventListener("assignments", function (message) {
+    const event = JSON.parse(message.data);
+    event.removed.forEach(function (pair) {
+      const cookId = String(pair[0]);
+      const dishId = pair[1];
+      updateCooks(dishId, function (cooks) {
+        return cooks.filter(function (cook) { return cook[0] !== cookId; });
+      });
+      each('[data-cook-dishes="' + cookId + '"]', function (list) {
+        const block = list.querySelector('[data-dish="' + dishId + '"]');
+        if (block) {
+          block.remove();
+          toggleEmpty(list);
+          changeDishCount(-1);
+        }
+      });
+    });
+    event.added.forEach(function (pair) {
+      const cookId = String(pair[0]);
+      const dishId = pair[1];
+      updateCooks(dishId, function (cooks) {
+        const assigned = cooks.some(function (cook) { return cook[0] === cookId; });
+        return assigned ? cooks : cooks.concat([[cookId, event.cooks[cookId]]]);
+      });
+      each('[data-cook-dishes="' + cookId + '"]', function (list) {
+        if (!list.querySelector('[data-dish="' + dishId + '"]')) {
+          list.append(dishBlock(dishId, event.dishes[dishId]));
+          toggleEmpty(list);
+          changeDishCount(1);
+        }
+      });
+    });
+  });
+
+  source.addEventListener("dish", function (message) {
+    const dish = JSON.parse(message.data);
+    if (dish.deleted) {
+      each('[data-dish="' + dish.id + '"]', function (element) {
+        const list = element.closest("[data-cook-dishes]");
+        element.remove();
+        if (list) {
+          toggleEmpty(list);
+          changeDishCount(-1);
+        }
+      });
+      return;
+    }
+    each('[data-dish="' + dish.id + '"] [data-dish-name]', function (name) {
+      name.textContent = dish.name;
+    });
+    each('[data-dish="' + dish.id + '"] [data-dish-type]', function (dishType) {
+      dishType.dataset.dishType = dish.dish_type.id;
+      dishType.textContent = dish.dish_type.name;
+    });
+  });
+
+  source.addEventListener("dish_type", function (message) {
+    const dishType = JSON.parse(message.data);
+    // A deleted type's dishes arrive as deleted dishes.
+    if (!dishType.deleted) {
+      each('[data-dish-type="' + dishType.id + '"]', function (element) {
+        element.textContent = dishType.name;
+      });
+    }
+  });
+})();
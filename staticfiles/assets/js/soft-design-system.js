@@ -1,102 +0,0 @@
-/*!
-
-=========================================================
-* Soft UI Design System - v1.0.1
-=========================================================
-
-* Product Page: https://www.creative-tim.com/product/black-dashboard
-* Copyright site.year Creative Tim (https://www.creative-tim.com)
-* Licensed under MIT (https://github.com/creativetimofficial/black-dashboard/blob/master/LICENSE.md)
-
-* Coded by Creative Tim
-
-=========================================================
-
-* The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
-
-*/
-
-// initialization of Popovers
-var popoverTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="popover"]'))
-var popoverList = popoverTriggerList.map(function(popoverTriggerEl) {
-  return new bootstrap.Popover(popoverTriggerEl)
-})
-
-// initialization of Tooltips
-var tooltipTriggerList = [].slice.call(document.querySelectorAll('[data-bs-toggle="tooltip"]'))
-var tooltipList = tooltipTriggerList.map(function(tooltipTriggerEl) {
-  return new bootstrap.Tooltip(tooltipTriggerEl)
-})
-
-// helper for adding on all elements multiple attributes
-function setAttributes(el, options) {
-  Object.keys(options).forEach(function(attr) {
-    el.setAttribute(attr, options[attr]);
-  })
-}
-
-// activate popovers
-var popoverTriggerList = [].slice.call(document.querySelectorAll('[data-toggle="popover"]'))
-var popoverList = popoverTriggerList.map(function(popoverTriggerEl) {
-  return new bootstrap.Popover(popoverTriggerEl)
-})
-
-// activate tooltips
-var tooltipTriggerList = [].slice.call(document.querySelectorAll('[data-toggle="tooltip"]'))
-var tooltipList = tooltipTriggerList.map(function(tooltipTriggerEl) {
-  return new bootstrap.Tooltip(tooltipTriggerEl)
-})
-
-// Copy code function
-
-function copyCode(el) {
-  const selection = window.getSelection();
-  const range = document.createRange();
-  const textToCopy = el.nextElementSibling;
-  range.selectNodeContents(textToCopy);
-  selection.removeAllRanges();
-  selection.addRange(range);
-  const successful = document.execCommand('copy');
-  window.getSelection().removeAllRanges()
-  if (!el.parentElement.querySelector('.alert')) {
-    var alert = document.createElement('div');
-    alert.classList.add('alert', 'alert-success', 'position-absolute', 'top-0', 'border-0', 'text-white', 'w-25', 'end-0', 'start-0', 'mt-2', 'mx-auto', 'py-2');
-    alert.style.transform = 'translate3d(0px, 0px, 0px)'
-    alert.style.opacity = '0';
-    alert.style.transition = '.35s ease';
-    setTimeout(function() {
-      alert.style.transform = 'translate3d(0px, 20px, 0px)';
-      alert.style.setProperty("opacity", "1", "important");
-    }, 100);
-    alert.innerHTML = "Code successfully copied!";
-    el.parentElement.appendChild(alert);
-    setTimeout(function() {
-      alert.style.transform = 'translate3d(0px, 0px, 0px)'
-      alert.style.setProperty("opacity", "0", "important");
-    }, 2000);
-    setTimeout(function() {
-      el.parentElement.querySelector('.alert').remove();
-    }, 2500);
-  }
-}
-
-// End copy code function
-
-// Returns a function, that, as long as it continues to be invoked, will not
-// be triggered. The function will be called after it stops being called for
-// N milliseconds. If `immediate` is passed, trigger the function on the
-// leading edge, instead of the trailing.
-
-function debounce(func, wait, immediate) {
-  var timeout;
-  return function() {
-    var context = this,
-      args = arguments;
-    clearTimeout(timeout);
-    timeout = setTimeout(function() {
-      timeout = null;
-      if (!immediate) func.apply(context, args);
-    }, wait);
-    if (immediate && !timeout) func.apply(context, args);
-  };
-};
\ No newline at end of file
@@ -1 +0,0 @@
-var popoverTriggerList=[].slice.call(document.querySelectorAll('[data-bs-toggle="popover"]')),popoverList=popoverTriggerList.map(function(t){return new bootstrap.Popover(t)}),tooltipTriggerList=[].slice.call(document.querySelectorAll('[data-bs-toggle="tooltip"]')),tooltipList=tooltipTriggerList.map(function(t){return new bootstrap.Tooltip(t)});function setAttributes(e,o){Object.keys(o).forEach(function(t){e.setAttribute(t,o[t])})}popoverList=(popoverTriggerList=[].slice.call(document.querySelectorAll('[data-toggle="popover"]'))).map(function(t){return new bootstrap.Popover(t)}),tooltipList=(tooltipTriggerList=[].slice.call(document.querySelectorAll('[data-toggle="tooltip"]'))).map(function(t){return new bootstrap.Tooltip(t)});function copyCode(t){const e=window.getSelection(),o=document.createRange();var r=t.nextElementSibling;o.selectNodeContents(r),e.removeAllRanges(),e.addRange(o);var n;document.execCommand("copy");window.getSelection().removeAllRanges(),t.parentElement.querySelector(".alert")||((n=document.createElement("div")).classList.add("alert","alert-success","position-absolute","top-0","border-0","text-white","w-25","end-0","start-0","mt-2","mx-auto","py-2"),n.style.transform="translate3d(0px, 0px, 0px)",n.style.opacity="0",n.style.transition=".35s ease",setTimeout(function(){n.style.transform="translate3d(0px, 20px, 0px)",n.style.setProperty("opacity","1","important")},100),n.innerHTML="Code successfully copied!",t.parentElement.appendChild(n),setTimeout(function(){n.style.transform="translate3d(0px, 0px, 0px)",n.style.setProperty("opacity","0","important")},2e3),setTimeout(function(){t.parentElement.querySelector(".alert").remove()},2500))}function debounce(o,r,n){var l;return function(){var t=this,e=arguments;clearTimeout(l),l=setTimeout(function(){l=null,n||o.apply(t,e)},r),n&&!l&&o.apply(t,e)}}
@@ -0,0 +1,115 @@
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core.api import Resource
+from kitchen_core.models import DishType, Dish
+
+
+class ApiTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="chef", password="x", first_name="Vanessa"
+        )
+        self.client.force_login(self.user)
+        self.soup = DishType.objects.create(name="Soup")
+        for i in range(5):
+            dish = Dish.objects.create(
+                name=f"Dish {i}",
+                description="Dish",
+                price="10.50",
+                dish_type=self.soup,
+            )
+            dish.cooks.add(self.user)
+
+    def get(self, name, *args, **params):
+        return self.client.get(reverse(f"kitchen_core:{name}", args=args), params)
+
+    def test_login_required(self):
+        self.client.logout()
+        self.assertEqual(self.get("api-dish-list").status_code, 403)
+
+    def test_sparse_fields(self):
+        data = self.get("api-dish-list", fields="name,price").json()["data"]
+        self.assertEqual(data[0], {"id": data[0]["id"], "name": "Dish 0", "price": "10.50"})
+
+    def test_relations_render_as_ids_unless_included(self):
+        data = self.get("api-dish-list", fields="dish_type,cooks").json()["data"]
+        self.assertEqual(data[0]["dish_type"], self.soup.pk)
+        self.assertEqual(data[0]["cooks"], [self.user.pk])
+
+    def test_include_is_resolved_without_per_row_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(
+                "api-dish-list",
+                fields="name",
+                include="dish_type,cooks",
+                **{"fields[cooks]": "first_name"},
+            )
+        data = response.json()["data"]
+        self.assertEqual(data[0]["dish_type"], {
+            "id": self.soup.pk,
+            "name": "Soup",
+            "dish_count": 5,
+            "cook_count": 1,
+            "price_min": "10.50",
+            "price_avg": "10.50",
+            "price_max": "10.50",
+            "updated_at": data[0]["dish_type"]["updated_at"],
+        })
+        self.assertEqual(data[0]["cooks"], [{"id": self.user.pk, "first_name": "Vanessa"}])
+        # session, user, dishes joined with dish types, cooks
+        self.assertEqual(len(queries), 4)
+
+    def test_unknown_field_or_include(self):
+        self.assertEqual(self.get("api-dish-list", fields="password").status_code, 400)
+        self.assertEqual(self.get("api-cook-list", fields="password").status_code, 400)
+        self.assertEqual(self.get("api-dish-type-list", include="dishes").status_code, 400)
+
+    def test_cursor_pagination(self):
+        names = []
+        response = self.get("api-dish-list", fields="name", limit=2).json()
+        while True:
+            names += [dish["name"] for dish in response["data"]]
+            if not response["next"]:
+                break
+            response = self.client.get(response["next"]).json()
+        self.assertEqual(names, [f"Dish {i}" for i in range(5)])
+        self.assertIsNotNone(response["previous"])
+        self.assertEqual(self.get("api-dish-list", cursor="garbage").status_code, 400)
+
+    def test_detail(self):
+        dish = Dish.objects.first()
+        response = self.get("api-dish-detail", dish.pk, fields="name")
+        self.assertEqual(response.json(), {"data": {"id": dish.pk, "name": dish.name}})
+        self.assertEqual(self.get("api-dish-detail", dish.pk + 100).status_code, 404)
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_ndjson_stream(self):
+        response = self.get("api-dish-list", format="ndjson", include="cooks")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        with CaptureQueriesContext(connection) as queries:
+            rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["cooks"][0]["username"], "chef")
+        # One cursor read in three chunks, one cooks prefetch per chunk.
+        self.assertEqual(len(queries), 4)
+
+    @mock.patch("kitchen_core.streaming.CHUNKS_PER_CALL", 2)
+    async def test_ndjson_stream_is_not_buffered_under_asgi(self):
+        await self.async_client.aforce_login(self.user)
+        url = reverse("kitchen_core:api-dish-list")
+        patched = mock.patch.object(Resource, "serialize", autospec=True, side_effect=Resource.serialize)
+        with patched as serialize:
+            response = await self.async_client.get(url, {"format": "ndjson"})
+            self.assertTrue(response.is_async)
+            lines = aiter(response.streaming_content)
+            self.assertEqual(json.loads(await anext(lines))["name"], "Dish 0")
+            self.assertEqual(serialize.call_count, 2)
+            self.assertEqual(len([line async for line in lines]), 4)
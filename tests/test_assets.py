@@ -0,0 +1,62 @@
+import json
+import shutil
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from kitchen_core.management.commands.asset_report import page_assets
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+
+
+class PageAssetsTests(SimpleTestCase):
+    def test_only_local_static_files(self):
+        html = """
+            <link href="/static/assets/css/site.css?v=1.0.1" rel="stylesheet">
+            <link href="https://cdn.example.com/bootstrap.css" rel="stylesheet">
+            <script src="/static/assets/js/site.js"></script>
+            <img src="/static/assets/js/site.js">
+            <a href="/dishes/">Dishes</a>
+        """
+        self.assertEqual(page_assets(html), ["assets/css/site.css", "assets/js/site.js"])
+
+
+class AssetReportTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.static_root)
+        cls.production = override_settings(STATIC_ROOT=cls.static_root, STORAGES=STORAGES)
+        cls.production.enable()
+        cls.addClassCleanup(cls.production.disable)
+        # Fails if a stylesheet refers to a file that doesn't exist.
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def setUp(self):
+        get_user_model().objects.create_superuser(username="admin", password="qaz2wsx3edc")
+
+    def report(self):
+        out = StringIO()
+        call_command("asset_report", stdout=out)
+        return json.loads(out.getvalue())["pages"]
+
+    def test_every_linked_asset_is_hashed_and_found(self):
+        for name, page in self.report().items():
+            with self.subTest(page=name):
+                self.assertEqual(page["missing"], 0)
+                self.assertEqual(page["immutable"], len(page["assets"]))
+
+    def test_text_assets_are_precompressed(self):
+        for path, sizes in self.report()["kitchen_core:index"]["assets"].items():
+            if path.endswith((".css", ".js", ".svg")):
+                with self.subTest(path=path):
+                    self.assertIn("br", sizes)
+                    self.assertIn("gzip", sizes)
+                    self.assertLess(sizes["served"], sizes["raw"])
@@ -0,0 +1,233 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed
+from django.test import TestCase
+from django.urls import reverse
+
+from kitchen_core.assignments import apply_assignments, set_assignment
+from kitchen_core.models import DishType, Dish
+from kitchen_core.signals import assignments_changed
+
+
+class SetAssignmentTests(TestCase):
+    def setUp(self):
+        self.cook = get_user_model().objects.create_user(username="chef")
+        self.dish = Dish.objects.create(
+            name="Kulebyaka",
+            description="Pie",
+            price="15.00",
+            dish_type=DishType.objects.create(name="Pies"),
+        )
+
+    def test_toggle(self):
+        self.assertTrue(set_assignment(self.cook, self.dish.pk))
+        self.assertIn(self.cook, self.dish.cooks.all())
+        self.assertFalse(set_assignment(self.cook, self.dish.pk))
+        self.assertNotIn(self.cook, self.dish.cooks.all())
+
+    def test_explicit_state_is_idempotent(self):
+        self.assertTrue(set_assignment(self.cook, self.dish.pk, assign=True))
+        self.assertTrue(set_assignment(self.cook, self.dish.pk, assign=True))
+        self.assertEqual(self.dish.cooks.count(), 1)
+        self.assertFalse(set_assignment(self.cook, self.dish.pk, assign=False))
+        self.assertFalse(set_assignment(self.cook, self.dish.pk, assign=False))
+        self.assertEqual(self.dish.cooks.count(), 0)
+
+    def test_no_signal_when_a_concurrent_request_inserted_the_row(self):
+        self.dish.cooks.add(self.cook)
+        received = []
+        m2m_changed.connect(lambda **kwargs: received.append(kwargs["action"]), weak=False, dispatch_uid="test")
+        self.addCleanup(m2m_changed.disconnect, dispatch_uid="test")
+        # The row appears between the existence check and the insert.
+        with mock.patch.object(QuerySet, "exists", side_effect=[False, True]):
+            self.assertTrue(set_assignment(self.cook, self.dish.pk, assign=True))
+        self.assertEqual(received, [])
+        self.assertEqual(self.dish.cooks.count(), 1)
+
+    def test_missing_dish(self):
+        self.assertIsNone(set_assignment(self.cook, self.dish.pk + 1))
+
+    def test_query_count_does_not_depend_on_cook_count(self):
+        for i in range(20):
+            self.dish.cooks.add(get_user_model().objects.create_user(username=f"cook{i}"))
+        # savepoint, delete, dish lookup, savepoint, insert, release, touch
+        # cook and dish, dish type lookup, cook and dish stats, the cook's
+        # dishes of that type, dish type stats, release
+        with self.assertNumQueries(14):
+            set_assignment(self.cook, self.dish.pk)
+        # savepoint, delete, touch cook and dish, stats as above, release
+        with self.assertNumQueries(10):
+            set_assignment(self.cook, self.dish.pk)
+
+
+class ToggleAssignViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+        )
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        self.dish = Dish.objects.create(
+            name="Kulebyaka",
+            description="Pie",
+            price="15.00",
+            dish_type=DishType.objects.create(name="Pies"),
+        )
+        self.url = reverse("kitchen_core:toggle-assign-dish", args=[self.dish.pk])
+
+    def test_json_response(self):
+        response = self.client.post(self.url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.json(), {"dish": self.dish.pk, "assigned": True})
+        response = self.client.post(self.url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.json(), {"dish": self.dish.pk, "assigned": False})
+
+    def test_htmx_response_renders_button(self):
+        response = self.client.post(self.url, {"assign": "1"}, HTTP_HX_REQUEST="true")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'name="assign" value="0"')
+        self.assertIn(self.user, self.dish.cooks.all())
+
+    def test_missing_dish_returns_404(self):
+        url = reverse("kitchen_core:toggle-assign-dish", args=[self.dish.pk + 1])
+        self.assertEqual(self.client.post(url).status_code, 404)
+
+
+class ApplyAssignmentsTests(TestCase):
+    def setUp(self):
+        self.cooks = [get_user_model().objects.create_user(username=f"cook{i}") for i in range(3)]
+        dish_type = DishType.objects.create(name="Pies")
+        self.dishes = [
+            Dish.objects.create(name=f"Pie {i}", description="Pie", price="5.00", dish_type=dish_type)
+            for i in range(3)
+        ]
+        self.dishes[0].cooks.add(self.cooks[0])
+
+    def test_results_per_item(self):
+        cook, dish = self.cooks[0].pk, self.dishes[0].pk
+        results = apply_assignments([
+            (cook, dish, "add"),
+            (cook, self.dishes[1].pk, "add"),
+            (self.cooks[1].pk, dish, "remove"),
+            (cook, 999, "add"),
+            (999, dish, "add"),
+            (cook, dish, "swap"),
+        ])
+        self.assertEqual(results, [
+            "already_assigned", "added", "not_assigned",
+            "unknown_dish", "unknown_cook", "invalid_action",
+        ])
+        self.assertEqual(
+            set(self.cooks[0].dishes.values_list("pk", flat=True)),
+            {self.dishes[0].pk, self.dishes[1].pk},
+        )
+
+    def test_last_action_for_a_pair_wins(self):
+        cook, dish = self.cooks[0].pk, self.dishes[0].pk
+        results = apply_assignments([(cook, dish, "add"), (cook, dish, "remove")])
+        self.assertEqual(results, ["superseded", "removed"])
+        self.assertFalse(self.dishes[0].cooks.exists())
+
+    def test_batch_uses_constant_queries_and_one_signal(self):
+        received = []
+
+        def listener(sender, added, removed, **kwargs):
+            received.append((sorted(added), sorted(removed)))
+
+        assignments_changed.connect(listener)
+        self.addCleanup(assignments_changed.disconnect, listener)
+        items = [
+            (cook.pk, dish.pk, "add") for cook in self.cooks for dish in self.dishes
+        ] + [(self.cooks[0].pk, self.dishes[0].pk, "remove")]
+        # cooks, dishes, savepoint, existing rows, delete, insert,
+        # touch cooks and dishes, dish types, cook and dish stats, the
+        # cooks' dishes of those types, dish type stats, release
+        with self.assertNumQueries(14):
+            apply_assignments(items)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(len(received[0][0]), 8)
+        self.assertEqual(received[0][1], [(self.cooks[0].pk, self.dishes[0].pk)])
+
+    def test_rows_changed_by_a_concurrent_request_are_not_reported(self):
+        received = []
+
+        def listener(sender, added, removed, **kwargs):
+            received.append((added, removed))
+
+        values_list = QuerySet.values_list
+
+        def read_then_race(queryset, *fields, **kwargs):
+            rows = values_list(queryset, *fields, **kwargs)
+            if fields == ("pk", "cook_id", "dish_id"):
+                # Another request changes the same rows right after they're read.
+                len(rows)
+                self.dishes[0].cooks.remove(self.cooks[0])
+                self.dishes[1].cooks.add(self.cooks[0])
+            return rows
+
+        assignments_changed.connect(listener)
+        self.addCleanup(assignments_changed.disconnect, listener)
+        with mock.patch.object(QuerySet, "values_list", autospec=True, side_effect=read_then_race):
+            results = apply_assignments([
+                (self.cooks[0].pk, self.dishes[0].pk, "remove"),
+                (self.cooks[0].pk, self.dishes[1].pk, "add"),
+                (self.cooks[1].pk, self.dishes[1].pk, "add"),
+            ])
+        self.assertEqual(results, ["not_assigned", "already_assigned", "added"])
+        self.assertEqual(received, [([(self.cooks[1].pk, self.dishes[1].pk)], [])])
+
+
+class BulkAssignCommandTests(TestCase):
+    def test_command_reads_csv(self):
+        cook = get_user_model().objects.create_user(username="chef")
+        dish = Dish.objects.create(
+            name="Pie", description="Pie", price="5.00",
+            dish_type=DishType.objects.create(name="Pies"),
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+            f.write(f"cook,dish,action\n{cook.pk},{dish.pk},add\n")
+        self.addCleanup(os.remove, f.name)
+        out = StringIO()
+        call_command("bulk_assign", f.name, stdout=out)
+        self.assertIn("added: 1", out.getvalue())
+        self.assertIn(cook, dish.cooks.all())
+
+
+class BulkAssignViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="manager",
+            password="qaz2wsx3edc",
+        )
+        self.client.login(username="manager", password="qaz2wsx3edc")
+        self.dish = Dish.objects.create(
+            name="Pie", description="Pie", price="5.00",
+            dish_type=DishType.objects.create(name="Pies"),
+        )
+        self.url = reverse("kitchen_core:bulk-assign")
+
+    def post(self, payload):
+        return self.client.post(self.url, json.dumps(payload), content_type="application/json")
+
+    def test_requires_permission(self):
+        response = self.post({"assignments": []})
+        self.assertEqual(response.status_code, 403)
+
+    def test_bulk_assign(self):
+        self.user.user_permissions.add(Permission.objects.get(codename="change_dish"))
+        response = self.post({"assignments": [
+            {"cook": self.user.pk, "dish": self.dish.pk, "action": "add"},
+        ]})
+        self.assertEqual(response.json()["results"][0]["result"], "added")
+        self.assertIn(self.user, self.dish.cooks.all())
+
+    def test_malformed_payload(self):
+        self.user.user_permissions.add(Permission.objects.get(codename="change_dish"))
+        self.assertEqual(self.post({"items": []}).status_code, 400)
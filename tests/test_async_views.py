@@ -0,0 +1,167 @@
+import asyncio
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+
+from kitchen_core import async_views, conditional, urls
+from kitchen_core.models import DishType, Dish
+
+urlpatterns = [
+    path("", include((urls.get_urlpatterns(async_views), urls.app_name))),
+    path("accounts/", include("django.contrib.auth.urls")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="x",
+            first_name="Vanessa",
+            last_name="Maev",
+        )
+        self.client.force_login(self.user)
+        self.async_client.force_login(self.user)
+        self.dish_type = DishType.objects.create(name="Soup")
+        self.dishes = [
+            Dish.objects.create(
+                name=f"Borscht {i}",
+                description="Soup",
+                price="9.00",
+                dish_type=self.dish_type,
+            )
+            for i in range(7)
+        ]
+        self.dishes[0].cooks.add(self.user)
+
+    def test_views_are_async(self):
+        self.assertTrue(async_views.DishListView.view_is_async)
+        self.assertTrue(async_views.CookDetailView.view_is_async)
+
+    async def test_index(self):
+        response = await self.async_client.get(reverse("kitchen_core:index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["num_dishes"], 7)
+        self.assertEqual(response.context["num_cooks"], 1)
+
+    async def test_login_required(self):
+        await self.async_client.alogout()
+        for name, args in [("index", []), ("dish-list", []), ("dish-detail", [self.dishes[0].pk])]:
+            response = await self.async_client.get(reverse(f"kitchen_core:{name}", args=args))
+            self.assertEqual(response.status_code, 302)
+            self.assertTrue(response.url.startswith("/accounts/login/"))
+
+    async def test_list_views_match_sync_views(self):
+        for name, query in [
+            ("dish-type-list", {}),
+            ("dish-list", {"page": 2}),
+            ("dish-list", {"name": "Borscht 3"}),
+            ("cook-list", {}),
+        ]:
+            url = reverse(f"kitchen_core:{name}")
+            response = await self.async_client.get(url, query)
+            with override_settings(ROOT_URLCONF="Restaurant_kitchen_service.urls"):
+                expected = await self.async_client.get(url, query)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                list(response.context["object_list"]),
+                list(expected.context["object_list"]),
+            )
+            self.assertEqual(
+                response.context["paginator"].count,
+                expected.context["paginator"].count,
+            )
+
+    async def test_page_rows_are_loaded_before_rendering(self):
+        response = await self.async_client.get(reverse("kitchen_core:cook-list"))
+        self.assertIsInstance(response.context["page_obj"].object_list, list)
+
+    @override_settings(CURSOR_PAGINATION=True)
+    async def test_cursor_pagination(self):
+        url = reverse("kitchen_core:dish-list")
+        response = await self.async_client.get(url)
+        page = response.context["page_obj"]
+        self.assertEqual([dish.name for dish in page], [f"Borscht {i}" for i in range(5)])
+        response = await self.async_client.get(url, {"cursor": page.next_cursor})
+        self.assertEqual(len(response.context["page_obj"]), 2)
+        response = await self.async_client.get(url, {"cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_detail_views(self):
+        dish = self.dishes[0]
+        response = await self.async_client.get(reverse("kitchen_core:dish-detail", args=[dish.pk]))
+        self.assertTrue(response.context["dish"].is_assigned)
+        # Validated by updated_at without a shared cache.
+        self.assertIn("ETag", response)
+        response = await self.async_client.get(reverse("kitchen_core:cook-detail", args=[self.user.pk]))
+        self.assertContains(response, dish.name)
+        response = await self.async_client.get(
+            reverse("kitchen_core:dish-type-detail", args=[self.dish_type.pk])
+        )
+        self.assertContains(response, "Borscht 6")
+        response = await self.async_client.get(reverse("kitchen_core:dish-detail", args=[dish.pk + 100]))
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        CACHE_SHARED=True,
+    )
+    async def test_conditional_get(self):
+        url = reverse("kitchen_core:dish-list")
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(CACHE_SHARED=True)
+    async def test_etag_is_computed_off_the_event_loop(self):
+        loops = []
+
+        def get_version(*models):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return "1"
+
+        with mock.patch.object(conditional, "get_version", get_version):
+            response = await self.async_client.get(reverse("kitchen_core:dish-detail", args=[self.dishes[0].pk]))
+        self.assertIn("ETag", response)
+        self.assertEqual(loops, [None])
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+        CACHE_SHARED=True,
+        FRAGMENT_CACHE_TIMEOUT=60,
+    )
+    async def test_cache_is_not_read_on_the_event_loop(self):
+        calls = []
+
+        def spy(method):
+            def wrapper(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    calls.append(method.__name__)
+                except RuntimeError:
+                    pass
+                return method(*args, **kwargs)
+            return wrapper
+
+        methods = ["get", "get_many", "set", "set_many", "add", "incr", "delete"]
+        with mock.patch.multiple(
+            LocMemCache, **{name: spy(getattr(LocMemCache, name)) for name in methods}
+        ):
+            for url in [
+                reverse("kitchen_core:dish-list"),
+                reverse("kitchen_core:dish-detail", args=[self.dishes[0].pk]),
+            ]:
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 200)
+        self.assertEqual(calls, [])
+
+    async def test_post_not_allowed(self):
+        response = await self.async_client.post(reverse("kitchen_core:dish-list"))
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core.forms import DishForm
+from kitchen_core.models import Cook, Dish, DishType
+
+
+class LookupViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="admin", password="x")
+        self.client.force_login(self.user)
+        self.dish_types = [DishType.objects.create(name=name) for name in ("Dessert", "Salad", "Soup")]
+
+    def lookup(self, name, **params):
+        return self.client.get(reverse("kitchen_core:lookup", args=[name]), params)
+
+    @override_settings(LOOKUP_PAGE_SIZE=2)
+    def test_pages(self):
+        first = self.lookup("dish-types").json()
+        self.assertEqual(first["results"], [
+            {"id": self.dish_types[0].pk, "text": "Dessert"},
+            {"id": self.dish_types[1].pk, "text": "Salad"},
+        ])
+        second = self.lookup("dish-types", cursor=first["next"]).json()
+        self.assertEqual(second, {"results": [{"id": self.dish_types[2].pk, "text": "Soup"}], "next": None})
+
+    def test_search(self):
+        Cook.objects.create(username="ivan", first_name="Ivan", last_name="Petrenko")
+        self.assertEqual([item["text"] for item in self.lookup("dish-types", q="sou").json()["results"]], ["Soup"])
+        self.assertEqual([item["text"] for item in self.lookup("cooks", q="petr").json()["results"]], ["ivan: Ivan Petrenko"])
+
+    def test_errors(self):
+        self.assertEqual(self.lookup("dishes").status_code, 404)
+        self.assertEqual(self.lookup("cooks", cursor="nonsense").status_code, 400)
+        self.client.logout()
+        self.assertEqual(self.lookup("cooks").status_code, 403)
+
+
+class DishFormTests(TestCase):
+    def setUp(self):
+        self.soup = DishType.objects.create(name="Soup")
+        DishType.objects.create(name="Salad")
+        self.cooks = [Cook.objects.create(username=f"cook{i}") for i in range(5)]
+        self.dish = Dish.objects.create(name="Borscht", price="9.00", dish_type=self.soup)
+        self.dish.cooks.add(self.cooks[0])
+
+    def test_renders_only_the_selected_choices(self):
+        html = str(DishForm(instance=self.dish))
+        self.assertIn(f'<option value="{self.soup.pk}" selected>Soup</option>', html)
+        self.assertNotIn("Salad", html)
+        self.assertIn(f'<option value="{self.cooks[0].pk}" selected>{self.cooks[0]}</option>', html)
+        self.assertNotIn(str(self.cooks[1]), html)
+        self.assertIn('data-autocomplete-url="/lookup/cooks/"', html)
+
+    def test_empty_form_has_the_empty_choice_only(self):
+        html = str(DishForm()["dish_type"])
+        self.assertEqual(html.count("<option"), 1)
+        self.assertIn('<option value="" selected>---------</option>', html)
+
+    def test_cleaning_fetches_only_the_submitted_ids(self):
+        form = DishForm(data={
+            "name": "Okroshka",
+            "description": "Cold",
+            "price": "7.00",
+            "dish_type": self.soup.pk,
+            "cooks": [self.cooks[1].pk, self.cooks[2].pk],
+        })
+        # The dish type, the two cooks, and the model validation's existence
+        # check of the dish type.
+        with self.assertNumQueries(3):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(set(form.cleaned_data["cooks"]), set(self.cooks[1:3]))
+
+    def test_invalid_ids(self):
+        form = DishForm(data={"name": "Okroshka", "price": "7.00", "dish_type": "abc", "cooks": ["abc"]})
+        self.assertFalse(form.is_valid())
+        self.assertIn("dish_type", form.errors)
+        # Rendering the bound form with the bad values still works.
+        self.assertIn('data-autocomplete-url="/lookup/dish-types/"', str(form))
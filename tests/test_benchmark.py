@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.template import engines
+from django.test import SimpleTestCase, TestCase
+
+from kitchen_core.management.commands.startup import children, memory
+from kitchen_core.management.commands.throughput import fetch
+from kitchen_core.models import DishType, Dish, Cook
+
+
+class GenerateFixtureTests(TestCase):
+    def test_generates_requested_rows(self):
+        call_command(
+            "generate_fixture",
+            dish_types=3, dishes=20, cooks=5, assignments=30, batch_size=7, seed=1,
+            stdout=StringIO(),
+        )
+        self.assertEqual(DishType.objects.count(), 3)
+        self.assertEqual(Dish.objects.count(), 20)
+        self.assertEqual(Cook.objects.count(), 5)
+        self.assertEqual(Dish.cooks.through.objects.count(), 30)
+        self.assertTrue(Cook.objects.first().check_password("benchmark"))
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_reports_every_url(self):
+        get_user_model().objects.create_superuser(username="admin", password="qaz2wsx3edc")
+        call_command(
+            "generate_fixture",
+            dish_types=2, dishes=5, cooks=2, assignments=3, seed=1,
+            stdout=StringIO(),
+        )
+        out = StringIO()
+        call_command("benchmark", iterations=2, warmup=0, stdout=out)
+        report = json.loads(out.getvalue())
+        results = report["results"]
+        for name in [
+            "index", "dish-list", "dish-detail", "cook-detail", "dish-type-update",
+            "toggle-assign-dish", "admin:kitchen_core_dish_changelist", "dish-list search",
+        ]:
+            self.assertIn(name, results)
+        for name in ["live", "export", "import"]:
+            self.assertNotIn(name, results)
+        self.assertEqual(results["dish-list"]["status"], 200)
+        self.assertEqual(results["toggle-assign-dish"]["status"], 302)
+        self.assertGreater(results["dish-list"]["queries"], 0)
+        self.assertEqual(report["rows"]["dishes"], 5)
+
+
+class ThroughputFetchTests(SimpleTestCase):
+    def test_fetch_sends_the_session_cookie(self):
+        cookies = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                cookies.append(self.headers["Cookie"])
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        status, seconds = fetch("127.0.0.1", server.server_port, "/dish/", "sessionid=abc", delay=0.01)
+        self.assertEqual(status, 204)
+        self.assertGreaterEqual(seconds, 0.01)
+        self.assertEqual(cookies, ["sessionid=abc"])
+
+
+class StartupTests(TestCase):
+    # warm_up() connects to every configured database.
+    databases = "__all__"
+
+    def test_warm_up_compiles_templates(self):
+        from kitchen_core.warmup import warm_up
+
+        loader = engines["django"].engine.template_loaders[0]
+        loader.reset()
+        timings = warm_up()
+        self.assertEqual(set(timings), {"urls", "templates", "databases"})
+        self.assertIn("kitchen_core/dish_list.html", loader.get_template_cache)
+
+    @unittest.skipUnless(os.path.exists("/proc/self/smaps_rollup"), "needs Linux /proc")
+    def test_memory(self):
+        usage = memory(os.getpid())
+        self.assertGreater(usage["rss_mb"], 0)
+        self.assertLessEqual(usage["pss_mb"], usage["rss_mb"])
+        self.assertEqual(children(os.getpid()), [])
@@ -0,0 +1,156 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from kitchen_core import changes
+from kitchen_core.imports import CookImporter
+from kitchen_core.models import ChangeLogEntry, Cook, Dish, DishType
+
+
+class ChangeFeedTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="admin", password="x")
+        self.client.force_login(self.user)
+        self.token = self.head()
+
+    def head(self):
+        return self.client.get(reverse("kitchen_core:changes")).json()["next"]
+
+    def feed(self, since=None, **params):
+        since = self.token if since is None else since
+        return self.client.get(reverse("kitchen_core:changes"), {"since": since, **params})
+
+    def change(self, callback):
+        with self.captureOnCommitCallbacks(execute=True):
+            return callback()
+
+    def test_inserts_updates_and_deletes(self):
+        soup = self.change(lambda: DishType.objects.create(name="Soup"))
+        salad = self.change(lambda: DishType.objects.create(name="Salad"))
+        dish = self.change(lambda: Dish.objects.create(name="Borscht", price="9.00", dish_type=soup))
+        self.change(lambda: dish.cooks.add(self.user))
+        self.token = self.head()
+
+        dish.name = "Okroshka"
+        self.change(dish.save)
+        salad_pk = salad.pk
+        self.change(salad.delete)
+        self.change(lambda: self.user.dishes.remove(dish))
+
+        response = self.feed()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["changes"], [
+            {
+                "model": "dish",
+                "action": "update",
+                "id": dish.pk,
+                "data": {"id": dish.pk, "name": "Okroshka", "description": "", "price": "9.00", "dish_type": soup.pk},
+            },
+            {"model": "dish_type", "action": "delete", "id": salad_pk},
+            {"model": "assignment", "action": "delete", "dish": dish.pk, "cook": self.user.pk},
+        ])
+        self.assertFalse(response.json()["more"])
+        self.assertEqual(self.feed(since=response.json()["next"]).json()["changes"], [])
+
+    def test_dish_type_delete_logs_its_dishes_and_assignments(self):
+        soup = self.change(lambda: DishType.objects.create(name="Soup"))
+        dish = self.change(lambda: Dish.objects.create(name="Borscht", price="9.00", dish_type=soup))
+        self.change(lambda: dish.cooks.add(self.user))
+        self.token = self.head()
+        dish_pk, soup_pk = dish.pk, soup.pk
+        self.change(soup.delete)
+        self.assertCountEqual(self.feed().json()["changes"], [
+            {"model": "dish", "action": "delete", "id": dish_pk},
+            {"model": "dish_type", "action": "delete", "id": soup_pk},
+            {"model": "assignment", "action": "delete", "dish": dish_pk, "cook": self.user.pk},
+        ])
+
+    def test_changes_merged_per_object(self):
+        soup = self.change(lambda: DishType.objects.create(name="Soup"))
+        for name in ("Broth", "Stew"):
+            soup.name = name
+            self.change(soup.save)
+        gone = self.change(lambda: DishType.objects.create(name="Gone"))
+        self.change(gone.delete)
+
+        self.assertEqual(self.feed().json()["changes"], [
+            {"model": "dish_type", "action": "create", "id": soup.pk, "data": {"id": soup.pk, "name": "Stew"}},
+        ])
+
+    def test_batches(self):
+        created = [self.change(lambda: DishType.objects.create(name=f"Type {i}")) for i in range(5)]
+        first = self.feed(limit=3).json()
+        self.assertEqual([change["id"] for change in first["changes"]], [obj.pk for obj in created[:3]])
+        self.assertTrue(first["more"])
+        second = self.feed(since=first["next"], limit=3).json()
+        self.assertEqual([change["id"] for change in second["changes"]], [obj.pk for obj in created[3:]])
+        self.assertFalse(second["more"])
+
+    def test_logins_are_not_logged(self):
+        self.change(lambda: self.client.login(username="admin", password="x"))
+        self.assertEqual(self.feed().json()["changes"], [])
+
+    def test_unsettled_entries_wait(self):
+        self.change(lambda: DishType.objects.create(name="Soup"))
+        with override_settings(CHANGE_FEED_SETTLE=60):
+            response = self.feed().json()
+        self.assertEqual(response["changes"], [])
+        self.assertEqual(response["next"], self.token)
+
+    def test_importer_logs_its_upserts(self):
+        existing = Cook.objects.create(username="ivan")
+        self.token = self.head()
+        self.change(lambda: CookImporter().run(enumerate([
+            {"username": "ivan", "first_name": "Ivan"},
+            {"username": "olga", "first_name": "Olga"},
+        ])))
+        olga = Cook.objects.get(username="olga")
+        self.assertEqual(
+            [(change["action"], change["id"]) for change in self.feed().json()["changes"]],
+            [("update", existing.pk), ("create", olga.pk)],
+        )
+
+    def test_invalid_and_expired_tokens(self):
+        self.assertEqual(self.feed(since="abc").status_code, 400)
+        # The migration starts the log with a marker: there is no history
+        # before it to follow.
+        self.assertEqual(self.feed(since=0).status_code, 410)
+        self.change(changes.truncate)
+        self.assertEqual(self.feed().status_code, 410)
+        self.assertEqual(self.feed(since=self.head()).status_code, 200)
+
+    def test_requires_login(self):
+        self.client.logout()
+        self.assertEqual(self.feed().status_code, 403)
+
+
+class CompactTests(TestCase):
+    def log(self, model, object_id, action, days_ago=0):
+        entry = ChangeLogEntry.objects.create(model=model, object_id=object_id, action=action)
+        ChangeLogEntry.objects.filter(pk=entry.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return entry.pk
+
+    def test_compact(self):
+        old = self.log("dish", 1, changes.CREATE, days_ago=40)
+        horizon = self.log("dish", 2, changes.CREATE, days_ago=35)
+        superseded = self.log("dish", 3, changes.CREATE, days_ago=2)
+        kept = [self.log("dish", 3, changes.UPDATE, days_ago=1), self.log("dish", 4, changes.DELETE)]
+
+        out = StringIO()
+        call_command("compact_changes", days=30, stdout=out)
+        self.assertIn("Removed 1 superseded and 3 expired entries.", out.getvalue())
+
+        self.assertFalse(ChangeLogEntry.objects.filter(pk__in=[old, superseded]).exists())
+        self.assertEqual(
+            list(ChangeLogEntry.objects.order_by("pk").values_list("pk", "action")),
+            [(horizon, changes.TRUNCATED)] + [(pk, action) for pk, action in zip(kept, ["update", "delete"])],
+        )
+        with self.assertRaises(changes.Expired):
+            changes.changes_since(old, 10)
+        found, token, more = changes.changes_since(horizon, 10)
+        self.assertEqual([change["id"] for change in found], [4])
@@ -0,0 +1,136 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.http import http_date
+
+from kitchen_core.assignments import apply_assignments
+from kitchen_core.models import DishType, Dish
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    CACHE_SHARED=True,
+)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+        )
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        self.dish_type = DishType.objects.create(name="Main Course")
+        self.dish = Dish.objects.create(
+            name="Varenyky",
+            description="Dumplings",
+            price="12.50",
+            dish_type=self.dish_type,
+        )
+
+    def revalidate(self, url, response, **headers):
+        headers.setdefault("HTTP_IF_NONE_MATCH", response["ETag"])
+        return self.client.get(url, **headers)
+
+    def test_unchanged_list_returns_304_without_the_list_query(self):
+        url = reverse("kitchen_core:dish-list")
+        first = self.client.get(url)
+        self.assertEqual(first["Cache-Control"], "private, no-cache")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.revalidate(url, first)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(any("kitchen_core_dish" in q["sql"] for q in queries))
+
+    def test_edit_changes_etag(self):
+        url = reverse("kitchen_core:dish-type-list")
+        first = self.client.get(url)
+        self.dish_type.name = "Soup"
+        self.dish_type.save()
+        response = self.revalidate(url, first)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Soup")
+
+    def test_query_string_is_part_of_etag(self):
+        url = reverse("kitchen_core:dish-list")
+        first = self.client.get(url)
+        response = self.revalidate(url + "?name=xyz", first)
+        self.assertEqual(response.status_code, 200)
+
+    def test_assignment_changes_dish_detail_etag(self):
+        url = reverse("kitchen_core:dish-detail", args=[self.dish.pk])
+        first = self.client.get(url)
+        self.assertEqual(self.revalidate(url, first).status_code, 304)
+        self.dish.cooks.add(self.user)
+        self.assertEqual(self.revalidate(url, first).status_code, 200)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_no_etag_without_a_shared_cache(self):
+        response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertNotIn("ETag", response)
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+
+    @override_settings(CACHE_SHARED=False)
+    def test_dish_detail_validated_by_updated_at_per_user(self):
+        url = reverse("kitchen_core:dish-detail", args=[self.dish.pk])
+        first = self.client.get(url)
+        self.assertNotIn("Last-Modified", first)
+        self.assertEqual(first["Vary"], "Cookie")
+        self.assertEqual(self.revalidate(url, first).status_code, 304)
+        # Another user's copy shows their own button and CSRF token.
+        other = get_user_model().objects.create_user(username="sous", password="x")
+        self.client.force_login(other)
+        response = self.revalidate(url, first, HTTP_IF_MODIFIED_SINCE=http_date(self.dish.updated_at.timestamp()))
+        self.assertEqual(response.status_code, 200)
+        self.client.force_login(self.user)
+        second = self.client.get(url)
+        self.dish.cooks.add(self.user)
+        self.assertEqual(self.revalidate(url, second).status_code, 200)
+
+    def test_post_is_not_conditional(self):
+        url = reverse("kitchen_core:toggle-assign-dish", args=[self.dish.pk])
+        first = self.client.get(reverse("kitchen_core:dish-detail", args=[self.dish.pk]))
+        response = self.client.post(url, {"assign": "1"}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 302)
+
+
+class UpdatedAtTests(TestCase):
+    def setUp(self):
+        self.cook = get_user_model().objects.create_user(username="chef", password="x")
+        self.dish = Dish.objects.create(
+            name="Borscht",
+            description="Soup",
+            price="9.00",
+            dish_type=DishType.objects.create(name="Soup"),
+        )
+
+    def assertTouched(self, before_dish, before_cook):
+        self.dish.refresh_from_db()
+        self.cook.refresh_from_db()
+        self.assertGreater(self.dish.updated_at, before_dish)
+        self.assertGreater(self.cook.updated_at, before_cook)
+
+    def test_m2m_changes_touch_both_sides(self):
+        for change in (
+            lambda: self.dish.cooks.add(self.cook),
+            lambda: self.cook.dishes.remove(self.dish),
+            lambda: self.cook.dishes.add(self.dish),
+            lambda: self.dish.cooks.clear(),
+        ):
+            before = self.dish.updated_at, self.cook.updated_at
+            change()
+            self.assertTouched(*before)
+
+    def test_shipped_fixture_loads(self):
+        # Raw saves skip auto_now; the column's database default fills it.
+        call_command("loaddata", settings.BASE_DIR / "dump.json", verbosity=0)
+        self.assertFalse(DishType.objects.filter(updated_at__isnull=True).exists())
+        self.assertGreater(Dish.objects.count(), 1)
+
+    def test_bulk_assignments_touch_both_sides(self):
+        before = self.dish.updated_at, self.cook.updated_at
+        apply_assignments([(self.cook.pk, self.dish.pk, "add")])
+        self.assertTouched(*before)
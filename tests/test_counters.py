@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core import counters
+from kitchen_core.models import DishType, Dish, Cook
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+})
+class CounterCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+        )
+        self.dish_type = DishType.objects.create(name="Desserts")
+
+    def create_dish(self, name="Napoleon"):
+        return Dish.objects.create(
+            name=name,
+            description="Layered cake",
+            price="4.50",
+            dish_type=self.dish_type,
+        )
+
+    def test_cached_count_skips_query(self):
+        self.assertEqual(counters.get_count(DishType), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(counters.get_count(DishType), 1)
+
+    def test_signals_keep_counter_current(self):
+        self.assertEqual(counters.get_count(Dish), 0)
+        dish = self.create_dish()
+        self.create_dish("Syrniki")
+        with self.assertNumQueries(0):
+            self.assertEqual(counters.get_count(Dish), 2)
+        dish.delete()
+        with self.assertNumQueries(0):
+            self.assertEqual(counters.get_count(Dish), 1)
+
+    def test_m2m_changes_update_assignment_counter(self):
+        through = Dish.cooks.through
+        dish = self.create_dish()
+        self.assertEqual(counters.get_count(through), 0)
+        dish.cooks.add(self.user)
+        self.assertEqual(counters.get_count(through), 1)
+        dish.cooks.remove(self.user)
+        self.assertEqual(counters.get_count(through), 0)
+
+    def test_filtered_queryset_is_counted_exactly(self):
+        self.create_dish()
+        self.create_dish("Syrniki")
+        queryset = Dish.objects.filter(name__icontains="nik")
+        self.assertEqual(counters.queryset_count(queryset), 1)
+
+    def test_index_uses_counters(self):
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        self.create_dish()
+        response = self.client.get(reverse("kitchen_core:index"))
+        self.assertEqual(response.context["num_dishes"], 1)
+        self.assertEqual(response.context["num_cooks"], Cook.objects.count())
+        self.assertEqual(response.context["num_dish_types"], 1)
@@ -0,0 +1,60 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from kitchen_core.management.commands.explain import seq_scans
+from kitchen_core.models import Cook, Dish, DishType
+from kitchen_core.pagination import CursorPaginator
+
+
+class SeqScanTests(SimpleTestCase):
+    def test_sqlite_plan(self):
+        plan = [
+            "SCAN kitchen_core_dish",
+            "SCAN kitchen_core_cook USING INDEX cook_experience_id_idx",
+            "SEARCH kitchen_core_dishtype USING INTEGER PRIMARY KEY (rowid=?)",
+            "SCAN kitchen_core_dish_fts VIRTUAL TABLE INDEX 0:M1",
+            "SCAN sqlite_master",
+        ]
+        self.assertEqual(seq_scans("sqlite", plan), ["kitchen_core_dish"])
+
+    def test_postgresql_plan(self):
+        plan = [
+            "Limit  (cost=0.28..0.61 rows=6 width=40)",
+            "  ->  Index Scan using dish_name_id_idx on kitchen_core_dish  (cost=0.28..110.28 rows=2000 width=40)",
+            "  ->  Seq Scan on kitchen_core_dishtype  (cost=0.00..1.05 rows=5 width=36)",
+        ]
+        self.assertEqual(seq_scans("postgresql", plan), ["kitchen_core_dishtype"])
+
+
+class ExplainCommandTests(TestCase):
+    def setUp(self):
+        get_user_model().objects.create_superuser(username="admin", password="qaz2wsx3edc")
+        call_command(
+            "generate_fixture",
+            dish_types=2, dishes=30, cooks=5, assignments=10, seed=1,
+            stdout=StringIO(),
+        )
+
+    def test_reports_every_page(self):
+        out = StringIO()
+        call_command("explain", stdout=out)
+        output = out.getvalue()
+        for name in ["dish-list", "dish-type-detail", "cook-list", "admin:kitchen_core_dish_changelist"]:
+            self.assertIn(f"\n{name}: ", f"\n{output}")
+        self.assertIn("queries scan a table sequentially.", output)
+        for name in ["live", "export", "import"]:
+            self.assertNotIn(f"\n{name}: ", f"\n{output}")
+
+    def test_paginated_orderings_use_indexes(self):
+        for queryset, index in [
+            (Dish.objects.all(), "dish_name_id_idx"),
+            (Cook.objects.all(), "cook_experience_id_idx"),
+        ]:
+            page, _, _ = CursorPaginator(queryset, 5)._page_queryset(None)
+            self.assertIn(index, page.explain())
+            self.assertIn(index, queryset[:5].explain())
+        dishes = DishType.objects.first().dishes.all()
+        self.assertIn("dish_type_name_id_idx", dishes.explain())
@@ -0,0 +1,101 @@
+import csv
+import io
+import zipfile
+from unittest import mock
+from xml.etree import ElementTree
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core.exports import XlsxWriter, export
+from kitchen_core.models import DishType, Dish
+
+SHEET = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def read_xlsx(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    return [
+        ["".join(cell.itertext()) for cell in row]
+        for row in root.iter(f"{SHEET}row")
+    ]
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.cook = get_user_model().objects.create_user(
+            username="chef", password="x", first_name="Ivan"
+        )
+        soup = DishType.objects.create(name="Soup")
+        self.dishes = [
+            Dish.objects.create(name=f"Borscht {i}", description="", price="9.50", dish_type=soup)
+            for i in range(5)
+        ]
+        self.dishes[0].cooks.add(self.cook)
+
+    def test_dishes_csv(self):
+        rows = list(csv.reader(io.StringIO(b"".join(export("dishes", "csv")).decode())))
+        self.assertEqual(rows[0], ["id", "name", "dish_type", "price", "cooks"])
+        self.assertEqual(rows[1], [str(self.dishes[0].pk), "Borscht 0", "Soup", "9.50", "chef"])
+        self.assertEqual(len(rows), 6)
+
+    def test_cooks_xlsx(self):
+        rows = read_xlsx(b"".join(export("cooks", "xlsx")))
+        self.assertEqual(rows[0][-1], "dish_count")
+        self.assertEqual(rows[1], [str(self.cook.pk), "chef", "Ivan", "", "", "1"])
+
+    @override_settings(STREAM_CHUNK_SIZE=2)
+    def test_rows_are_fetched_in_chunks(self):
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(export("dishes", "csv"))
+        self.assertEqual(b"".join(chunks).count(b"\n"), 6)
+        # One dish cursor read in chunks, one cooks prefetch per chunk.
+        self.assertEqual(len(queries), 4)
+
+    def test_xlsx_escapes_text(self):
+        buffer = io.BytesIO()
+        writer = XlsxWriter(buffer)
+        writer.writerow(["<b>&", "bell\x07", None, 1.5])
+        writer.close()
+        self.assertEqual(read_xlsx(buffer.getvalue()), [["<b>&", "bell", "", "1.5"]])
+
+    def test_view_streams_with_permission(self):
+        url = reverse("kitchen_core:export", args=["dishes", "csv"])
+        self.client.force_login(self.cook)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.cook.user_permissions.add(Permission.objects.get(codename="view_dish"))
+        response = self.client.get(url)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="dishes.csv"')
+        self.assertIn(b"Borscht 4", b"".join(response.streaming_content))
+        url = reverse("kitchen_core:export", args=["dishes", "pdf"])
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    @mock.patch("kitchen_core.streaming.CHUNKS_PER_CALL", 2)
+    async def test_view_is_not_buffered_under_asgi(self):
+        pulled = []
+
+        def rows(name, format):
+            for i in range(1000):
+                pulled.append(i)
+                yield b"row\n"
+
+        await self.async_client.aforce_login(await get_user_model().objects.acreate(is_superuser=True))
+        with mock.patch("kitchen_core.views.export", rows):
+            response = await self.async_client.get(reverse("kitchen_core:export", args=["dishes", "csv"]))
+            self.assertTrue(response.is_async)
+            chunks = aiter(response.streaming_content)
+            self.assertEqual(await anext(chunks), b"row\n")
+            self.assertEqual(len(pulled), 2)
+            self.assertEqual(len([chunk async for chunk in chunks]), 999)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command("export", "dishes", stdout=out)
+        self.assertIn("Borscht 3,Soup,9.50,", out.getvalue())
@@ -0,0 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core.models import DishType, Dish
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    CACHE_SHARED=True,
+)
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+            first_name="Vanessa",
+            last_name="Maev",
+        )
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        self.dish_type = DishType.objects.create(name="Main Course")
+        self.dish = Dish.objects.create(
+            name="Varenyky",
+            description="Dumplings",
+            price="12.50",
+            dish_type=self.dish_type,
+        )
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        return response, len(queries)
+
+    def test_cached_dish_rows_skip_the_list_query(self):
+        url = reverse("kitchen_core:dish-list")
+        _, first = self.get(url)
+        response, second = self.get(url)
+        self.assertLess(second, first)
+        self.assertContains(response, "Varenyky")
+
+    def test_assignment_invalidates_dish_rows(self):
+        url = reverse("kitchen_core:dish-list")
+        self.assertContains(self.get(url)[0], "No cooks")
+        self.dish.cooks.add(self.user)
+        self.assertContains(self.get(url)[0], "Vanessa Maev")
+
+    def test_edit_invalidates_cook_detail(self):
+        url = reverse("kitchen_core:cook-detail", args=[self.user.pk])
+        self.dish.cooks.add(self.user)
+        self.assertContains(self.get(url)[0], "Main Course")
+        self.dish_type.name = "Starters"
+        self.dish_type.save()
+        response = self.get(url)[0]
+        self.assertContains(response, "Starters")
+        self.assertNotContains(response, "Main Course")
+
+    def test_delete_invalidates_dish_type_detail(self):
+        url = reverse("kitchen_core:dish-type-detail", args=[self.dish_type.pk])
+        self.assertContains(self.get(url)[0], "Varenyky")
+        self.dish.delete()
+        self.assertContains(self.get(url)[0], "No dishes available for this type.")
+
+    @override_settings(CACHE_SHARED=False)
+    def test_not_cached_without_a_shared_cache(self):
+        url = reverse("kitchen_core:dish-list")
+        self.assertContains(self.get(url)[0], "Varenyky")
+        # Like a change made through another worker: no bump reaches this
+        # process's cache.
+        Dish.objects.filter(pk=self.dish.pk).update(name="Pelmeni")
+        self.assertContains(self.get(url)[0], "Pelmeni")
+
+    def test_search_is_part_of_the_key(self):
+        Dish.objects.create(
+            name="Borscht",
+            description="Soup",
+            price="8.00",
+            dish_type=self.dish_type,
+        )
+        url = reverse("kitchen_core:dish-list")
+        self.get(url)
+        response = self.client.get(url, {"name": "Borscht"})
+        self.assertNotContains(response, "Varenyky")
@@ -0,0 +1,158 @@
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core import counters
+from kitchen_core.exports import export
+from kitchen_core.imports import CookImporter, DishImporter, read_csv, read_ndjson
+from kitchen_core.models import DishType, Dish, Cook
+
+CSV = """id,name,dish_type,price,cooks
+,Borscht,Soup,9.5,"chef, sous"
+,Olivier,Salad,7,
+,Broken,Soup,abc,
+,Ghost,Soup,1,nobody
+"""
+
+
+class DishImportTests(TestCase):
+    def setUp(self):
+        self.chef = get_user_model().objects.create_user(username="chef")
+        self.sous = get_user_model().objects.create_user(username="sous")
+        self.soup = DishType.objects.create(name="Soup")
+
+    def run_csv(self, text, **kwargs):
+        return DishImporter(**kwargs).run(read_csv(io.StringIO(text)))
+
+    def test_creates_dishes_types_and_links(self):
+        report = self.run_csv(CSV, batch_size=2)
+        self.assertEqual((report.rows, report.created, report.updated), (4, 2, 0))
+        self.assertEqual(
+            [(error["line"], error["error"]) for error in report.as_dict()["errors"]],
+            [(4, "price must be a number"), (5, "Unknown cook(s): nobody")],
+        )
+        borscht = Dish.objects.get(name="Borscht")
+        self.assertEqual(borscht.dish_type, self.soup)
+        self.assertEqual(str(borscht.price), "9.50")
+        self.assertQuerySetEqual(borscht.cooks.order_by("username"), [self.chef, self.sous])
+        self.assertEqual(DishType.objects.get(name="Salad").dishes.get().name, "Olivier")
+
+    def test_upserts_by_id_and_replaces_cooks(self):
+        self.run_csv(CSV)
+        borscht = Dish.objects.get(name="Borscht")
+        report = self.run_csv(
+            f"id,name,dish_type,price,cooks\n{borscht.pk},Red borscht,Soup,10,sous\n"
+            f"{borscht.pk},Green borscht,Soup,11,chef\n"
+        )
+        self.assertEqual((report.created, report.updated), (0, 1))
+        borscht.refresh_from_db()
+        self.assertEqual((borscht.name, str(borscht.price)), ("Green borscht", "11.00"))
+        self.assertEqual(list(borscht.cooks.all()), [self.chef])
+
+    def test_new_rows_do_not_replace_an_id_equal_to_their_position(self):
+        old = Dish.objects.create(pk=1, name="Old", description="", price=1, dish_type=self.soup)
+        report = self.run_csv("id,name,dish_type,price\n1,Renamed,Soup,9\n,Brand new,Soup,8\n")
+        self.assertEqual((report.created, report.updated, report.errors), (1, 1, []))
+        old.refresh_from_db()
+        self.assertEqual(old.name, "Renamed")
+        self.assertTrue(Dish.objects.filter(name="Brand new").exists())
+
+    def test_missing_cooks_column_keeps_assignments(self):
+        self.run_csv(CSV)
+        borscht = Dish.objects.get(name="Borscht")
+        self.run_csv(f"id,name,dish_type,price\n{borscht.pk},Borscht,Soup,9\n")
+        self.assertEqual(borscht.cooks.count(), 2)
+
+    def test_round_trips_the_export(self):
+        self.run_csv(CSV)
+        exported = b"".join(export("dishes", "csv")).decode()
+        report = self.run_csv(exported)
+        self.assertEqual((report.created, report.updated, report.errors), (0, 2, []))
+
+    def test_dry_run_rolls_back(self):
+        report = self.run_csv(CSV, dry_run=True)
+        self.assertEqual(report.created, 2)
+        self.assertFalse(Dish.objects.exists())
+        self.assertFalse(DishType.objects.filter(name="Salad").exists())
+
+    @override_settings(CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    })
+    def test_resets_row_counters(self):
+        cache.clear()
+        self.assertEqual(counters.get_count(Dish), 0)
+        self.run_csv(CSV)
+        self.assertEqual(counters.get_count(Dish), 2)
+
+    def test_ndjson(self):
+        lines = [
+            json.dumps({"name": "Borscht", "dish_type": "Soup", "price": 9, "cooks": ["chef"]}),
+            "",
+            "[1, 2]",
+        ]
+        report = DishImporter().run(read_ndjson(lines))
+        self.assertEqual(report.created, 1)
+        self.assertEqual(report.errors, [(3, "Not a JSON object")])
+        self.assertEqual(list(Dish.objects.get().cooks.all()), [self.chef])
+
+    def test_new_dishes_get_fresh_ids_after_explicit_ones(self):
+        self.run_csv("id,name,dish_type,price\n500,Borscht,Soup,9\n")
+        self.assertGreater(Dish.objects.create(name="New", description="", price=1, dish_type=self.soup).pk, 500)
+
+
+class CookImportTests(TestCase):
+    def test_upserts_by_username(self):
+        get_user_model().objects.create_user(username="chef", password="x", first_name="Old")
+        report = CookImporter().run(read_csv(io.StringIO(
+            "username,first_name,last_name,years_of_experience\n"
+            "chef,Ivan,Franko,12\nsous,Lesia,,x\nsous,Lesia,Ukrainka,3\n"
+        )))
+        self.assertEqual((report.created, report.updated), (1, 1))
+        self.assertEqual(report.errors, [(3, "years_of_experience must be an integer")])
+        chef = Cook.objects.get(username="chef")
+        self.assertEqual((chef.first_name, chef.years_of_experience), ("Ivan", 12))
+        self.assertTrue(chef.check_password("x"))
+        self.assertFalse(Cook.objects.get(username="sous").has_usable_password())
+
+
+class ImportEndpointTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="chef")
+        self.client.force_login(self.user)
+        self.url = reverse("kitchen_core:import", args=["dishes", "csv"])
+
+    def test_requires_permissions(self):
+        response = self.client.post(self.url, CSV, content_type="text/csv")
+        self.assertEqual(response.status_code, 403)
+
+    def test_imports_body(self):
+        self.user.user_permissions.add(*Permission.objects.filter(codename__in=["add_dish", "change_dish"]))
+        body = "﻿name,dish_type,price\nBorscht,Soup,9\n".encode()
+        response = self.client.post(self.url + "?dry_run=1", body, content_type="text/csv")
+        self.assertEqual(response.json()["created"], 1)
+        self.assertFalse(Dish.objects.exists())
+        response = self.client.post(self.url, body, content_type="text/csv")
+        self.assertEqual(response.json()["created"], 1)
+        self.assertTrue(Dish.objects.filter(name="Borscht").exists())
+        response = self.client.post(self.url + "?batch_size=0", body, content_type="text/csv")
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkImportCommandTests(TestCase):
+    def test_imports_file(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False) as f:
+            f.write(json.dumps({"username": "chef"}) + "\n")
+        self.addCleanup(os.remove, f.name)
+        out = io.StringIO()
+        call_command("bulk_import", "cooks", f.name, stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["created"], 1)
+        self.assertIsNotNone(report["rows_per_second"])
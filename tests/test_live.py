@@ -0,0 +1,145 @@
+import asyncio
+import json
+import threading
+from contextlib import aclosing
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core import async_views
+from kitchen_core.assignments import apply_assignments
+from kitchen_core.live import RESYNC, Broker, LocalBroker, format_event, get_broker
+from kitchen_core.models import Cook, Dish, DishType
+
+
+class RecordingBroker(Broker):
+    published = []
+
+    def publish(self, event):
+        self.published.append(event)
+
+
+class BrokerTests(SimpleTestCase):
+    async def test_delivers_events_published_from_other_threads(self):
+        broker = LocalBroker()
+        async with broker.subscribe() as subscription:
+            thread = threading.Thread(target=broker.publish, args=({"type": "dish", "id": 1},))
+            thread.start()
+            thread.join()
+            event = await asyncio.wait_for(subscription.get(), 1)
+        self.assertEqual(event, {"type": "dish", "id": 1})
+        self.assertEqual(broker.subscribers, set())
+
+    async def test_lagging_subscriber_is_told_to_resync(self):
+        broker = LocalBroker()
+        broker.queue_size = 2
+        async with broker.subscribe() as subscription:
+            for pk in range(4):
+                broker.publish({"type": "dish", "id": pk})
+            await asyncio.sleep(0)
+            events = [await subscription.get(), await subscription.get()]
+        self.assertEqual(events, [{"type": "dish", "id": 0}, RESYNC])
+
+    def test_format_event(self):
+        self.assertEqual(
+            format_event({"type": "dish", "id": 1}),
+            'event: dish\ndata: {"type":"dish","id":1}\n\n',
+        )
+
+    @override_settings(LIVE_BROKER="tests.test_live.RecordingBroker")
+    def test_broker_from_dotted_path(self):
+        self.assertIsInstance(get_broker(), RecordingBroker)
+
+
+@override_settings(LIVE_BROKER="tests.test_live.RecordingBroker")
+class PublishTests(TestCase):
+    def setUp(self):
+        self.cook = Cook.objects.create_user(username="chef", first_name="Vanessa", last_name="Maev")
+        self.dish_type = DishType.objects.create(name="Soup")
+        self.dish = Dish.objects.create(name="Borscht", price="9.00", dish_type=self.dish_type)
+        RecordingBroker.published = []
+
+    def published(self, change):
+        RecordingBroker.published = []
+        with self.captureOnCommitCallbacks(execute=True):
+            change()
+        return RecordingBroker.published
+
+    def test_dish_saved(self):
+        self.dish.name = "Okroshka"
+        self.assertEqual(self.published(self.dish.save), [{
+            "type": "dish",
+            "id": self.dish.pk,
+            "name": "Okroshka",
+            "price": "9.00",
+            "dish_type": {"id": self.dish_type.pk, "name": "Soup"},
+        }])
+
+    def test_dish_type_deleted(self):
+        dish_pk, dish_type_pk = self.dish.pk, self.dish_type.pk
+        self.assertEqual(self.published(self.dish_type.delete), [
+            {"type": "dish", "id": dish_pk, "deleted": True},
+            {"type": "dish_type", "id": dish_type_pk, "deleted": True},
+        ])
+
+    def test_assignments(self):
+        added = {
+            "type": "assignments",
+            "added": [[self.cook.pk, self.dish.pk]],
+            "removed": [],
+            "cooks": {self.cook.pk: "Vanessa Maev"},
+            "dishes": {self.dish.pk: {"name": "Borscht", "dish_type": {"id": self.dish_type.pk, "name": "Soup"}}},
+        }
+        removed = {
+            "type": "assignments",
+            "added": [],
+            "removed": [[self.cook.pk, self.dish.pk]],
+            "cooks": {},
+            "dishes": {},
+        }
+        self.assertEqual(self.published(lambda: self.dish.cooks.add(self.cook)), [added])
+        self.assertEqual(self.published(lambda: self.cook.dishes.clear()), [removed])
+        self.assertEqual(self.published(lambda: apply_assignments([(self.cook.pk, self.dish.pk, "add")])), [added])
+        self.assertEqual(self.published(self.cook.delete), [removed])
+
+    def test_nothing_published_on_rollback(self):
+        def change():
+            with transaction.atomic():
+                self.dish.cooks.add(self.cook)
+                transaction.set_rollback(True)
+
+        self.assertEqual(self.published(change), [])
+
+
+class LiveViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="chef", password="x")
+
+    def test_requires_login(self):
+        self.assertEqual(self.client.get(reverse("kitchen_core:live")).status_code, 403)
+
+    def test_no_stream_under_wsgi(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(reverse("kitchen_core:live")).status_code, 204)
+        # live.js shows the page isn't updating instead.
+        response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "data-live-status hidden")
+        self.assertNotContains(response, "data-changes-url")
+
+    async def test_streams_published_events(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("kitchen_core:live"))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        # Read the events from the generator itself, so closing it also
+        # ends the subscription; closing the response's wrapper leaves it to
+        # the garbage collector.
+        await response.streaming_content.aclose()
+        async with aclosing(async_views._live_events()) as stream:
+            self.assertEqual(await anext(stream), ": subscribed\n\n")
+            get_broker().publish({"type": "dish", "id": 1, "deleted": True})
+            message = await asyncio.wait_for(anext(stream), 1)
+        self.assertEqual(get_broker().subscribers, set())
+        self.assertTrue(message.startswith("event: dish\n"))
+        self.assertEqual(json.loads(message.split("data: ")[1]), {"type": "dish", "id": 1, "deleted": True})
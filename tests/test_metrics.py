@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core.metrics import registry
+from kitchen_core.models import DishType
+
+
+@override_settings(
+    QUERY_METRICS=True,
+    METRICS_TOKEN="",
+    MIDDLEWARE=["kitchen_core.middleware.QueryMetricsMiddleware"] + settings.MIDDLEWARE,
+)
+class QueryMetricsTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+        )
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        DishType.objects.create(name="Soups")
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("kitchen_core:dish-type-list"))
+        header = response["Server-Timing"]
+        self.assertRegex(header, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(header, r"render;dur=[\d.]+")
+        self.assertRegex(header, r"total;dur=[\d.]+")
+
+    def test_metrics_are_recorded_per_view(self):
+        self.client.get(reverse("kitchen_core:dish-type-list"))
+        self.client.get(reverse("kitchen_core:dish-type-list"))
+        stats = registry.snapshot()["kitchen_core:dish-type-list"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertGreater(stats["queries"], 0)
+        self.assertGreater(stats["render_seconds"], 0)
+
+    def test_metrics_endpoint_requires_staff(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+
+    def test_metrics_endpoint_prometheus_format(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.get(reverse("kitchen_core:dish-type-list"))
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn("# TYPE kitchen_requests_total counter", body)
+        self.assertIn('kitchen_requests_total{view="kitchen_core:dish-type-list"} 1', body)
+        self.assertIn(
+            'kitchen_request_duration_seconds_count{view="kitchen_core:dish-type-list"} 1',
+            body,
+        )
+        self.assertRegex(body, r'kitchen_db_connects_total\{database="default"\} \d+')
+
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_metrics_endpoint_token(self):
+        self.client.logout()
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret")
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,88 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core.models import DishType, Dish
+from kitchen_core.pagination import CursorPaginator, InvalidCursor
+
+
+class CursorPaginatorTests(TestCase):
+    def setUp(self):
+        self.dish_type = DishType.objects.create(name="Soups")
+        for name in ["Borscht", "Okroshka", "Borscht", "Solyanka", "Ukha", "Kharcho", "Rassolnik"]:
+            Dish.objects.create(
+                name=name,
+                description="Soup",
+                price="5.00",
+                dish_type=self.dish_type,
+            )
+        self.expected = list(Dish.objects.order_by("name", "pk"))
+
+    def walk_forward(self, paginator):
+        seen, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            seen.extend(page)
+            if not page.has_next():
+                return seen, page
+            cursor = page.next_cursor
+
+    def test_forward_walk_covers_every_row_once(self):
+        seen, _ = self.walk_forward(CursorPaginator(Dish.objects.all(), 3))
+        self.assertEqual(seen, self.expected)
+
+    def test_backward_walk_returns_previous_pages(self):
+        paginator = CursorPaginator(Dish.objects.all(), 3)
+        _, last_page = self.walk_forward(paginator)
+        seen, page = list(last_page), last_page
+        while page.has_previous():
+            page = paginator.page(page.previous_cursor)
+            seen = list(page) + seen
+        self.assertEqual(seen, self.expected)
+
+    def test_nullable_ordering_field(self):
+        for experience in [None, 3, None, 1, 3]:
+            get_user_model().objects.create_user(
+                username=f"cook{get_user_model().objects.count()}",
+                years_of_experience=experience,
+            )
+        queryset = get_user_model().objects.all()
+        seen, _ = self.walk_forward(CursorPaginator(queryset, 2))
+        self.assertEqual([cook.years_of_experience for cook in seen], [None, None, 1, 3, 3])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            CursorPaginator(Dish.objects.all(), 3).page("not-a-cursor")
+
+
+@override_settings(CURSOR_PAGINATION=True)
+class CursorPaginationViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+        )
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        for i in range(7):
+            DishType.objects.create(name=f"Type {i}")
+
+    def test_next_cursor_link(self):
+        response = self.client.get(reverse("kitchen_core:dish-type-list"))
+        self.assertEqual(len(response.context["dish_type_list"]), 5)
+        next_cursor = response.context["page_obj"].next_cursor
+        self.assertContains(response, f"?cursor={next_cursor}")
+
+        response = self.client.get(reverse("kitchen_core:dish-type-list"), {"cursor": next_cursor})
+        self.assertEqual(
+            [dish_type.name for dish_type in response.context["dish_type_list"]],
+            ["Type 5", "Type 6"],
+        )
+        self.assertFalse(response.context["page_obj"].has_next())
+
+    def test_cursor_keeps_search_query(self):
+        response = self.client.get(reverse("kitchen_core:dish-type-list"), {"name": "Type"})
+        self.assertContains(response, "?name=Type&amp;cursor=")
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse("kitchen_core:dish-type-list"), {"cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
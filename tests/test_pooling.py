@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import SimpleTestCase, TestCase
+
+from kitchen_core import pooling
+
+
+class ModeTests(SimpleTestCase):
+    def test_mode(self):
+        class Connection:
+            def __init__(self, **settings_dict):
+                self.settings_dict = {"OPTIONS": {}, "CONN_MAX_AGE": 0, **settings_dict}
+
+        self.assertEqual(pooling.mode(Connection()), "none")
+        self.assertEqual(pooling.mode(Connection(CONN_MAX_AGE=60)), "persistent")
+        self.assertEqual(pooling.mode(Connection(CONN_MAX_AGE=None)), "persistent")
+        self.assertEqual(pooling.mode(Connection(OPTIONS={"pool": {"max_size": 4}})), "pool")
+
+
+class StatsTests(TestCase):
+    def test_counts_connects(self):
+        before = pooling.stats()["default"]
+        connection_created.send(sender=type(connection), connection=connection)
+        after = pooling.stats()["default"]
+        self.assertEqual(after, {"mode": "none", "connects": before["connects"] + 1})
+        self.assertIn(
+            f'kitchen_db_connects_total{{database="default"}} {after["connects"]}',
+            pooling.render_prometheus(),
+        )
+
+    def test_throughput_pooling_needs_postgresql(self):
+        with self.assertRaisesMessage(CommandError, "--pooling needs PostgreSQL."):
+            call_command("throughput", pooling=["pool"], stdout=StringIO())
@@ -0,0 +1,125 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core.models import DishType, Dish
+
+
+class DetailQueryCountTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="chef",
+            password="qaz2wsx3edc",
+        )
+        self.client.login(username="chef", password="qaz2wsx3edc")
+        self.cook = get_user_model().objects.create_user(username="line_cook")
+
+    def add_dishes(self, count):
+        for i in range(count):
+            dish = Dish.objects.create(
+                name=f"Dish {Dish.objects.count()}",
+                description="Dish",
+                price="10.00",
+                dish_type=DishType.objects.create(name=f"Type {i}"),
+            )
+            dish.cooks.add(self.cook)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_cook_detail_query_count_is_constant(self):
+        url = reverse("kitchen_core:cook-detail", args=[self.cook.pk])
+        self.add_dishes(1)
+        baseline = self.count_queries(url)
+        self.add_dishes(10)
+        self.assertEqual(self.count_queries(url), baseline)
+
+    def test_dish_detail_assigned_flag(self):
+        self.add_dishes(1)
+        dish = Dish.objects.get()
+        url = reverse("kitchen_core:dish-detail", args=[dish.pk])
+
+        response = self.client.get(url)
+        self.assertFalse(response.context["dish"].is_assigned)
+
+        for i in range(10):
+            Dish.objects.create(
+                name=f"Other {i}",
+                description="Dish",
+                price="10.00",
+                dish_type=dish.dish_type,
+            ).cooks.add(self.user)
+        baseline = self.count_queries(url)
+        dish.cooks.add(self.user)
+        response = self.client.get(url)
+        self.assertTrue(response.context["dish"].is_assigned)
+        self.assertEqual(self.count_queries(url), baseline)
+
+
+class AdminChangelistTests(TestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_superuser(
+            username="admin", password="x", email="admin@example.com"
+        )
+        self.client.force_login(self.admin)
+        self.dish_type = DishType.objects.create(name="Soup")
+
+    def add_dishes(self, count):
+        for i in range(count):
+            dish = Dish.objects.create(
+                name=f"Borscht {Dish.objects.count()}",
+                description="Dish",
+                price="10.00",
+                dish_type=DishType.objects.create(name=f"Type {i}"),
+            )
+            dish.cooks.add(get_user_model().objects.create_user(username=f"cook{dish.pk}"))
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_query_counts_are_constant(self):
+        for name in ("admin:kitchen_core_dish_changelist", "admin:kitchen_core_cook_changelist"):
+            with self.subTest(name):
+                url = reverse(name)
+                self.add_dishes(1)
+                baseline = self.count_queries(url)
+                self.add_dishes(10)
+                self.assertEqual(self.count_queries(url), baseline)
+
+    def test_cook_changelist_shows_dish_count(self):
+        self.add_dishes(2)
+        cook = get_user_model().objects.get(username__startswith="cook", dishes__name="Borscht 0")
+        Dish.objects.get(name="Borscht 1").cooks.add(cook)
+        response = self.client.get(reverse("admin:kitchen_core_cook_changelist"))
+        counts = {c.username: c.dish_count for c in response.context["cl"].result_list}
+        self.assertEqual(counts[cook.username], 2)
+        self.assertEqual(counts["admin"], 0)
+
+    def test_changelist_search(self):
+        self.add_dishes(3)
+        response = self.client.get(reverse("admin:kitchen_core_dish_changelist"), {"q": "Borscht 1"})
+        self.assertEqual([d.name for d in response.context["cl"].result_list], ["Borscht 1"])
+        response = self.client.get(reverse("admin:kitchen_core_cook_changelist"), {"q": "admin"})
+        self.assertEqual([c.username for c in response.context["cl"].result_list], ["admin"])
+
+    def test_cook_search_keeps_filters_and_matches_usernames_and_emails(self):
+        get_user_model().objects.create_user(username="bob", email="bob@kitchen.test", first_name="Robert")
+        get_user_model().objects.create_superuser(username="bobby", password="x", email="b@example.com")
+        url = reverse("admin:kitchen_core_cook_changelist")
+
+        def usernames(**params):
+            response = self.client.get(url, params)
+            return sorted(c.username for c in response.context["cl"].result_list)
+
+        self.assertEqual(usernames(q="bob"), ["bob", "bobby"])
+        self.assertEqual(usernames(q="bob", is_staff__exact=1), ["bobby"])
+        self.assertEqual(usernames(q="kitchen.test"), ["bob"])
+        self.assertEqual(usernames(q="Robert"), ["bob"])
@@ -0,0 +1,102 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from kitchen_core import fragments
+from kitchen_core.models import Dish, DishType
+from kitchen_core.replicas import (
+    STICKY_COOKIE, ReplicaRouter, choose_replica, note_primary_position, read_only, routing,
+)
+
+
+def view(request):
+    pass
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRoutingTests(TestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        # The same cook on both databases; the dishes differ, so each page
+        # shows which database it read from.
+        self.user = get_user_model().objects.create_user(username="chef", password="x")
+        self.user.save(using="replica", force_insert=True)
+        for using in ("default", "replica"):
+            dish_type = DishType.objects.using(using).create(name="Soup")
+            Dish.objects.using(using).create(name=f"Borscht from {using}", price="9.00", dish_type=dish_type)
+        self.client.force_login(self.user)
+
+    def test_read_only_pages_read_from_the_replica(self):
+        response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "Borscht from replica")
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    async def test_async_requests(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "Borscht from replica")
+
+    def test_reads_stay_on_the_primary_after_a_write(self):
+        dish = Dish.objects.get()
+        response = self.client.post(reverse("kitchen_core:toggle-assign-dish", args=[dish.pk]))
+        self.assertEqual(response.cookies[STICKY_COOKIE]["max-age"], 10)
+        self.assertEqual(list(dish.cooks.values_list("username", flat=True)), ["chef"])
+        self.assertFalse(Dish.objects.using("replica").get().cooks.exists())
+
+        response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "Borscht from default")
+
+    @override_settings(CACHE_SHARED=True)
+    def test_cached_pages_read_from_the_primary_until_the_replica_caught_up(self):
+        # SQLite replicas can't report how far they are.
+        response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "Borscht from default")
+        with mock.patch("kitchen_core.replicas.caught_up", return_value=True) as caught_up:
+            response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "Borscht from replica")
+        caught_up.assert_called_once_with("replica")
+
+    def test_primary_position_is_recorded_once_per_write(self):
+        with mock.patch("kitchen_core.replicas._tracks_position", return_value=True):
+            with self.captureOnCommitCallbacks() as callbacks:
+                fragments.bump(Dish)
+                fragments.bump(DishType)
+        self.assertEqual(callbacks, [note_primary_position])
+
+    def test_other_pages_read_from_the_primary(self):
+        dish = Dish.objects.get()
+        response = self.client.get(reverse("kitchen_core:dish-update", args=[dish.pk]))
+        self.assertContains(response, "Borscht from default")
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        response = self.client.get(reverse("kitchen_core:dish-list"))
+        self.assertContains(response, "Borscht from default")
+
+
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_choose_replica(self):
+        marked = read_only(view)
+        self.assertEqual(choose_replica(self.factory.get("/"), marked), "replica")
+        self.assertIsNone(choose_replica(self.factory.post("/"), marked))
+        self.assertIsNone(choose_replica(self.factory.get("/"), lambda request: None))
+        sticky = self.factory.get("/")
+        sticky.COOKIES[STICKY_COOKIE] = "1"
+        self.assertIsNone(choose_replica(sticky, marked))
+
+    def test_routes(self):
+        self.assertIsNone(self.router.db_for_read(Dish))
+        with routing() as state:
+            state.replica = "replica"
+            self.assertEqual(self.router.db_for_read(Dish), "replica")
+            self.assertIsNone(self.router.db_for_read(Session))
+            self.assertEqual(self.router.db_for_write(Dish), "default")
@@ -0,0 +1,125 @@
+import json
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from kitchen_core.models import DishType, Dish, Cook
+from kitchen_core.search import search, install_sqlite_fts
+
+
+class SearchBackendTests(TestCase):
+    def setUp(self):
+        self.dish_type = DishType.objects.create(name="Main Course")
+        for name in ["Chicken Kyiv", "Kyiv Cake", "Chicken Soup", "Varenyky"]:
+            Dish.objects.create(
+                name=name,
+                description="Dish",
+                price="10.00",
+                dish_type=self.dish_type,
+            )
+
+    def names(self, queryset):
+        return sorted(dish.name for dish in queryset)
+
+    def test_substring_match_is_case_insensitive(self):
+        self.assertEqual(
+            self.names(search(Dish.objects.all(), "KYIV")),
+            ["Chicken Kyiv", "Kyiv Cake"],
+        )
+        self.assertEqual(self.names(search(Dish.objects.all(), "renyk")), ["Varenyky"])
+
+    def test_short_query_falls_back_to_icontains(self):
+        self.assertEqual(self.names(search(Dish.objects.all(), "ky")), [
+            "Chicken Kyiv", "Kyiv Cake", "Varenyky",
+        ])
+
+    def test_empty_query_returns_everything(self):
+        self.assertEqual(search(Dish.objects.all(), "  ").count(), 4)
+
+    def test_index_follows_updates_and_deletes(self):
+        dish = Dish.objects.get(name="Varenyky")
+        dish.name = "Pelmeni"
+        dish.save()
+        self.assertEqual(self.names(search(Dish.objects.all(), "Pelmeni")), ["Pelmeni"])
+        self.assertFalse(search(Dish.objects.all(), "Varenyky").exists())
+        dish.delete()
+        self.assertFalse(search(Dish.objects.all(), "Pelmeni").exists())
+
+    def test_cook_search_matches_either_name(self):
+        get_user_model().objects.create_user(username="c1", first_name="John", last_name="Doe")
+        get_user_model().objects.create_user(username="c2", first_name="Jane", last_name="Johnson")
+        self.assertEqual(
+            sorted(cook.username for cook in search(Cook.objects.all(), "john")),
+            ["c1", "c2"],
+        )
+
+    def test_repair_recreates_dropped_triggers(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("FTS5 triggers are SQLite only")
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER kitchen_core_dish_fts_ai")
+        install_sqlite_fts(connection)
+        Dish.objects.create(
+            name="Deruny",
+            description="Potato pancakes",
+            price="6.00",
+            dish_type=self.dish_type,
+        )
+        self.assertEqual(self.names(search(Dish.objects.all(), "Deruny")), ["Deruny"])
+
+    def test_only_searched_columns_update_the_index(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("FTS5 triggers are SQLite only")
+        cook = get_user_model().objects.create_user(username="c1", first_name="John")
+
+        def rows_written(change):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT total_changes()")
+                before = cursor.fetchone()[0]
+                change()
+                cursor.execute("SELECT total_changes()")
+                return cursor.fetchone()[0] - before
+
+        # Just the cook row; a searched column also rewrites the index.
+        self.assertEqual(rows_written(lambda: Cook.objects.filter(pk=cook.pk).update(visit_count=3)), 1)
+        self.assertGreater(rows_written(lambda: Cook.objects.filter(pk=cook.pk).update(first_name="Jack")), 1)
+        self.assertEqual([c.username for c in search(Cook.objects.all(), "jack")], ["c1"])
+
+    def test_index_is_not_dumped(self):
+        out = StringIO()
+        call_command("dumpdata", "kitchen_core", stdout=out)
+        self.assertEqual(
+            {row["model"] for row in json.loads(out.getvalue())},
+            {"kitchen_core.dishtype", "kitchen_core.dish", "kitchen_core.changelogentry"},
+        )
+
+    def test_repair_replaces_the_old_update_trigger(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("FTS5 triggers are SQLite only")
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER kitchen_core_dish_fts_au")
+            cursor.execute(
+                "CREATE TRIGGER kitchen_core_dish_fts_au AFTER UPDATE ON kitchen_core_dish BEGIN SELECT 1; END"
+            )
+        install_sqlite_fts(connection)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'kitchen_core_dish_fts_au'")
+            self.assertIn("AFTER UPDATE OF name ON kitchen_core_dish", cursor.fetchone()[0])
+
+
+class SearchViewTests(TestCase):
+    def setUp(self):
+        get_user_model().objects.create_user(username="chef", password="qaz2wsx3edc")
+        self.client.login(username="chef", password="qaz2wsx3edc")
+
+    def test_dish_type_search_ranks_matches(self):
+        DishType.objects.create(name="A soup of the day with fresh bread")
+        DishType.objects.create(name="Soup")
+        DishType.objects.create(name="Desserts")
+        response = self.client.get(reverse("kitchen_core:dish-type-list"), {"name": "soup"})
+        names = [dish_type.name for dish_type in response.context["dish_type_list"]]
+        self.assertEqual(names, ["Soup", "A soup of the day with fresh bread"])
@@ -0,0 +1,170 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core.assignments import apply_assignments, set_assignment
+from kitchen_core.models import DishType, Dish, Cook
+
+
+class StatsTests(TestCase):
+    def setUp(self):
+        self.soup = DishType.objects.create(name="Soup")
+        self.salad = DishType.objects.create(name="Salad")
+        self.borscht = self.dish("Borscht", "9.50")
+        self.ukha = self.dish("Ukha", "12.00")
+        self.ivan = get_user_model().objects.create_user(username="ivan")
+        self.olga = get_user_model().objects.create_user(username="olga")
+
+    def dish(self, name, price, dish_type=None):
+        return Dish.objects.create(
+            name=name, description="", price=price, dish_type=dish_type or self.soup
+        )
+
+    def assertStats(self, dish_type, **expected):
+        dish_type.refresh_from_db()
+        for field, value in expected.items():
+            self.assertEqual(getattr(dish_type, field), value, field)
+
+    def test_dish_type_prices(self):
+        self.assertStats(
+            self.soup,
+            dish_count=2,
+            price_min=Decimal("9.50"),
+            price_avg=Decimal("10.75"),
+            price_max=Decimal("12.00"),
+        )
+        self.assertStats(self.salad, dish_count=0, price_min=None, price_avg=None)
+
+    def test_dish_moved_to_another_type(self):
+        self.ukha.dish_type = self.salad
+        self.ukha.price = "15.00"
+        self.ukha.save()
+        self.assertStats(self.soup, dish_count=1, price_max=Decimal("9.50"))
+        self.assertStats(self.salad, dish_count=1, price_avg=Decimal("15.00"))
+
+    def test_price_changes_match_a_rebuild(self):
+        def stored():
+            return list(DishType.objects.values_list(
+                "dish_count", "price_min", "price_avg", "price_max", "price_sum",
+            ))
+
+        self.dish("Okroshka", "10.00")
+        self.dish("Caesar", "7.25", self.salad)
+        self.ukha.price = "11.00"
+        self.ukha.save()
+        self.borscht.price = "13.00"
+        self.borscht.save()
+        self.assertStats(self.soup, price_min=Decimal("10.00"), price_avg=Decimal("11.33"))
+        self.borscht.delete()
+        self.assertStats(self.soup, price_max=Decimal("11.00"), price_sum=Decimal("21.00"))
+        expected = stored()
+        call_command("rebuild_stats", stdout=StringIO())
+        self.assertEqual(stored(), expected)
+
+    def test_stale_instance_does_not_overwrite_stats(self):
+        stale = DishType.objects.get(pk=self.soup.pk)
+        self.dish("Okroshka", "10.00")
+        stale.name = "Soups"
+        stale.save()
+        self.assertStats(self.soup, name="Soups", dish_count=3)
+
+    def test_dish_type_cook_count_is_distinct(self):
+        self.borscht.cooks.add(self.ivan)
+        self.ukha.cooks.add(self.ivan)
+        self.assertStats(self.soup, cook_count=1)
+        self.borscht.cooks.remove(self.ivan)
+        self.assertStats(self.soup, cook_count=1)
+        apply_assignments([(self.ivan.pk, self.ukha.pk, "remove"), (self.olga.pk, self.ukha.pk, "add")])
+        self.assertStats(self.soup, cook_count=1)
+        self.ukha.delete()
+        self.assertStats(self.soup, cook_count=0)
+
+    def test_assignments_are_applied_as_deltas(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.borscht.cooks.add(self.ivan)
+        updates = [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+        self.assertTrue(updates)
+        # No UPDATE recounts the dish type's dishes or assignments.
+        for sql in updates:
+            self.assertNotIn("SELECT", sql)
+
+    def test_assignments(self):
+        self.borscht.cooks.add(self.ivan, self.olga)
+        self.ivan.dishes.add(self.ukha)
+        self.ivan.refresh_from_db()
+        self.borscht.refresh_from_db()
+        self.assertEqual(self.ivan.dish_count, 2)
+        self.assertEqual(self.borscht.cook_count, 2)
+        self.assertStats(self.soup, cook_count=2)
+
+        self.borscht.cooks.clear()
+        self.ivan.refresh_from_db()
+        self.assertEqual(self.ivan.dish_count, 1)
+        self.assertStats(self.soup, cook_count=1)
+
+    def test_set_and_bulk_assignments(self):
+        set_assignment(self.olga, self.ukha.pk, assign=True)
+        apply_assignments([(self.ivan.pk, self.ukha.pk, "add"), (self.ivan.pk, self.borscht.pk, "add")])
+        self.ukha.refresh_from_db()
+        self.ivan.refresh_from_db()
+        self.assertEqual(self.ukha.cook_count, 2)
+        self.assertEqual(self.ivan.dish_count, 2)
+
+        apply_assignments([(self.ivan.pk, self.ukha.pk, "remove")])
+        self.ukha.refresh_from_db()
+        self.assertEqual(self.ukha.cook_count, 1)
+
+    def test_deletes(self):
+        self.borscht.cooks.add(self.ivan)
+        self.ukha.cooks.add(self.ivan, self.olga)
+        self.olga.delete()
+        self.ukha.refresh_from_db()
+        self.assertEqual(self.ukha.cook_count, 1)
+
+        self.ukha.delete()
+        self.ivan.refresh_from_db()
+        self.assertEqual(self.ivan.dish_count, 1)
+        self.assertStats(self.soup, dish_count=1, cook_count=1, price_avg=Decimal("9.50"))
+
+    def test_dish_type_delete_refreshes_cooks_once(self):
+        def delete_queries(dish_type, dishes):
+            for i in range(dishes):
+                self.dish(f"Dish {i}", "5.00", dish_type).cooks.add(self.ivan, self.olga)
+            with CaptureQueriesContext(connection) as queries:
+                dish_type.delete()
+            return len(queries)
+
+        self.assertEqual(
+            delete_queries(DishType.objects.create(name="Starters"), 2),
+            delete_queries(DishType.objects.create(name="Desserts"), 10),
+        )
+        self.borscht.cooks.add(self.ivan)
+        self.soup.delete()
+        for cook, dish_count in [(self.ivan, 0), (self.olga, 0)]:
+            cook.refresh_from_db()
+            self.assertEqual(cook.dish_count, dish_count)
+
+    def test_rebuild_command(self):
+        self.borscht.cooks.add(self.ivan)
+        Dish.objects.filter(pk=self.ukha.pk).update(price="20.00")
+        DishType.objects.update(dish_count=0)
+        Cook.objects.update(dish_count=0)
+        call_command("rebuild_stats", stdout=StringIO())
+        self.ivan.refresh_from_db()
+        self.assertEqual(self.ivan.dish_count, 1)
+        self.assertStats(self.soup, dish_count=2, price_max=Decimal("20.00"))
+
+    def test_shown_in_views(self):
+        self.borscht.cooks.add(self.ivan)
+        self.client.force_login(self.ivan)
+        response = self.client.get(reverse("kitchen_core:dish-type-list"))
+        self.assertContains(response, "9.50 / 10.75 / 12.00")
+        response = self.client.get(reverse("kitchen_core:index"))
+        self.assertEqual(response.context["dishes_per_cook"], 0.5)
+        self.assertEqual(response.context["cooks_per_dish"], 0.5)
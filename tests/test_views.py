@@ -173,7 +173,7 @@ class DishTests(TestCase):
         dish.cooks.remove(self.user)
 
         # Назначение повара
-        response = self.client.get(
+        response = self.client.post(
             reverse("kitchen_core:toggle-assign-dish", args=[dish.pk])
         )
         self.assertEqual(response.status_code, 302)
@@ -181,7 +181,7 @@ class DishTests(TestCase):
         self.assertIn(self.user, dish.cooks.all())
 
         # Повторное нажатие — отказ от приготовления
-        response = self.client.get(
+        response = self.client.post(
             reverse("kitchen_core:toggle-assign-dish", args=[dish.pk])
         )
         self.assertEqual(response.status_code, 302)
@@ -0,0 +1,85 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kitchen_core.visits import VisitCounter, visits
+
+
+class VisitCounterTests(TestCase):
+    def setUp(self):
+        self.cook = get_user_model().objects.create_user(username="chef")
+        self.other = get_user_model().objects.create_user(username="sous")
+        self.counter = VisitCounter()
+
+    @override_settings(VISIT_FLUSH_SIZE=5, VISIT_FLUSH_INTERVAL=3600)
+    def test_visits_are_buffered_until_the_batch_is_full(self):
+        with self.assertNumQueries(0):
+            for expected in range(3):
+                self.assertEqual(self.counter.record(self.cook), expected)
+            self.counter.record(self.other)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.counter.record(self.cook), 3)
+        self.cook.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.cook.visit_count, self.other.visit_count), (4, 1))
+        self.assertEqual(self.counter.pending(self.cook.pk), 0)
+        self.assertEqual(self.counter.record(self.cook), 4)
+
+    @override_settings(VISIT_FLUSH_SIZE=100, VISIT_FLUSH_INTERVAL=0)
+    def test_interval_triggers_flush(self):
+        self.counter.record(self.cook)
+        self.cook.refresh_from_db()
+        self.assertEqual(self.cook.visit_count, 1)
+
+    def total_changes(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT total_changes()")
+            return cursor.fetchone()[0]
+
+    @override_settings(VISIT_FLUSH_SIZE=5, VISIT_FLUSH_INTERVAL=3600)
+    def test_flush_writes_only_visit_count(self):
+        self.counter.record(self.cook)
+        self.counter.record(self.other)
+        saved = []
+        post_save.connect(lambda **kwargs: saved.append(kwargs), weak=False, dispatch_uid="test")
+        self.addCleanup(post_save.disconnect, dispatch_uid="test")
+        before = self.total_changes()
+        with CaptureQueriesContext(connection) as queries:
+            self.counter.flush()
+        written = self.total_changes() - before
+        self.assertEqual(len(queries), 1)
+        self.assertRegex(queries[0]["sql"], r'^UPDATE "kitchen_core_cook" SET "visit_count" = [^,]*CASE')
+        self.assertEqual(saved, [])
+        # The two cook rows; the search index's update trigger doesn't fire.
+        self.assertEqual(written, 2)
+
+    def test_flush_does_not_touch_updated_at(self):
+        updated_at = self.cook.updated_at
+        self.counter.record(self.cook)
+        self.counter.flush()
+        self.cook.refresh_from_db()
+        self.assertEqual(self.cook.updated_at, updated_at)
+
+
+@override_settings(
+    VISIT_FLUSH_SIZE=100,
+    VISIT_FLUSH_INTERVAL=3600,
+    SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies",
+)
+class IndexVisitTests(TestCase):
+    def setUp(self):
+        self.addCleanup(visits.flush)
+        self.user = get_user_model().objects.create_user(username="chef", password="x")
+        self.client.force_login(self.user)
+
+    def test_index_does_not_write_to_the_database(self):
+        self.client.get(reverse("kitchen_core:index"))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("kitchen_core:index"))
+        self.assertEqual(response.context["num_visits"], 1)
+        self.assertEqual(
+            [q["sql"] for q in queries if not q["sql"].startswith("SELECT")], []
+        )